@@ -0,0 +1,108 @@
+# ---------------------------------------------------------------------------- #
+#                      Authored by Matheus Ferreira Silva                      #
+#                           github.com/MatheusFS-dev                           #
+# ---------------------------------------------------------------------------- #
+
+"""
+Utilities for email notifications, plotting, GPU inspection and metrics storage.
+
+Submodules and their functions are loaded lazily on first attribute access, so that
+`from src.utils import send_email` does not pay for importing TensorFlow, matplotlib
+or seaborn. Heavy third-party libraries are also imported inside the functions that
+need them rather than at module import time.
+"""
+
+import importlib
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "email_api": [
+        "RateLimitExceeded",
+        "RateLimiter",
+        "SMTPConnectionPool",
+        "get_smtp_pool",
+        "close_smtp_pools",
+        "load_json_cached",
+        "clear_config_cache",
+        "get_credentials",
+        "get_recipient_emails",
+        "NotificationTemplate",
+        "get_template",
+        "load_template",
+        "send_email",
+        "EmailDispatcher",
+        "summary_entry",
+        "render_summary",
+        "EmailDigest",
+        "TaskResult",
+        "measure_call",
+        "template_values",
+        "failure_body",
+        "Heartbeat",
+        "run_with_notification",
+        "run_many_with_notification",
+        "AsyncSMTPConnection",
+        "AsyncSMTPConnectionPool",
+        "get_async_smtp_pool",
+        "asend_emails",
+        "asend_email",
+        "arun_with_notification",
+    ],
+    "gpu_info": [
+        "get_gpu_info",
+        "enable_memory_growth",
+        "get_gpu_inventory",
+        "GPUInventory",
+        "GPUDevice",
+        "ResourceMonitor",
+        "DeviceLoad",
+        "DevicePlacement",
+        "probe_device_load",
+        "select_devices",
+        "assign_devices",
+        "configure_devices",
+        "place_worker",
+        "EnvironmentReport",
+        "get_environment_report",
+        "environment_fingerprint",
+    ],
+    "plot_api": [
+        "plot_scientific",
+        "plot_histogram",
+        "plot_boxplot_scientific",
+        "set_headless",
+        "render_batch",
+        "downsample_lttb",
+        "downsample_minmax",
+        "histogram_streaming",
+        "boxplot_stats_streaming",
+        "KLLSketch",
+        "LivePlot",
+        "RenderCache",
+        "set_render_cache",
+    ],
+    "metrics_store": [
+        "MetricsStore",
+        "Series",
+    ],
+}
+
+_SUBMODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_EXPORTS) + list(_SUBMODULE_OF)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _SUBMODULE_OF.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
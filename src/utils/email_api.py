@@ -3,119 +3,1751 @@
 #                           github.com/MatheusFS-dev                           #
 # ---------------------------------------------------------------------------- #    
 
+import asyncio
+import atexit
+import base64
+import cProfile
+import html
+import io
 import json
+import os
+import pstats
+import queue
+import re
 import smtplib
+import socket
+import ssl
+import string
+import struct
+import sys
+import threading
+import time
 import traceback
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import tracemalloc
+import weakref
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from email.header import Header
+from functools import lru_cache
+from typing import Any, Callable, Optional, Union
 
+try:
+    import fcntl
+    import resource
+except ImportError:  # Not available on Windows
+    fcntl = None
+    resource = None
 
-def get_credentials(file_path: str) -> tuple[str, str]:
+
+class RateLimitExceeded(smtplib.SMTPException):
+    """
+    Raised when an email could not get a send slot from its rate limiter in time.
+    """
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter for outbound emails, shared across threads and, through a lock
+    file, across processes.
+
+    Each bucket refills continuously, and a send consumes one token from every bucket.
+    The defaults stay below Gmail's per-minute bursts and daily quota for regular accounts.
+
+    Parameters:
+    - per_minute (float): Sustained sends per minute, also the burst size, which is at least
+      one send (default is 20).
+    - per_day (float): Sends per day (default is 500). No daily bucket if None.
+    - state_file (str): File holding the bucket state, locked with `fcntl.flock` so that
+      every process using the same file shares one budget. The budget is per process if None.
+    - max_wait (float): Default seconds `acquire` waits for a token (default is 60).
+
+    Attributes:
+    - sent (int): Tokens granted by this instance.
+    - deferred (int): Sends that had to wait for a token.
+    - dropped (int): Sends that gave up because no token became available in time.
+    """
+
+    def __init__(
+        self,
+        per_minute: Optional[float] = 20,
+        per_day: Optional[float] = 500,
+        state_file: Optional[str] = None,
+        max_wait: Optional[float] = 60.0,
+    ):
+        if state_file is not None and fcntl is None:
+            raise ValueError("Sharing a rate limit across processes requires fcntl (POSIX only).")
+        # (capacity, tokens refilled per second) for each bucket. A bucket must be able to hold
+        # the one token a send takes, or rates below one per period would never grant it
+        self.buckets = [
+            (max(float(rate), 1.0), rate / period)
+            for rate, period in ((per_minute, 60.0), (per_day, 86400.0))
+            if rate
+        ]
+        self.state_file = state_file
+        self.max_wait = max_wait
+        self.sent = 0
+        self.deferred = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._state = self._initial_state()
+        self._format = f"<{len(self.buckets) + 1}d"
+
+    def _initial_state(self) -> list[float]:
+        return [time.time()] + [capacity for capacity, _ in self.buckets]
+
+    @contextmanager
+    def _locked_state(self):
+        with self._lock:
+            if self.state_file is None:
+                yield self._state
+                return
+            with open(self.state_file, "a+b") as file:
+                fcntl.flock(file, fcntl.LOCK_EX)
+                file.seek(0)
+                data = file.read()
+                size = struct.calcsize(self._format)
+                state = list(struct.unpack(self._format, data)) if len(data) == size else self._initial_state()
+                yield state
+                file.seek(0)
+                file.truncate()
+                file.write(struct.pack(self._format, *state))
+
+    def _take(self, tokens: float) -> float:
+        # Consumes the tokens if every bucket has them, otherwise returns the seconds to wait
+        with self._locked_state() as state:
+            now = time.time()
+            elapsed = max(0.0, now - state[0])
+            state[0] = now
+            for i, (capacity, refill) in enumerate(self.buckets, start=1):
+                state[i] = min(capacity, state[i] + elapsed * refill)
+            wait = max(
+                [(tokens - state[i]) / refill for i, (_, refill) in enumerate(self.buckets, start=1)] + [0.0]
+            )
+            if wait == 0.0:
+                for i in range(1, len(state)):
+                    state[i] -= tokens
+            return wait
+
+    def wait_time(self) -> float:
+        """
+        Returns the seconds until a send would be allowed, without consuming anything.
+        """
+        with self._locked_state() as state:
+            elapsed = max(0.0, time.time() - state[0])
+            return max(
+                [
+                    (1 - min(capacity, state[i] + elapsed * refill)) / refill
+                    for i, (capacity, refill) in enumerate(self.buckets, start=1)
+                ]
+                + [0.0]
+            )
+
+    def try_acquire(self) -> bool:
+        """
+        Consumes a token if one is available right now.
+
+        Returns:
+        - bool: True if the send may proceed.
+        """
+        if self._take(1) == 0.0:
+            self.sent += 1
+            return True
+        return False
+
+    def acquire(self, timeout: Optional[float] = -1) -> bool:
+        """
+        Waits until a token is available and consumes it.
+
+        Parameters:
+        - timeout (float): Maximum seconds to wait. Uses `max_wait` if omitted, and waits
+          forever if None.
+
+        Returns:
+        - bool: True if a token was obtained, False if the send should be dropped.
+        """
+        if timeout == -1:
+            timeout = self.max_wait
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waited = False
+        while True:
+            wait = self._take(1)
+            if wait == 0.0:
+                self.sent += 1
+                self.deferred += waited
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                self.dropped += 1
+                return False
+            waited = True
+            time.sleep(wait)
+
+    def stats(self) -> dict:
+        """
+        Returns the sent, deferred and dropped counters of this instance.
+        """
+        return {"sent": self.sent, "deferred": self.deferred, "dropped": self.dropped}
+
+
+class SMTPConnectionPool:
+    """
+    Keeps authenticated SMTP sessions alive so that consecutive sends skip the
+    TCP/TLS handshake and the login round-trips.
+
+    Idle connections are health-checked with NOOP before being handed out and
+    transparently replaced when the server has dropped them.
+
+    Parameters:
+    - host (str): SMTP server host name.
+    - port (int): SMTP server port.
+    - sender_email (str): Account used to log in. No login is done if None.
+    - sender_password (str): Password for the account. No login is done if None.
+    - size (int): Maximum number of simultaneous connections (default is 2).
+    - use_tls (bool): Whether to upgrade the session with STARTTLS (default is True).
+    - timeout (float): Socket timeout in seconds (default is 30).
+    - health_check_interval (float): Idle seconds after which a connection is probed
+      with NOOP before reuse (default is 5).
+    - max_idle (float): Idle seconds after which a connection is considered stale and
+      reopened without probing (default is 240).
+    - rate_limiter (RateLimiter): If provided, every send waits for a token from it and
+      raises `RateLimitExceeded` if none becomes available in time.
+    """
+
+    def __init__(
+        self,
+        host: str = "smtp.gmail.com",
+        port: int = 587,
+        sender_email: Optional[str] = None,
+        sender_password: Optional[str] = None,
+        size: int = 2,
+        use_tls: bool = True,
+        timeout: float = 30.0,
+        health_check_interval: float = 5.0,
+        max_idle: float = 240.0,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1.")
+        self.host = host
+        self.port = port
+        self.sender_email = sender_email
+        self.sender_password = sender_password
+        self.size = size
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.max_idle = max_idle
+        self.rate_limiter = rate_limiter
+        self._idle: list[tuple[smtplib.SMTP, float]] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self._pid = os.getpid()
+        self._closed = False
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.sender_email is not None and self.sender_password is not None:
+                server.login(self.sender_email, self.sender_password)
+        except Exception:
+            self._close_quietly(server)
+            raise
+        return server
+
+    @staticmethod
+    def _close_quietly(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    @staticmethod
+    def _is_alive(server: smtplib.SMTP) -> bool:
+        try:
+            return server.noop()[0] == 250
+        except Exception:
+            return False
+
+    def _reset_after_fork(self) -> None:
+        # Sockets inherited from the parent process must not be shared
+        if os.getpid() != self._pid:
+            self._idle = []
+            self._lock = threading.Lock()
+            self._slots = threading.BoundedSemaphore(self.size)
+            self._pid = os.getpid()
+
+    def acquire(self, timeout: Optional[float] = None) -> smtplib.SMTP:
+        """
+        Returns a ready-to-use connection, reusing an idle one when possible.
+
+        Parameters:
+        - timeout (float): Seconds to wait for a free slot. Waits forever if None.
+
+        Returns:
+        - smtplib.SMTP: An authenticated SMTP connection.
+        """
+        self._reset_after_fork()
+        if self._closed:
+            raise RuntimeError("SMTP connection pool is closed.")
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("Timed out waiting for a free SMTP connection.")
+        try:
+            while True:
+                with self._lock:
+                    if not self._idle:
+                        break
+                    server, released_at = self._idle.pop()
+                idle_for = time.monotonic() - released_at
+                if idle_for > self.max_idle:
+                    self._close_quietly(server)
+                elif idle_for < self.health_check_interval or self._is_alive(server):
+                    return server
+                else:
+                    server.close()
+            return self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, server: smtplib.SMTP, discard: bool = False) -> None:
+        """
+        Returns a connection to the pool.
+
+        Parameters:
+        - server (smtplib.SMTP): Connection obtained from `acquire`.
+        - discard (bool): Close the connection instead of keeping it (default is False).
+        """
+        if discard or self._closed:
+            self._close_quietly(server)
+        else:
+            with self._lock:
+                self._idle.append((server, time.monotonic()))
+        self._slots.release()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """
+        Context manager that acquires a connection and releases it afterwards.
+        Connections that raised an SMTP or socket error are discarded.
+        """
+        server = self.acquire(timeout)
+        try:
+            yield server
+        except (smtplib.SMTPServerDisconnected, OSError):
+            self.release(server, discard=True)
+            raise
+        except BaseException:
+            self.release(server)
+            raise
+        else:
+            self.release(server)
+
+    def sendmail(self, from_addr: str, to_addrs: list[str], msg: str) -> dict:
+        """
+        Sends a message over a pooled connection, reconnecting once if the
+        server dropped the session between the health check and the send.
+
+        Returns:
+        - dict: Recipients refused by the server, as returned by `smtplib.SMTP.sendmail`.
+        """
+        if self.rate_limiter is not None and not self.rate_limiter.acquire():
+            raise RateLimitExceeded("Email rate limit exhausted, message dropped.")
+        try:
+            with self.connection() as server:
+                return server.sendmail(from_addr, to_addrs, msg)
+        except smtplib.SMTPServerDisconnected:
+            with self.connection() as server:
+                return server.sendmail(from_addr, to_addrs, msg)
+
+    def close(self) -> None:
+        """
+        Closes all idle connections and refuses further acquisitions.
+        """
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+        if os.getpid() == self._pid:
+            for server, _ in idle:
+                self._close_quietly(server)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_POOLS: dict[tuple, SMTPConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_smtp_pool(
+    host: str = "smtp.gmail.com",
+    port: int = 587,
+    sender_email: Optional[str] = None,
+    sender_password: Optional[str] = None,
+    size: int = 2,
+    use_tls: bool = True,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> SMTPConnectionPool:
+    """
+    Returns the shared connection pool for a server and account, creating it on first use.
+
+    Parameters:
+    - host (str): SMTP server host name.
+    - port (int): SMTP server port.
+    - sender_email (str): Account used to log in.
+    - sender_password (str): Password for the account.
+    - size (int): Maximum number of connections, used only when the pool is created.
+    - use_tls (bool): Whether to upgrade the session with STARTTLS.
+    - rate_limiter (RateLimiter): Limiter applied to every send, used only when the pool is created.
+
+    Returns:
+    - SMTPConnectionPool: The pool shared by every caller with the same parameters.
+    """
+    key = (host, port, sender_email, sender_password, use_tls)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None or pool._closed:
+            pool = SMTPConnectionPool(
+                host, port, sender_email, sender_password, size, use_tls, rate_limiter=rate_limiter
+            )
+            _POOLS[key] = pool
+        return pool
+
+
+def close_smtp_pools() -> None:
+    """
+    Closes every shared connection pool. Registered to run at interpreter exit.
+    """
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_smtp_pools)
+
+
+# Credentials and recipients may be given as a JSON file path, as in-memory objects,
+# or as None to read them from the environment variables below
+CredentialsSource = Union[str, dict, tuple, None]
+RecipientsSource = Union[str, dict, list, None]
+
+CREDENTIALS_EMAIL_ENV = "EMAIL_API_SENDER"
+CREDENTIALS_PASSWORD_ENV = "EMAIL_API_PASSWORD"
+RECIPIENTS_ENV = "EMAIL_API_RECIPIENTS"
+
+_CONFIG_CACHE: dict[str, tuple[tuple, object]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def load_json_cached(file_path: str):
+    """
+    Parses a JSON file once and serves it from memory until the file changes.
+
+    The cache is keyed on the absolute path and invalidated when the inode, size or
+    modification time reported by `os.stat` differs, so repeated reads of an unchanged
+    file cost a single `stat` call instead of an open and a parse.
+
+    Parameters:
+    - file_path (str): Path to the JSON file.
+
+    Returns:
+    - object: The parsed JSON content. Callers must not mutate it.
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    with open(path, "r") as file:
+        data = json.load(file)
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[path] = (signature, data)
+    return data
+
+
+def clear_config_cache() -> None:
+    """
+    Drops every cached configuration file, forcing the next read to parse it again.
+    """
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+
+
+def get_credentials(file_path: CredentialsSource) -> tuple[str, str]:
+    """
+    Reads the sender's email and password from a JSON file.
+
+    Parameters:
+    - file_path (str | dict | tuple | None): Path to the credentials JSON file. A dict with
+      "email" and "password" keys or an (email, password) tuple is used as is, and None
+      reads the EMAIL_API_SENDER and EMAIL_API_PASSWORD environment variables.
+
+    Returns:
+    - tuple: A tuple containing the sender email and password.
+    """
+    try:
+        if file_path is None:
+            return os.environ[CREDENTIALS_EMAIL_ENV], os.environ[CREDENTIALS_PASSWORD_ENV]
+        if isinstance(file_path, tuple):
+            email, password = file_path
+            return email, password
+        credentials = file_path if isinstance(file_path, dict) else load_json_cached(file_path)
+        return credentials["email"], credentials["password"]
+    except Exception as e:
+        raise ValueError(f"Failed to read credentials: {e}")
+
+
+def get_recipient_emails(file_path: RecipientsSource) -> list[str]:
+    """
+    Reads a list of recipient email addresses from a JSON file.
+
+    Parameters:
+    - file_path (str | dict | list | None): Path to the recipient JSON file. A dict with an
+      "emails" key or a list of addresses is used as is, and None reads the comma-separated
+      EMAIL_API_RECIPIENTS environment variable.
+
+    Returns:
+    - list: A list of recipient email addresses.
+    """
+    try:
+        if file_path is None:
+            emails = [email.strip() for email in os.environ[RECIPIENTS_ENV].split(",")]
+            return [email for email in emails if email]
+        if isinstance(file_path, list):
+            return list(file_path)
+        recipient_data = file_path if isinstance(file_path, dict) else load_json_cached(file_path)
+        return list(recipient_data["emails"])
+    except Exception as e:
+        raise ValueError(f"Failed to read recipient emails: {e}")
+
+
+class NotificationTemplate:
+    """
+    Email body template compiled once into static segments and named placeholders.
+
+    Placeholders use the `string.Template` syntax (`$task_name` or `${task_name}`, with `$$`
+    for a literal dollar sign). The static segments are split out and UTF-8 encoded when
+    the template is compiled, so rendering only encodes the substituted values and joins.
+    Placeholders without a value are left in the output untouched.
+
+    Parameters:
+    - source (str): The template text.
+    - raw_fields (tuple): Placeholders whose values are inserted without HTML escaping,
+      because they already hold HTML markup (default is ("metrics",)).
+    """
+
+    def __init__(self, source: str, raw_fields: tuple = ("metrics",)):
+        self.source = source
+        self.raw_fields = frozenset(raw_fields)
+        self._static: list[bytes] = []
+        self._fields: list[Optional[str]] = []
+        self._placeholders: list[str] = []
+
+        literal = []
+        position = 0
+        for match in string.Template.pattern.finditer(source):
+            literal.append(source[position : match.start()])
+            name = match.group("named") or match.group("braced")
+            if name is None:
+                # "$$" collapses to "$", invalid placeholders are kept as written
+                literal.append("$" if match.group("escaped") is not None else match.group())
+            else:
+                self._static.append("".join(literal).encode("utf-8"))
+                self._fields.append(name)
+                self._placeholders.append(match.group())
+                literal = []
+            position = match.end()
+        literal.append(source[position:])
+        self._static.append("".join(literal).encode("utf-8"))
+
+    @property
+    def fields(self) -> frozenset:
+        """
+        Names of the placeholders used by the template.
+        """
+        return frozenset(self._fields)
+
+    def render_bytes(self, values: dict, escape: bool = False) -> bytes:
+        """
+        Substitutes the placeholders and returns the UTF-8 encoded result.
+
+        Parameters:
+        - values (dict): Placeholder values. Non-string values are converted with `str`.
+        - escape (bool): HTML-escape values not listed in `raw_fields` (default is False).
+
+        Returns:
+        - bytes: The rendered template.
+        """
+        parts = [self._static[0]]
+        for name, placeholder, static in zip(self._fields, self._placeholders, self._static[1:]):
+            if name in values:
+                value = str(values[name])
+                if escape and name not in self.raw_fields:
+                    value = html.escape(value, quote=False)
+            else:
+                value = placeholder
+            parts.append(value.encode("utf-8"))
+            parts.append(static)
+        return b"".join(parts)
+
+    def render(self, values: dict, escape: bool = False) -> str:
+        """
+        Substitutes the placeholders and returns the result as text.
+        Parameters are the same as for `render_bytes`.
+        """
+        return self.render_bytes(values, escape).decode("utf-8")
+
+
+TEMPLATE_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def get_template(source: str) -> NotificationTemplate:
+    """
+    Compiles a template, serving repeated requests for the same text from an LRU cache.
+
+    Parameters:
+    - source (str): The template text.
+
+    Returns:
+    - NotificationTemplate: The compiled template.
+    """
+    return NotificationTemplate(source)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _load_template_file(path: str, signature: tuple) -> NotificationTemplate:
+    with open(path, "r", encoding="utf-8") as file:
+        return get_template(file.read())
+
+
+def _as_template(body: Union[str, NotificationTemplate]) -> NotificationTemplate:
+    return body if isinstance(body, NotificationTemplate) else get_template(body)
+
+
+def load_template(file_path: str) -> NotificationTemplate:
+    """
+    Loads and compiles a template file, reloading it only when the file changes.
+
+    Parameters:
+    - file_path (str): Path to the template file.
+
+    Returns:
+    - NotificationTemplate: The compiled template.
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    return _load_template_file(path, (stat.st_ino, stat.st_size, stat.st_mtime_ns))
+
+
+@lru_cache(maxsize=256)
+def _encode_header(value: str) -> str:
+    try:
+        value.encode("ascii")
+        return value
+    except UnicodeEncodeError:
+        return Header(value, "utf-8").encode()
+
+
+@lru_cache(maxsize=64)
+def _message_headers(sender_email: str, recipient_emails: tuple, text_type: str) -> str:
+    # Everything but the subject and body is identical between sends to the same audience
+    return (
+        f"From: {_encode_header(sender_email)}\n"
+        f"To: {_encode_header(', '.join(recipient_emails))}\n"
+        "MIME-Version: 1.0\n"
+        f'Content-Type: text/{text_type}; charset="utf-8"\n'
+        "Content-Transfer-Encoding: base64\n"
+    )
+
+
+def _compose_message(
+    subject: str, body: Union[str, bytes], sender_email: str, recipient_emails: list[str], text_type: str
+) -> str:
+    """
+    Serializes a single-part UTF-8 message, ready to be handed to the server.
+
+    The header block is cached per sender, recipients and text type, so only the subject
+    and the base64 encoding of the body are computed per message. Bytes bodies, such as
+    the output of `NotificationTemplate.render_bytes`, are taken as UTF-8.
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    headers = _message_headers(sender_email, tuple(recipient_emails), text_type)
+    return f"{headers}Subject: {_encode_header(subject)}\n\n{base64.encodebytes(body).decode('ascii')}"
+
+
+def _deliver_email(
+    subject: str,
+    body: str,
+    recipients_file: RecipientsSource,
+    credentials_file: CredentialsSource,
+    text_type: str = "plain",
+    smtp_server: str = "smtp.gmail.com",
+    smtp_port: int = 587,
+    pool: Optional[SMTPConnectionPool] = None,
+    use_tls: bool = True,
+) -> None:
+    """
+    Composes and sends an email, raising on any failure. Shared by `send_email`
+    and the background dispatcher, which needs the exception to decide on retries.
+    """
+    sender_email, sender_password = get_credentials(credentials_file)
+    recipient_emails = get_recipient_emails(recipients_file)
+
+    message = _compose_message(subject, body, sender_email, recipient_emails, text_type)
+
+    # Send the email
+    if pool is None:
+        pool = get_smtp_pool(smtp_server, smtp_port, sender_email, sender_password, use_tls=use_tls)
+    pool.sendmail(sender_email, recipient_emails, message)
+
+
+def send_email(
+    subject: str,
+    body: str,
+    recipients_file: RecipientsSource,
+    credentials_file: CredentialsSource,
+    text_type: str = "plain",
+    smtp_server: str = "smtp.gmail.com",
+    smtp_port: int = 587,
+    pool: Optional[SMTPConnectionPool] = None,
+    use_tls: bool = True,
+) -> None:
+    """
+    Sends an email notification with the specified subject and body content to multiple recipients.
+
+    The message is sent over a pooled connection, so repeated calls reuse the same
+    authenticated session instead of reconnecting every time.
+
+    Parameters:
+    - subject (str): The subject of the email.
+    - body (str): The main content of the email.
+    - recipients_file (str | dict | list | None): Path to the recipients JSON file, or any
+      other source accepted by `get_recipient_emails`.
+    - credentials_file (str | dict | tuple | None): Path to the credentials JSON file, or
+      any other source accepted by `get_credentials`.
+    - text_type (str): The type of text content (default is "plain").
+    - smtp_server (str): SMTP server host name (default is "smtp.gmail.com").
+    - smtp_port (int): SMTP server port (default is 587).
+    - pool (SMTPConnectionPool): Pool to send through. Defaults to the shared pool for
+      the server and sender account.
+    - use_tls (bool): Whether the shared pool upgrades the session with STARTTLS (default
+      is True). Ignored when `pool` is given.
+    """
+    try:
+        _deliver_email(
+            subject, body, recipients_file, credentials_file, text_type, smtp_server, smtp_port, pool, use_tls
+        )
+        print("[INFO] Email sent successfully.")
+    except ValueError as e:
+        # Unreadable credentials or recipients file
+        print(f"[ERROR] {e}")
+    except Exception as e:
+        print(f"[ERROR] Failed to send email: {e}")
+
+
+def _coalesce_jobs(jobs: list[tuple]) -> tuple:
+    """
+    Merges queued emails that share a destination into a single email.
+    """
+    subject, _, recipients_file, credentials_file, text_type, smtp_server, smtp_port = jobs[0]
+    if text_type == "html":
+        sections = "<hr>".join(f"<h3>{html.escape(job[0])}</h3>{job[1]}" for job in jobs)
+        body = f"<p>{len(jobs)} notifications were grouped to stay within the sending rate limit.</p><hr>{sections}"
+    else:
+        sections = "\n\n-----\n\n".join(f"{job[0]}\n\n{job[1]}" for job in jobs)
+        body = f"{len(jobs)} notifications were grouped to stay within the sending rate limit.\n\n-----\n\n{sections}"
+    subject = f"📦 {len(jobs)} notifications: {subject}"
+    return (subject, body, recipients_file, credentials_file, text_type, smtp_server, smtp_port)
+
+
+class EmailDispatcher:
+    """
+    Sends emails from a background thread so that notifying never blocks the caller.
+
+    Messages are placed on a bounded in-process queue and delivered by worker threads,
+    with exponential backoff between failed attempts. Pending messages are flushed at
+    interpreter exit. Each submission returns a `concurrent.futures.Future`, which can
+    be waited on directly or awaited from asyncio code via `asyncio.wrap_future`.
+
+    When the pool has a rate limiter whose budget is exhausted, the workers wait for it
+    and then coalesce every queued message with the same destination into a single email.
+    The `deferred` counter records the messages held back this way, and `coalesced` the
+    messages merged into another one.
+
+    Parameters:
+    - max_queue (int): Maximum number of pending messages. Submissions beyond it are
+      dropped instead of blocking (default is 1000).
+    - workers (int): Number of delivery threads (default is 1).
+    - max_retries (int): Retries after the first failed attempt (default is 3).
+    - backoff_base (float): Delay in seconds before the first retry, doubled on each
+      subsequent one (default is 1).
+    - backoff_max (float): Upper bound for the retry delay in seconds (default is 60).
+    - pool (SMTPConnectionPool): Pool to send through. Defaults to the shared pool.
+    - exit_timeout (float): Seconds to wait for pending messages at exit. Nothing is
+      flushed if None (default is 10).
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 1000,
+        workers: int = 1,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        pool: Optional[SMTPConnectionPool] = None,
+        exit_timeout: Optional[float] = 10.0,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.pool = pool
+        self.exit_timeout = exit_timeout
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.deferred = 0
+        self.coalesced = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._held: deque = deque()
+        self._held_lock = threading.Lock()
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"EmailDispatcher-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        atexit.register(self._flush_at_exit)
+
+    def submit(
+        self,
+        subject: str,
+        body: str,
+        recipients_file: RecipientsSource,
+        credentials_file: CredentialsSource,
+        text_type: str = "plain",
+        smtp_server: str = "smtp.gmail.com",
+        smtp_port: int = 587,
+    ) -> Future:
+        """
+        Queues an email for delivery and returns immediately.
+
+        Parameters are the same as for `send_email`.
+
+        Returns:
+        - Future: Resolves to None once the email is sent, or to the last exception if
+          every attempt failed or the message was dropped.
+        """
+        future: Future = Future()
+        if self._closed:
+            future.set_exception(RuntimeError("Email dispatcher is closed."))
+            return future
+        job = (subject, body, recipients_file, credentials_file, text_type, smtp_server, smtp_port)
+        with self._idle:
+            self._pending += 1
+        try:
+            self._queue.put_nowait((job, future))
+        except queue.Full:
+            self._done()
+            self.dropped += 1
+            print(f"[ERROR] Notification queue is full, dropping email: {subject}")
+            future.set_exception(RuntimeError("Email dispatch queue is full."))
+        return future
+
+    def _next_item(self):
+        with self._held_lock:
+            if self._held:
+                return self._held.popleft()
+        return self._queue.get()
+
+    def _drain_matching(self, job: tuple) -> list:
+        # Takes every queued message with the same destination, holding back the others
+        matching = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return matching
+            if item is not None and item[0][2:] == job[2:]:
+                matching.append(item)
+            else:
+                with self._held_lock:
+                    self._held.append(item)
+
+    def _worker(self) -> None:
+        while True:
+            item = self._next_item()
+            if item is None:
+                return
+            batch = [item]
+            limiter = self.pool.rate_limiter if self.pool is not None else None
+            if limiter is not None:
+                wait = limiter.wait_time()
+                if wait > 0:
+                    # Out of budget: let messages pile up, then send them as one
+                    time.sleep(wait)
+                    batch += self._drain_matching(item[0])
+                    self.deferred += len(batch)
+            running = [(job, future) for job, future in batch if future.set_running_or_notify_cancel()]
+            try:
+                if running:
+                    job = running[0][0] if len(running) == 1 else _coalesce_jobs([job for job, _ in running])
+                    self._send_with_retry(job)
+                    self.coalesced += len(running) - 1
+                    for _, future in running:
+                        future.set_result(None)
+            except Exception as e:
+                for _, future in running:
+                    future.set_exception(e)
+            finally:
+                for _ in batch:
+                    self._done()
+
+    def _send_with_retry(self, job: tuple) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                _deliver_email(*job, pool=self.pool)
+                self.sent += 1
+                return None
+            except ValueError:
+                # Broken configuration files will not fix themselves
+                self.failed += 1
+                raise
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self.failed += 1
+                    print(f"[ERROR] Failed to send email after {attempt + 1} attempts: {e}")
+                    raise
+                time.sleep(min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def _done(self) -> None:
+        with self._idle:
+            self._pending -= 1
+            if self._pending == 0:
+                self._idle.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until every queued email has been delivered or has failed.
+
+        Parameters:
+        - timeout (float): Maximum seconds to wait. Waits forever if None.
+
+        Returns:
+        - bool: True if the queue was drained, False if the timeout expired first.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stops accepting new emails, flushes the queue and stops the workers.
+
+        Returns:
+        - bool: True if every pending email was processed before the timeout.
+        """
+        self._closed = True
+        drained = self.flush(timeout)
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                break
+        atexit.unregister(self._flush_at_exit)
+        return drained
+
+    def _flush_at_exit(self) -> None:
+        if self.exit_timeout is not None and not self.flush(self.exit_timeout):
+            print(f"[ERROR] Exiting with {self._pending} undelivered email(s).")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def summary_entry(
+    task_name: str, succeeded: bool, duration: float, error_message: Optional[str] = None
+) -> dict:
+    """
+    Builds one row of a summary email, as consumed by `render_summary`.
+    """
+    return {
+        "task": task_name,
+        "succeeded": succeeded,
+        "duration": duration,
+        "error": error_message,
+        "finished_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def render_summary(entries: list[dict], subject: str, title: str = "📋 Task Digest") -> tuple[str, str]:
+    """
+    Builds an HTML email summarizing several tasks: a table of successes and failures
+    followed by the collapsed tracebacks of the failed tasks.
+
+    Parameters:
+    - entries (list): Rows built by `summary_entry`.
+    - subject (str): Subject prefix, completed with the success and failure counts.
+    - title (str): Heading of the email body.
+
+    Returns:
+    - tuple: The subject and the HTML body.
+    """
+    failures = [entry for entry in entries if not entry["succeeded"]]
+    subject = f"{subject}: {len(entries) - len(failures)} succeeded, {len(failures)} failed"
+    rows = "".join(
+        f"""
+                <tr>
+                    <td style="padding: 4px 8px;">{html.escape(entry["task"])}</td>
+                    <td style="padding: 4px 8px; color: {"#28a745" if entry["succeeded"] else "#dc3545"};">
+                        {"✔️ Success" if entry["succeeded"] else "❌ Failed"}
+                    </td>
+                    <td style="padding: 4px 8px; text-align: right;">{entry["duration"]:.2f} s</td>
+                    <td style="padding: 4px 8px;">{entry["finished_at"]}</td>
+                </tr>"""
+        for entry in entries
+    )
+    tracebacks = "".join(
+        f"""
+            <details style="margin-bottom: 10px;">
+                <summary><strong>{html.escape(entry["task"])}</strong> ({entry["finished_at"]})</summary>
+                <pre style="background-color: #f8d7da; color: #721c24; padding: 10px; border-radius: 5px; font-size: 14px;">{html.escape(entry["error"] or "")}</pre>
+            </details>"""
+        for entry in failures
+    )
+    body = f"""
+    <html>
+        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+            <h2 style="color: #0056b3;">{title}</h2>
+            <p>{len(entries)} task(s) finished: {len(entries) - len(failures)} succeeded, {len(failures)} failed.</p>
+            <table style="border-collapse: collapse; font-size: 14px;">
+                <tr style="background-color: #f2f2f2;">
+                    <th style="padding: 4px 8px; text-align: left;">Task</th>
+                    <th style="padding: 4px 8px; text-align: left;">Status</th>
+                    <th style="padding: 4px 8px; text-align: right;">Duration</th>
+                    <th style="padding: 4px 8px; text-align: left;">Finished</th>
+                </tr>{rows}
+            </table>
+            {"<h3>Tracebacks</h3>" + tracebacks if failures else ""}
+            <footer style="margin-top: 20px; text-align: center; font-size: 14px; color: #888;">
+                <p>Best regards,</p>
+                <p><strong>The Bot Mailman</strong></p>
+            </footer>
+        </body>
+    </html>
+    """
+    return subject, body
+
+
+class EmailDigest:
+    """
+    Buffers task notifications and sends them as a single combined HTML email.
+
+    A digest is sent when `max_items` notifications have accumulated or when `window`
+    seconds have passed since the first buffered one, whichever comes first. The email
+    contains a summary table of successes and failures followed by the collapsed
+    tracebacks of the failed tasks. Anything still buffered is sent at interpreter exit.
+
+    Parameters:
+    - recipients_file (str | dict | list | None): Path to the recipients JSON file, or any
+      other source accepted by `get_recipient_emails`.
+    - credentials_file (str | dict | tuple | None): Path to the credentials JSON file, or
+      any other source accepted by `get_credentials`.
+    - window (float): Maximum seconds a notification waits in the buffer (default is 300).
+    - max_items (int): Number of buffered notifications that triggers a send (default is 100).
+    - subject (str): Subject prefix of the digest email.
+    - pool (SMTPConnectionPool): Pool to send through. Defaults to the shared pool.
+    - dispatcher (EmailDispatcher): If provided, digests are queued for background delivery.
+    """
+
+    def __init__(
+        self,
+        recipients_file: RecipientsSource,
+        credentials_file: CredentialsSource,
+        window: float = 300.0,
+        max_items: int = 100,
+        subject: str = "📋 Task Digest",
+        pool: Optional[SMTPConnectionPool] = None,
+        dispatcher: Optional[EmailDispatcher] = None,
+    ):
+        self.recipients_file = recipients_file
+        self.credentials_file = credentials_file
+        self.window = window
+        self.max_items = max_items
+        self.subject = subject
+        self.pool = pool
+        self.dispatcher = dispatcher
+        self._entries: list[dict] = []
+        self._first_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._timer = threading.Thread(target=self._run_timer, name="EmailDigest", daemon=True)
+        self._timer.start()
+        atexit.register(self.flush)
+
+    def add(
+        self,
+        task_name: str,
+        succeeded: bool,
+        duration: float,
+        error_message: Optional[str] = None,
+    ) -> None:
+        """
+        Buffers the outcome of a task, sending the digest if the count threshold is reached.
+
+        Parameters:
+        - task_name (str): Name shown in the summary table.
+        - succeeded (bool): Whether the task completed without errors.
+        - duration (float): Task wall time in seconds.
+        - error_message (str): Formatted traceback of a failed task.
+        """
+        with self._lock:
+            if not self._entries:
+                self._first_at = time.monotonic()
+                self._wakeup.set()
+            self._entries.append(summary_entry(task_name, succeeded, duration, error_message))
+            full = len(self._entries) >= self.max_items
+        if full:
+            self.flush()
+
+    def _run_timer(self) -> None:
+        while not self._closed:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            with self._lock:
+                first_at = self._first_at
+            if first_at is None:
+                continue
+            remaining = self.window - (time.monotonic() - first_at)
+            if remaining > 0:
+                # Re-arm so that a flush by count during the wait restarts the window
+                self._wakeup.wait(remaining)
+                self._wakeup.set()
+                continue
+            self.flush()
+
+    def render(self, entries: list[dict]) -> tuple[str, str]:
+        """
+        Builds the subject and HTML body of a digest.
+
+        Parameters:
+        - entries (list): Buffered notifications, as stored by `add`.
+
+        Returns:
+        - tuple: The subject and the HTML body.
+        """
+        return render_summary(entries, self.subject)
+
+    def flush(self) -> None:
+        """
+        Sends every buffered notification as one digest email. Does nothing if the buffer is empty.
+        """
+        with self._lock:
+            entries, self._entries = self._entries, []
+            self._first_at = None
+        if not entries:
+            return
+        subject, body = self.render(entries)
+        if self.dispatcher is not None:
+            self.dispatcher.submit(subject, body, self.recipients_file, self.credentials_file, "html")
+        else:
+            send_email(subject, body, self.recipients_file, self.credentials_file, "html", pool=self.pool)
+
+    def close(self) -> None:
+        """
+        Sends any buffered notifications and stops the window timer.
+        """
+        self._closed = True
+        self._wakeup.set()
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# ---------------------------------------------------------------------------- #
+#                                   Telemetry                                  #
+# ---------------------------------------------------------------------------- #
+
+
+@dataclass
+class TaskResult:
+    """
+    Outcome and resource usage of a function run by `measure_call`.
+
+    Attributes:
+    - task_name (str): Name of the function.
+    - succeeded (bool): Whether the function returned without raising.
+    - result: Return value of the function, None if it failed.
+    - error (Exception): Exception raised by the function, None if it succeeded.
+    - traceback (str): Formatted traceback of the failure.
+    - wall_time (float): Elapsed wall-clock time in seconds.
+    - cpu_time (float): CPU time used by the process in seconds.
+    - peak_rss_mb (float): Peak resident set size of the process during the call in MiB,
+      if available.
+    - rss_increase_mb (float): Growth of that peak over the resident set size at the start
+      of the call in MiB, if available.
+    - tracemalloc_peak_mb (float): Peak memory allocated by Python during the call in MiB,
+      if memory tracing was enabled.
+    - profile (str): Table of the hottest functions, if profiling was enabled.
+    - environment (dict): Environment report of the machine, if requested (see
+      `gpu_info.get_environment_report`).
+    """
+
+    task_name: str
+    succeeded: bool
+    result: Any = None
+    error: Optional[BaseException] = None
+    traceback: str = ""
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_rss_mb: Optional[float] = None
+    rss_increase_mb: Optional[float] = None
+    tracemalloc_peak_mb: Optional[float] = None
+    profile: str = ""
+    environment: Optional[dict] = None
+
+    def metrics(self) -> dict:
+        """
+        Returns the measured values as a flat, JSON-serializable dict.
+        """
+        return {
+            "wall_time_s": self.wall_time,
+            "cpu_time_s": self.cpu_time,
+            "cpu_utilization": self.cpu_time / self.wall_time if self.wall_time > 0 else None,
+            "peak_rss_mb": self.peak_rss_mb,
+            "rss_increase_mb": self.rss_increase_mb,
+            "tracemalloc_peak_mb": self.tracemalloc_peak_mb,
+        }
+
+    def to_html(self) -> str:
+        """
+        Renders the metrics, and the profile if any, as an HTML fragment for notification bodies.
+        """
+        rows = "".join(
+            f"""
+                    <tr>
+                        <td style="padding: 2px 8px;">{name}</td>
+                        <td style="padding: 2px 8px; text-align: right;">{value:.3f}</td>
+                    </tr>"""
+            for name, value in self.metrics().items()
+            if value is not None
+        )
+        profile = (
+            f"""
+                <pre style="background-color: #f2f2f2; padding: 10px; border-radius: 5px; font-size: 12px;">{html.escape(self.profile)}</pre>"""
+            if self.profile
+            else ""
+        )
+        environment = ""
+        if self.environment:
+            environment_rows = "".join(
+                f"""
+                    <tr>
+                        <td style="padding: 2px 8px;">{name}</td>
+                        <td style="padding: 2px 8px;">{html.escape(str(value))}</td>
+                    </tr>"""
+                for name, value in self.environment.get("summary", {}).items()
+                if value is not None
+            )
+            environment = f"""
+                <table style="border-collapse: collapse; font-size: 14px; margin-top: 8px;">{environment_rows}
+                </table>"""
+        return f"""
+                <table style="border-collapse: collapse; font-size: 14px;">{rows}
+                </table>{environment}{profile}"""
+
+
+def _max_rss_mb() -> Optional[float]:
+    # Lifetime peak of the process, which also covers earlier calls and pool jobs
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def _current_rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024**2
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class _RSSSampler(threading.Thread):
+    """
+    Periodically reads the resident set size to find its peak during one call.
+
+    The lifetime peak from `getrusage` only belongs to the call when the call raised it,
+    so it is used to catch spikes between samples, and on its own where the current
+    resident set size cannot be read.
+    """
+
+    def __init__(self, interval: float):
+        super().__init__(name="RSSSampler", daemon=True)
+        self.interval = interval
+        self.baseline = _current_rss_mb()
+        self.peak = self.baseline
+        self._max_rss_before = _max_rss_mb()
+        self._stop_event = threading.Event()
+
+    def _sample(self) -> None:
+        rss = _current_rss_mb()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def run(self) -> None:
+        if self.baseline is None:
+            return
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def stop(self) -> tuple[Optional[float], Optional[float]]:
+        """
+        Stops sampling and returns the peak and its growth over the baseline, in MiB.
+        """
+        self._stop_event.set()
+        self.join()
+        self._sample()
+        peak = self.peak
+        max_rss = _max_rss_mb()
+        if max_rss is not None and self._max_rss_before is not None and max_rss > self._max_rss_before:
+            peak = max_rss if peak is None else max(peak, max_rss)
+        increase = peak - self.baseline if peak is not None and self.baseline is not None else None
+        return peak, increase
+
+
+class _StackSampler(threading.Thread):
+    """
+    Periodically records the innermost function of a thread to build a sampled profile.
+    Unlike cProfile, it adds no overhead to the monitored code between samples.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name="StackSampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: dict[tuple, int] = {}
+        self.total = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            code = frame.f_code
+            key = (code.co_filename, code.co_firstlineno, code.co_name)
+            self.samples[key] = self.samples.get(key, 0) + 1
+            self.total += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+    def report(self, top: int) -> str:
+        lines = [f"{'samples':>8} {'share':>7}  function"]
+        for (filename, lineno, name), count in sorted(self.samples.items(), key=lambda item: -item[1])[:top]:
+            lines.append(f"{count:>8} {count / self.total:>7.1%}  {name} ({os.path.basename(filename)}:{lineno})")
+        return "\n".join(lines)
+
+
+def measure_call(
+    func,
+    func_args: tuple = (),
+    func_kwargs: Optional[dict] = None,
+    trace_memory: bool = False,
+    profile: Optional[str] = None,
+    profile_top: int = 15,
+    sample_interval: float = 0.005,
+    rss_interval: float = 0.01,
+) -> TaskResult:
     """
-    Reads the sender's email and password from a JSON file.
+    Runs a function and measures its wall time, CPU time and memory usage.
+    Exceptions raised by the function are captured in the result instead of propagated.
 
     Parameters:
-    - file_path (str): Path to the credentials JSON file.
+    - func (function): The function to execute.
+    - func_args (tuple): Positional arguments to pass to the function.
+    - func_kwargs (dict): Keyword arguments to pass to the function.
+    - trace_memory (bool): Record the peak Python allocation with `tracemalloc`. This slows
+      allocation-heavy code down noticeably (default is False).
+    - profile (str): "cprofile" for a deterministic profile of the hottest functions by
+      cumulative time, "sample" for a low-overhead sampled profile, or None (default).
+    - profile_top (int): Number of functions listed in the profile (default is 15).
+    - sample_interval (float): Seconds between samples of the sampled profile (default is 0.005).
+    - rss_interval (float): Seconds between reads of the resident set size, whose peak
+      during the call is reported (default is 0.01).
 
     Returns:
-    - tuple: A tuple containing the sender email and password.
+    - TaskResult: The outcome and the measurements.
     """
+    if profile not in (None, "cprofile", "sample"):
+        raise ValueError(f"Unknown profile mode: {profile}")
+    task_result = TaskResult(getattr(func, "__name__", repr(func)), False)
+
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    elif trace_memory:
+        tracemalloc.reset_peak()
+    profiler = cProfile.Profile() if profile == "cprofile" else None
+    sampler = _StackSampler(threading.get_ident(), sample_interval) if profile == "sample" else None
+    if sampler is not None:
+        sampler.start()
+    rss_sampler = _RSSSampler(rss_interval)
+    rss_sampler.start()
+
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
     try:
-        with open(file_path, "r") as file:
-            credentials = json.load(file)
-            return credentials["email"], credentials["password"]
+        if profiler is not None:
+            task_result.result = profiler.runcall(func, *func_args, **(func_kwargs or {}))
+        else:
+            task_result.result = func(*func_args, **(func_kwargs or {}))
+        task_result.succeeded = True
     except Exception as e:
-        raise ValueError(f"Failed to read credentials: {e}")
+        task_result.error = e
+        task_result.traceback = traceback.format_exc()
+    finally:
+        task_result.wall_time = time.perf_counter() - start_wall
+        task_result.cpu_time = time.process_time() - start_cpu
+        if sampler is not None:
+            sampler.stop()
+        task_result.peak_rss_mb, task_result.rss_increase_mb = rss_sampler.stop()
+        if trace_memory:
+            task_result.tracemalloc_peak_mb = tracemalloc.get_traced_memory()[1] / 1024**2
+            if started_tracing:
+                tracemalloc.stop()
+
+    if profiler is not None:
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(profile_top)
+        task_result.profile = stream.getvalue().strip()
+    elif sampler is not None and sampler.total:
+        task_result.profile = sampler.report(profile_top)
+    return task_result
+
+
+SUCCESS_BODY = """
+        <html>
+            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+                <h2 style="color: #28a745;">✔️ Task Completed</h2>
+                <p>The task you ran has completed successfully without any errors.</p>
+                <p><strong>$task_name</strong> finished in $duration on $host.</p>
+                $metrics
+                <p>Thank you for using our system.</p>
+                <footer style="margin-top: 20px; text-align: center; font-size: 14px; color: #888;">
+                    <p>Best regards,</p>
+                    <p><strong>The Bot Mailman</strong></p>
+                </footer>
+            </body>
+        </html>
+        """
+
+FAILURE_SUBJECT = "❌ Task Failed with an Error"
+
+FAILURE_BODY = """
+        <html>
+            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+                <h2 style="color: #dc3545;">❌ Task Failed</h2>
+                <p>The task you ran encountered an error:</p>
+                <pre style="background-color: #f8d7da; color: #721c24; padding: 10px; border-radius: 5px; font-size: 14px;">
+                $traceback
+                </pre>
+                <p><strong>$task_name</strong> failed after $duration on $host.</p>
+                $metrics
+                <p>Please review the error above and try again.</p>
+                <footer style="margin-top: 20px; text-align: center; font-size: 14px; color: #888;">
+                    <p>Best regards,</p>
+                    <p><strong>The Bot Mailman</strong></p>
+                </footer>
+            </body>
+        </html>
+        """
 
 
-def get_recipient_emails(file_path: str) -> list[str]:
+def template_values(
+    task_name: str = "", duration: Optional[float] = None, error_message: str = "", metrics: str = ""
+) -> dict:
     """
-    Reads a list of recipient email addresses from a JSON file.
+    Collects the standard placeholder values of a task notification.
 
     Parameters:
-    - file_path (str): Path to the recipient JSON file.
+    - task_name (str): Name of the task.
+    - duration (float): Task wall time in seconds.
+    - error_message (str): Formatted traceback of a failure.
+    - metrics (str): HTML fragment with task metrics.
 
     Returns:
-    - list: A list of recipient email addresses.
+    - dict: Values for the task_name, duration, traceback, metrics and host placeholders.
     """
-    try:
-        with open(file_path, "r") as file:
-            recipient_data = json.load(file)
-            return recipient_data["emails"]
-    except Exception as e:
-        raise ValueError(f"Failed to read recipient emails: {e}")
+    return {
+        "task_name": task_name,
+        "duration": f"{duration:.2f} s" if duration is not None else "n/a",
+        "traceback": error_message,
+        "metrics": metrics,
+        "host": socket.gethostname(),
+    }
 
 
-def send_email(
-    subject: str, body: str, recipients_file: str, credentials_file: str, text_type: str = "plain"
-) -> None:
+def failure_body(error_message: str, values: Optional[dict] = None, escape: bool = True) -> str:
     """
-    Sends an email notification with the specified subject and body content to multiple recipients.
+    Builds the HTML body of the email sent when a task raises an exception.
 
     Parameters:
-    - subject (str): The subject of the email.
-    - body (str): The main content of the email.
-    - recipients_file (str): Path to the recipients JSON file.
-    - credentials_file (str): Path to the credentials JSON file.
-    - text_type (str): The type of text content (default is "plain").
+    - error_message (str): The formatted traceback of the failure.
+    - values (dict): Additional placeholder values, as returned by `template_values`.
+    - escape (bool): HTML-escape the traceback (default is True).
+
+    Returns:
+    - str: The HTML body.
     """
-    smtp_server = "smtp.gmail.com"
-    smtp_port = 587
+    return get_template(FAILURE_BODY).render({**(values or {}), "traceback": error_message}, escape)
 
-    # Retrieve sender email and password
-    try:
-        sender_email, sender_password = get_credentials(credentials_file)
-    except ValueError as e:
-        print(f"[ERROR] {e}")
-        return
 
-    # Retrieve recipient email addresses
-    try:
-        recipient_emails = get_recipient_emails(recipients_file)
-    except ValueError as e:
-        print(f"[ERROR] {e}")
-        return
+PROGRESS_BODY = """
+        <html>
+            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+                <h2 style="color: #0056b3;">⏳ Task in Progress</h2>
+                <p><strong>$task_name</strong> has been running for $elapsed on $host.</p>
+                <p>Progress: $progress<br>Throughput: $throughput<br>ETA: $eta</p>
+                $metrics
+                <footer style="margin-top: 20px; text-align: center; font-size: 14px; color: #888;">
+                    <p>Best regards,</p>
+                    <p><strong>The Bot Mailman</strong></p>
+                </footer>
+            </body>
+        </html>
+        """
 
-    # Compose the email
-    message = MIMEMultipart()
-    message["From"] = sender_email
-    message["To"] = ", ".join(recipient_emails)
-    message["Subject"] = subject
-    message.attach(MIMEText(body, text_type))
 
-    # Send the email
-    try:
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()
-            server.login(sender_email, sender_password)
-            server.sendmail(sender_email, recipient_emails, message.as_string())
-        print("[INFO] Email sent successfully.")
-    except Exception as e:
-        print(f"[ERROR] Failed to send email: {e}")
+def _format_seconds(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m {seconds:02d}s"
+
+
+class Heartbeat:
+    """
+    Sends periodic progress emails while a long-running task executes.
+
+    A background thread samples the elapsed time, the progress and optional metrics every
+    `interval` seconds, and sends an update at most once every `send_every` seconds.
+    Throughput and ETA are computed from a moving average over the last `window` samples.
+    The monitored code only reports progress through `update` or a cheap `progress`
+    callback, so it pays nothing for the sampling or the sending.
+
+    Parameters:
+    - recipients_file (str | dict | list | None): Source accepted by `get_recipient_emails`.
+    - credentials_file (str | dict | tuple | None): Source accepted by `get_credentials`.
+    - interval (float): Seconds between samples (default is 60).
+    - send_every (float): Minimum seconds between two progress emails (default is 3600).
+    - progress (function): Called without arguments at every sample. Returns the number of
+      completed items, or a (completed, total) tuple. Defaults to the values set by `update`.
+    - metrics (function): Called without arguments at every sample. Returns a dict of
+      values shown in the email, such as the current loss.
+    - window (int): Number of samples in the throughput moving average (default is 10).
+    - task_name (str): Name shown in the email. Set by `run_with_notification` if empty.
+    - subject (str): Subject of the progress emails.
+    - pool (SMTPConnectionPool): Pool to send through. Defaults to the shared pool.
+    - dispatcher (EmailDispatcher): If provided, updates are queued for background delivery.
+    """
+
+    def __init__(
+        self,
+        recipients_file: RecipientsSource,
+        credentials_file: CredentialsSource,
+        interval: float = 60.0,
+        send_every: float = 3600.0,
+        progress: Optional[Callable] = None,
+        metrics: Optional[Callable] = None,
+        window: int = 10,
+        task_name: str = "",
+        subject: str = "⏳ Task Progress",
+        pool: Optional[SMTPConnectionPool] = None,
+        dispatcher: Optional[EmailDispatcher] = None,
+    ):
+        self.recipients_file = recipients_file
+        self.credentials_file = credentials_file
+        self.interval = interval
+        self.send_every = send_every
+        self.progress = progress
+        self.metrics = metrics
+        self.task_name = task_name
+        self.subject = subject
+        self.pool = pool
+        self.dispatcher = dispatcher
+        self.sent = 0
+        self._done = 0.0
+        self._total: Optional[float] = None
+        self._history: deque = deque(maxlen=max(2, window))
+        self._start_time = time.monotonic()
+        self._last_sent = self._start_time
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def update(self, done: float, total: Optional[float] = None) -> None:
+        """
+        Reports progress from the monitored code. Only stores two numbers.
+
+        Parameters:
+        - done (float): Number of completed items.
+        - total (float): Total number of items, if known.
+        """
+        self._done = done
+        if total is not None:
+            self._total = total
+
+    def sample(self) -> dict:
+        """
+        Takes one sample and returns the current progress figures.
+
+        Returns:
+        - dict: elapsed, done, total, throughput (items per second), eta (seconds) and
+          metrics. Figures that cannot be computed yet are None.
+        """
+        now = time.monotonic()
+        done, total = self._done, self._total
+        if self.progress is not None:
+            reported = self.progress()
+            done, total = reported if isinstance(reported, tuple) else (reported, total)
+        self._history.append((now, done))
+
+        throughput = eta = None
+        (first_time, first_done), (last_time, last_done) = self._history[0], self._history[-1]
+        if last_time > first_time:
+            throughput = (last_done - first_done) / (last_time - first_time)
+            if total is not None and throughput > 0:
+                eta = (total - done) / throughput
+        return {
+            "elapsed": now - self._start_time,
+            "done": done,
+            "total": total,
+            "throughput": throughput,
+            "eta": eta,
+            "metrics": self.metrics() if self.metrics is not None else {},
+        }
+
+    def render(self, snapshot: dict) -> str:
+        """
+        Builds the HTML body of a progress email from a `sample` snapshot.
+        """
+        done, total = snapshot["done"], snapshot["total"]
+        if total:
+            progress = f"{done:,.0f} / {total:,.0f} ({done / total:.1%})"
+        else:
+            progress = f"{done:,.0f}"
+        rows = "".join(
+            f"""
+                    <tr>
+                        <td style="padding: 2px 8px;">{html.escape(str(name))}</td>
+                        <td style="padding: 2px 8px; text-align: right;">{html.escape(str(value))}</td>
+                    </tr>"""
+            for name, value in snapshot["metrics"].items()
+        )
+        values = {
+            "task_name": self.task_name or "Task",
+            "elapsed": _format_seconds(snapshot["elapsed"]),
+            "progress": progress,
+            "throughput": f"{snapshot['throughput']:,.2f} items/s" if snapshot["throughput"] is not None else "n/a",
+            "eta": _format_seconds(snapshot["eta"]) if snapshot["eta"] is not None else "n/a",
+            "metrics": f'<table style="border-collapse: collapse; font-size: 14px;">{rows}</table>' if rows else "",
+            "host": socket.gethostname(),
+        }
+        return get_template(PROGRESS_BODY).render(values, escape=True)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                snapshot = self.sample()
+                if time.monotonic() - self._last_sent < self.send_every:
+                    continue
+                self._last_sent = time.monotonic()
+                body = self.render(snapshot)
+                if self.dispatcher is not None:
+                    self.dispatcher.submit(self.subject, body, self.recipients_file, self.credentials_file, "html")
+                else:
+                    send_email(self.subject, body, self.recipients_file, self.credentials_file, "html", pool=self.pool)
+                self.sent += 1
+            except Exception as e:
+                # A faulty callback must not stop the heartbeat or the monitored task
+                print(f"[ERROR] Heartbeat failed: {e}")
+
+    def start(self, task_name: Optional[str] = None) -> "Heartbeat":
+        """
+        Starts the sampling thread.
+
+        Parameters:
+        - task_name (str): Overrides the task name shown in the emails.
+        """
+        if task_name:
+            self.task_name = task_name
+        self._start_time = self._last_sent = time.monotonic()
+        self._history.clear()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="Heartbeat", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the sampling thread without sending a final update.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
 
 
 def run_with_notification(
     func,
     func_args: tuple,
     func_kwargs: dict,
-    recipients_file: str,
-    credentials_file: str,
+    recipients_file: RecipientsSource,
+    credentials_file: CredentialsSource,
     subject_success: str = "🎉 Task Completed Successfully",
-    body_success: str = """
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <h2 style="color: #28a745;">✔️ Task Completed</h2>
-                <p>The task you ran has completed successfully without any errors.</p>
-                <p>Thank you for using our system.</p>
-                <footer style="margin-top: 20px; text-align: center; font-size: 14px; color: #888;">
-                    <p>Best regards,</p>
-                    <p><strong>The Bot Mailman</strong></p>
-                </footer>
-            </body>
-        </html>
-        """,
+    body_success: Union[str, NotificationTemplate] = SUCCESS_BODY,
     text_type: str = "plain",
-):
+    pool: Optional[SMTPConnectionPool] = None,
+    dispatcher: Optional[EmailDispatcher] = None,
+    digest: Optional[EmailDigest] = None,
+    body_failure: Union[str, NotificationTemplate] = FAILURE_BODY,
+    extra_values: Optional[dict] = None,
+    telemetry: bool = False,
+    trace_memory: bool = False,
+    profile: Optional[str] = None,
+    profile_top: int = 15,
+    heartbeat: Optional[Heartbeat] = None,
+    environment: bool = False,
+) -> TaskResult:
     """
     Runs a given function and sends an email notification upon completion or error.
 
@@ -123,43 +1755,704 @@ def run_with_notification(
     - func (function): The function to execute.
     - func_args (tuple): Positional arguments to pass to the function.
     - func_kwargs (dict): Keyword arguments to pass to the function.
-    - recipients_file (str): Path to the recipients JSON file.
-    - credentials_file (str): Path to the credentials JSON file.
+    - recipients_file (str | dict | list | None): Path to the recipients JSON file, or any
+      other source accepted by `get_recipient_emails`.
+    - credentials_file (str | dict | tuple | None): Path to the credentials JSON file, or
+      any other source accepted by `get_credentials`.
     - subject_success (str): Subject for the success email.
-    - body_success (str): Body content for the success email.
+    - body_success (str | NotificationTemplate): Body content for the success email. It is
+      compiled once as a template, see `template_values` for the available placeholders.
     - text_type (str): The type of text content (default is "plain").
+    - pool (SMTPConnectionPool): Pool to send through. Defaults to the shared Gmail pool.
+    - dispatcher (EmailDispatcher): If provided, the notification is queued for background
+      delivery instead of being sent before this function returns.
+    - digest (EmailDigest): If provided, the outcome is buffered into the digest instead of
+      being sent as an individual email.
+    - body_failure (str | NotificationTemplate): Body template for the error email.
+    - extra_values (dict): Additional or overriding placeholder values for both bodies.
+    - telemetry (bool): Embed wall time, CPU time and memory usage in the notification
+      through the metrics placeholder (default is False).
+    - trace_memory (bool): Also record the peak Python allocation, see `measure_call`.
+    - profile (str): "cprofile" or "sample" to embed a hot-function table, see `measure_call`.
+    - profile_top (int): Number of functions listed in the profile (default is 15).
+    - heartbeat (Heartbeat): If provided, sends periodic progress emails while the function runs.
+    - environment (bool): Attach the cached environment report (Python, packages, CPU, GPUs,
+      TensorFlow/CUDA/cuDNN) to the result and summarize it in the notification through the
+      metrics placeholder (default is False).
+
+    Returns:
+    - TaskResult: The return value or exception of the function and its measurements.
     """
+    if heartbeat is not None:
+        heartbeat.start(heartbeat.task_name or getattr(func, "__name__", repr(func)))
     try:
-        # Execute the provided function
-        func(*func_args, **func_kwargs)
+        task_result = measure_call(func, func_args, func_kwargs, trace_memory, profile, profile_top)
+    finally:
+        if heartbeat is not None:
+            heartbeat.stop()
+    if environment:
+        from .gpu_info import get_environment_report
+
+        report = get_environment_report()
+        task_result.environment = dict(report.to_dict(), summary=report.summary())
+    if digest is not None:
+        digest.add(task_result.task_name, task_result.succeeded, task_result.wall_time, task_result.traceback or None)
+        return task_result
+
+    _send_task_notification(
+        task_result,
+        recipients_file,
+        credentials_file,
+        subject_success,
+        body_success,
+        body_failure,
+        text_type,
+        pool,
+        dispatcher,
+        extra_values,
+        include_metrics=telemetry or trace_memory or profile is not None or environment,
+    )
+    return task_result
+
 
+def _send_task_notification(
+    task_result: TaskResult,
+    recipients_file: RecipientsSource,
+    credentials_file: CredentialsSource,
+    subject_success: str,
+    body_success: Union[str, NotificationTemplate],
+    body_failure: Union[str, NotificationTemplate],
+    text_type: str,
+    pool: Optional[SMTPConnectionPool],
+    dispatcher: Optional[EmailDispatcher],
+    extra_values: Optional[dict],
+    include_metrics: bool,
+) -> None:
+    """
+    Renders and sends the success or error email of a finished task.
+    """
+    if task_result.succeeded:
         # If successful, send a success email
+        values = template_values(task_result.task_name, task_result.wall_time)
         subject = subject_success
-        body = body_success
-        send_email(subject, body, recipients_file, credentials_file, text_type)
-        print("[INFO] Success email sent.")
-    except Exception as e:
-        # Capture the error and send an error email
-        error_message = traceback.format_exc()
-        subject = "❌ Task Failed with an Error"
-        body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <h2 style="color: #dc3545;">❌ Task Failed</h2>
-                <p>The task you ran encountered an error:</p>
-                <pre style="background-color: #f8d7da; color: #721c24; padding: 10px; border-radius: 5px; font-size: 14px;">
-                {error_message}
-                </pre>
-                <p>Please review the error above and try again.</p>
-                <footer style="margin-top: 20px; text-align: center; font-size: 14px; color: #888;">
-                    <p>Best regards,</p>
-                    <p><strong>The Bot Mailman</strong></p>
-                </footer>
-            </body>
-        </html>
+        template = _as_template(body_success)
+        kind = "Success"
+    else:
+        # Send an error email with the captured traceback
+        values = template_values(task_result.task_name, task_result.wall_time, task_result.traceback)
+        subject = FAILURE_SUBJECT
+        template = _as_template(body_failure)
+        kind = "Error"
+
+    if include_metrics:
+        values["metrics"] = task_result.to_html()
+    values.update(extra_values or {})
+    body = template.render(values, escape=text_type == "html")
+    if dispatcher is not None:
+        dispatcher.submit(subject, body, recipients_file, credentials_file, text_type)
+        print(f"[INFO] {kind} email queued.")
+    else:
+        send_email(subject, body, recipients_file, credentials_file, text_type, pool=pool)
+        print(f"[INFO] {kind} email sent.")
+
+
+def run_many_with_notification(
+    jobs: list[tuple],
+    recipients_file: RecipientsSource,
+    credentials_file: CredentialsSource,
+    executor: str = "thread",
+    max_workers: Optional[int] = None,
+    notify: str = "summary",
+    subject: str = "📋 Parallel Run",
+    text_type: str = "html",
+    pool: Optional[SMTPConnectionPool] = None,
+    dispatcher: Optional[EmailDispatcher] = None,
+    trace_memory: bool = False,
+    profile: Optional[str] = None,
+    profile_top: int = 15,
+) -> list[TaskResult]:
+    """
+    Runs several functions in parallel and reports their outcomes by email.
+
+    Every job is run through `measure_call`, so exceptions are collected per job instead
+    of interrupting the others. Emails are always sent from the calling process.
+
+    Parameters:
+    - jobs (list): (func, args, kwargs) tuples. The kwargs, or both args and kwargs, may be
+      omitted. With the "process" executor, functions and arguments must be picklable.
+    - recipients_file (str | dict | list | None): Source accepted by `get_recipient_emails`.
+    - credentials_file (str | dict | tuple | None): Source accepted by `get_credentials`.
+    - executor (str): "thread" for I/O-bound or GIL-releasing jobs, "process" to use every
+      core for pure Python jobs (default is "thread").
+    - max_workers (int): Number of workers. Defaults to the executor's own default.
+    - notify (str): "summary" to send one report once all jobs finished, "each" to send an
+      email as soon as each job finishes, or "none" (default is "summary").
+    - subject (str): Subject prefix of the summary email.
+    - text_type (str): The type of text content of per-job emails (default is "html").
+    - pool (SMTPConnectionPool): Pool to send through. Defaults to the shared pool.
+    - dispatcher (EmailDispatcher): If provided, emails are queued for background delivery.
+    - trace_memory (bool): Record the peak Python allocation of each job, see `measure_call`.
+      Requires the "process" executor.
+    - profile (str): "cprofile" or "sample" to profile each job, see `measure_call`.
+      "cprofile" requires the "process" executor on Python 3.12 and later.
+    - profile_top (int): Number of functions listed in each profile (default is 15).
+
+    Returns:
+    - list: One TaskResult per job, in the order of `jobs`.
+    """
+    if executor not in ("thread", "process"):
+        raise ValueError(f"Unknown executor: {executor}")
+    if notify not in ("summary", "each", "none"):
+        raise ValueError(f"Unknown notification mode: {notify}")
+    # tracemalloc, and cProfile since Python 3.12, are process-wide: jobs sharing a
+    # process would reset and stop each other's measurements
+    if executor == "thread" and trace_memory:
+        raise ValueError('trace_memory requires executor="process".')
+    if executor == "thread" and profile == "cprofile" and sys.version_info >= (3, 12):
+        raise ValueError('profile="cprofile" requires executor="process" on Python 3.12 and later.')
+    pool_class = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+
+    results: list[Optional[TaskResult]] = [None] * len(jobs)
+    with pool_class(max_workers=max_workers) as workers:
+        futures = {}
+        for index, job in enumerate(jobs):
+            func, func_args, func_kwargs = (tuple(job) + ((), {}))[:3]
+            future = workers.submit(measure_call, func, func_args, func_kwargs, trace_memory, profile, profile_top)
+            futures[future] = index
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                task_result = future.result()
+            except Exception as e:
+                # The job could not be shipped to or back from the worker, e.g. unpicklable
+                func = jobs[index][0]
+                task_result = TaskResult(getattr(func, "__name__", repr(func)), False, error=e)
+                task_result.traceback = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+            task_result.task_name = f"#{index} {task_result.task_name}"
+            results[index] = task_result
+            if notify == "each":
+                _send_task_notification(
+                    task_result,
+                    recipients_file,
+                    credentials_file,
+                    "🎉 Task Completed Successfully",
+                    SUCCESS_BODY,
+                    FAILURE_BODY,
+                    text_type,
+                    pool,
+                    dispatcher,
+                    None,
+                    include_metrics=True,
+                )
+
+    if notify == "summary" and results:
+        entries = [
+            summary_entry(result.task_name, result.succeeded, result.wall_time, result.traceback or None)
+            for result in results
+        ]
+        summary_subject, body = render_summary(entries, subject, title="📋 Parallel Run Report")
+        if dispatcher is not None:
+            dispatcher.submit(summary_subject, body, recipients_file, credentials_file, "html")
+        else:
+            send_email(summary_subject, body, recipients_file, credentials_file, "html", pool=pool)
+    return results
+
+
+# ---------------------------------------------------------------------------- #
+#                                   Async API                                  #
+# ---------------------------------------------------------------------------- #
+
+
+class AsyncSMTPConnection:
+    """
+    Minimal SMTP client built on asyncio streams, so sending never blocks the event loop.
+
+    Several messages can be sent over one session, and the envelope commands of each
+    message are pipelined in a single write when the server advertises PIPELINING.
+
+    Parameters:
+    - host (str): SMTP server host name.
+    - port (int): SMTP server port.
+    - sender_email (str): Account used to log in. No login is done if None.
+    - sender_password (str): Password for the account. No login is done if None.
+    - use_tls (bool): Whether to upgrade the session with STARTTLS (default is True).
+    - timeout (float): Timeout in seconds for each server reply (default is 30).
+    """
+
+    def __init__(
+        self,
+        host: str = "smtp.gmail.com",
+        port: int = 587,
+        sender_email: Optional[str] = None,
+        sender_password: Optional[str] = None,
+        use_tls: bool = True,
+        timeout: float = 30.0,
+    ):
+        self.host = host
+        self.port = port
+        self.sender_email = sender_email
+        self.sender_password = sender_password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.extensions: dict[str, str] = {}
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def _read_reply(self) -> tuple[int, str]:
+        lines = []
+        while True:
+            try:
+                line = await asyncio.wait_for(self._reader.readline(), self.timeout)
+            except asyncio.TimeoutError:
+                raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed: timed out")
+            if not line:
+                raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed.")
+            line = line.decode("utf-8", "replace").rstrip("\r\n")
+            lines.append(line[4:])
+            if line[3:4] != "-":
+                return int(line[:3]), "\n".join(lines)
+
+    async def _command(self, command: str, expected: tuple = (250,)) -> tuple[int, str]:
+        self._writer.write(command.encode("utf-8") + b"\r\n")
+        await self._writer.drain()
+        code, reply = await self._read_reply()
+        if code not in expected:
+            raise smtplib.SMTPResponseException(code, reply)
+        return code, reply
+
+    async def _ehlo(self) -> None:
+        _, reply = await self._command(f"EHLO {socket.getfqdn()}")
+        self.extensions = {}
+        for line in reply.split("\n")[1:]:
+            name, _, value = line.partition(" ")
+            self.extensions[name.lower()] = value
+
+    async def connect(self) -> None:
+        """
+        Opens the session: greeting, EHLO, optional STARTTLS and login.
+        """
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        code, reply = await self._read_reply()
+        if code != 220:
+            raise smtplib.SMTPConnectError(code, reply)
+        await self._ehlo()
+        if self.use_tls:
+            await self._command("STARTTLS", expected=(220,))
+            loop = asyncio.get_running_loop()
+            protocol = self._writer.transport.get_protocol()
+            transport = await loop.start_tls(
+                self._writer.transport, protocol, ssl.create_default_context(), server_hostname=self.host
+            )
+            self._writer = asyncio.StreamWriter(transport, protocol, self._reader, loop)
+            await self._ehlo()
+        if self.sender_email is not None and self.sender_password is not None:
+            await self._login()
+
+    async def _login(self) -> None:
+        methods = self.extensions.get("auth", "").upper().split()
+        if "PLAIN" not in methods and "LOGIN" in methods:
+            await self._command("AUTH LOGIN", expected=(334,))
+            await self._command(base64.b64encode(self.sender_email.encode()).decode(), expected=(334,))
+            await self._command(base64.b64encode(self.sender_password.encode()).decode(), expected=(235,))
+            return
+        token = base64.b64encode(f"\0{self.sender_email}\0{self.sender_password}".encode()).decode()
+        await self._command(f"AUTH PLAIN {token}", expected=(235,))
+
+    async def noop(self) -> bool:
+        """
+        Checks whether the session is still usable.
+        """
+        try:
+            await self._command("NOOP")
+            return True
+        except Exception:
+            return False
+
+    async def sendmail(self, from_addr: str, to_addrs: list[str], msg: str) -> dict:
+        """
+        Sends one message over the open session.
+
+        Returns:
+        - dict: Recipients refused by the server, mapped to their (code, reply).
+        """
+        commands = [f"MAIL FROM:<{from_addr}>"] + [f"RCPT TO:<{address}>" for address in to_addrs]
+        if "pipelining" in self.extensions:
+            self._writer.write("".join(f"{command}\r\n" for command in commands + ["DATA"]).encode())
+            await self._writer.drain()
+            replies = [await self._read_reply() for _ in range(len(commands) + 1)]
+        else:
+            replies = []
+            for command in commands + ["DATA"]:
+                self._writer.write(command.encode() + b"\r\n")
+                await self._writer.drain()
+                replies.append(await self._read_reply())
+                if replies[-1][0] >= 400 and command.startswith("MAIL"):
+                    break
+        if replies[0][0] != 250:
+            await self._command("RSET")
+            raise smtplib.SMTPSenderRefused(replies[0][0], replies[0][1], from_addr)
+        refused = {
+            address: reply for address, reply in zip(to_addrs, replies[1:-1]) if reply[0] not in (250, 251)
+        }
+        data_reply = replies[-1] if len(replies) == len(commands) + 1 else (503, "DATA not sent")
+        if len(refused) == len(to_addrs) or data_reply[0] != 354:
+            if data_reply[0] == 354:
+                # The server is waiting for content we no longer want to send
+                self._writer.write(b".\r\n")
+                await self._writer.drain()
+                await self._read_reply()
+            await self._command("RSET")
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+        # Normalize line endings and escape lines starting with a period
+        data = re.sub(r"(?:\r\n|\n|\r(?!\n))", "\r\n", msg)
+        data = re.sub(r"(?m)^\.", "..", data)
+        if not data.endswith("\r\n"):
+            data += "\r\n"
+        self._writer.write(data.encode("utf-8") + b".\r\n")
+        await self._writer.drain()
+        code, reply = await self._read_reply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, reply)
+        return refused
+
+    async def close(self) -> None:
+        """
+        Ends the session politely, ignoring errors from an already broken connection.
+        """
+        if self._writer is None:
+            return
+        try:
+            await self._command("QUIT", expected=(221,))
+        except Exception:
+            pass
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except Exception:
+            pass
+        self._writer = None
+
+
+class AsyncSMTPConnectionPool:
+    """
+    Asyncio counterpart of `SMTPConnectionPool`. Must be used from a single event loop.
+
+    Parameters are the same as for `SMTPConnectionPool`. Waiting for the rate limiter
+    suspends the calling task instead of blocking the loop.
+    """
+
+    def __init__(
+        self,
+        host: str = "smtp.gmail.com",
+        port: int = 587,
+        sender_email: Optional[str] = None,
+        sender_password: Optional[str] = None,
+        size: int = 2,
+        use_tls: bool = True,
+        timeout: float = 30.0,
+        health_check_interval: float = 5.0,
+        max_idle: float = 240.0,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1.")
+        self.host = host
+        self.port = port
+        self.sender_email = sender_email
+        self.sender_password = sender_password
+        self.size = size
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.max_idle = max_idle
+        self.rate_limiter = rate_limiter
+        self._idle: list[tuple[AsyncSMTPConnection, float]] = []
+        self._slots = asyncio.Semaphore(size)
+        self._closed = False
+
+    async def acquire(self) -> AsyncSMTPConnection:
+        """
+        Returns a ready-to-use connection, reusing an idle one when possible.
+        """
+        if self._closed:
+            raise RuntimeError("SMTP connection pool is closed.")
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                connection, released_at = self._idle.pop()
+                idle_for = time.monotonic() - released_at
+                if idle_for <= self.max_idle and (
+                    idle_for < self.health_check_interval or await connection.noop()
+                ):
+                    return connection
+                await connection.close()
+            connection = AsyncSMTPConnection(
+                self.host, self.port, self.sender_email, self.sender_password, self.use_tls, self.timeout
+            )
+            await connection.connect()
+            return connection
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, connection: AsyncSMTPConnection, discard: bool = False) -> None:
         """
-        send_email(subject, body, recipients_file, credentials_file, text_type)
+        Returns a connection to the pool, or closes it if `discard` is True.
+        """
+        if discard or self._closed:
+            await connection.close()
+        else:
+            self._idle.append((connection, time.monotonic()))
+        self._slots.release()
+
+    @asynccontextmanager
+    async def connection(self):
+        """
+        Async context manager that acquires a connection and releases it afterwards.
+        Connections that raised an SMTP or socket error are discarded.
+        """
+        connection = await self.acquire()
+        try:
+            yield connection
+        except (smtplib.SMTPServerDisconnected, OSError):
+            await self.release(connection, discard=True)
+            raise
+        except BaseException:
+            await self.release(connection)
+            raise
+        else:
+            await self.release(connection)
+
+    async def sendmail(self, from_addr: str, to_addrs: list[str], msg: str) -> dict:
+        """
+        Sends a message over a pooled connection, reconnecting once if the server dropped it.
+        """
+        await self._wait_for_rate_limit()
+        try:
+            async with self.connection() as connection:
+                return await connection.sendmail(from_addr, to_addrs, msg)
+        except smtplib.SMTPServerDisconnected:
+            async with self.connection() as connection:
+                return await connection.sendmail(from_addr, to_addrs, msg)
+
+    async def _wait_for_rate_limit(self) -> None:
+        limiter = self.rate_limiter
+        if limiter is None:
+            return
+        deadline = None if limiter.max_wait is None else time.monotonic() + limiter.max_wait
+        waited = False
+        while not limiter.try_acquire():
+            wait = limiter.wait_time()
+            if deadline is not None and time.monotonic() + wait > deadline:
+                limiter.dropped += 1
+                raise RateLimitExceeded("Email rate limit exhausted, message dropped.")
+            waited = True
+            await asyncio.sleep(wait)
+        limiter.deferred += waited
+
+    async def close(self) -> None:
+        """
+        Closes all idle connections and refuses further acquisitions.
+        """
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            await connection.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+_ASYNC_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+
+
+def get_async_smtp_pool(
+    host: str = "smtp.gmail.com",
+    port: int = 587,
+    sender_email: Optional[str] = None,
+    sender_password: Optional[str] = None,
+    size: int = 2,
+    use_tls: bool = True,
+) -> AsyncSMTPConnectionPool:
+    """
+    Returns the shared async pool for a server and account on the running event loop,
+    creating it on first use. Parameters are the same as for `get_smtp_pool`.
+    """
+    pools = _ASYNC_POOLS.setdefault(asyncio.get_running_loop(), {})
+    key = (host, port, sender_email, sender_password, use_tls)
+    pool = pools.get(key)
+    if pool is None or pool._closed:
+        pool = AsyncSMTPConnectionPool(host, port, sender_email, sender_password, size, use_tls)
+        pools[key] = pool
+    return pool
+
+
+async def asend_emails(
+    emails: list[tuple[str, str]],
+    recipients_file: RecipientsSource,
+    credentials_file: CredentialsSource,
+    text_type: str = "plain",
+    smtp_server: str = "smtp.gmail.com",
+    smtp_port: int = 587,
+    pool: Optional[AsyncSMTPConnectionPool] = None,
+    per_recipient: bool = False,
+    concurrency: int = 4,
+) -> list[Optional[Exception]]:
+    """
+    Sends several emails concurrently without blocking the event loop.
+
+    Messages are split across at most `concurrency` connections, and each connection sends
+    its share back to back over the same session.
+
+    Parameters:
+    - emails (list): (subject, body) pairs to send.
+    - recipients_file (str | dict | list | None): Source accepted by `get_recipient_emails`.
+    - credentials_file (str | dict | tuple | None): Source accepted by `get_credentials`.
+    - text_type (str): The type of text content (default is "plain").
+    - smtp_server (str): SMTP server host name (default is "smtp.gmail.com").
+    - smtp_port (int): SMTP server port (default is 587).
+    - pool (AsyncSMTPConnectionPool): Pool to send through. Defaults to the shared pool
+      for the server and sender account on the running loop.
+    - per_recipient (bool): Send a separate copy of each email to every recipient instead of
+      one email addressed to all of them (default is False).
+    - concurrency (int): Maximum number of connections used at once (default is 4).
+
+    Returns:
+    - list: One entry per sent message, None on success or the exception that made it fail.
+    """
+    sender_email, sender_password = get_credentials(credentials_file)
+    recipient_emails = get_recipient_emails(recipients_file)
+    if pool is None:
+        pool = get_async_smtp_pool(
+            smtp_server, smtp_port, sender_email, sender_password, size=max(1, concurrency)
+        )
+
+    envelopes = [
+        (to_addrs, _compose_message(subject, body, sender_email, to_addrs, text_type))
+        for subject, body in emails
+        for to_addrs in ([[address] for address in recipient_emails] if per_recipient else [recipient_emails])
+    ]
+    results: list[Optional[Exception]] = [None] * len(envelopes)
+    pending = iter(range(len(envelopes)))
+
+    async def worker() -> None:
+        # Each worker holds one connection and drains the shared iterator through it
+        index = next(pending, None)
+        while index is not None:
+            try:
+                async with pool.connection() as connection:
+                    while index is not None:
+                        to_addrs, message = envelopes[index]
+                        try:
+                            await pool._wait_for_rate_limit()
+                            await connection.sendmail(sender_email, to_addrs, message)
+                        except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused, RateLimitExceeded) as e:
+                            # The server rejected this message but the session is still usable
+                            results[index] = e
+                        index = next(pending, None)
+            except Exception as e:
+                # The connection broke, record the failure and continue on a fresh one
+                results[index] = e
+                index = next(pending, None)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(envelopes))))))
+    return results
+
+
+async def asend_email(
+    subject: str,
+    body: str,
+    recipients_file: RecipientsSource,
+    credentials_file: CredentialsSource,
+    text_type: str = "plain",
+    smtp_server: str = "smtp.gmail.com",
+    smtp_port: int = 587,
+    pool: Optional[AsyncSMTPConnectionPool] = None,
+    per_recipient: bool = False,
+    concurrency: int = 4,
+) -> None:
+    """
+    Asyncio counterpart of `send_email`. Errors are reported the same way, without raising.
+
+    Parameters are the same as for `send_email`, plus `per_recipient` and `concurrency`
+    as described in `asend_emails`.
+    """
+    try:
+        results = await asend_emails(
+            [(subject, body)],
+            recipients_file,
+            credentials_file,
+            text_type,
+            smtp_server,
+            smtp_port,
+            pool,
+            per_recipient,
+            concurrency,
+        )
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return
+    except Exception as e:
+        print(f"[ERROR] Failed to send email: {e}")
+        return
+    errors = [error for error in results if error is not None]
+    if errors:
+        print(f"[ERROR] Failed to send email: {errors[0]}")
+    else:
+        print("[INFO] Email sent successfully.")
+
+
+async def arun_with_notification(
+    func,
+    func_args: tuple,
+    func_kwargs: dict,
+    recipients_file: RecipientsSource,
+    credentials_file: CredentialsSource,
+    subject_success: str = "🎉 Task Completed Successfully",
+    body_success: Union[str, NotificationTemplate] = SUCCESS_BODY,
+    text_type: str = "plain",
+    pool: Optional[AsyncSMTPConnectionPool] = None,
+) -> TaskResult:
+    """
+    Awaits a coroutine function and sends an email notification upon completion or error.
+
+    Parameters are the same as for `run_with_notification`, except that `func` must be a
+    coroutine function and `pool` is an `AsyncSMTPConnectionPool`.
+
+    Returns:
+    - TaskResult: The return value or exception of the coroutine and its wall and CPU time.
+      The CPU time covers the whole process, including other tasks running on the loop.
+    """
+    task_result = TaskResult(getattr(func, "__name__", repr(func)), False)
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    try:
+        # Execute the provided coroutine
+        task_result.result = await func(*func_args, **func_kwargs)
+        task_result.succeeded = True
+    except Exception as e:
+        # Capture the error
+        task_result.error = e
+        task_result.traceback = traceback.format_exc()
+    task_result.wall_time = time.perf_counter() - start_wall
+    task_result.cpu_time = time.process_time() - start_cpu
+
+    values = template_values(task_result.task_name, task_result.wall_time)
+    if task_result.succeeded:
+        body = _as_template(body_success).render(values, escape=text_type == "html")
+        await asend_email(subject_success, body, recipients_file, credentials_file, text_type, pool=pool)
+        print("[INFO] Success email sent.")
+    else:
+        body = failure_body(task_result.traceback, values, escape=text_type == "html")
+        await asend_email(FAILURE_SUBJECT, body, recipients_file, credentials_file, text_type, pool=pool)
         print("[INFO] Error email sent.")
+    return task_result
 
 
 # Example usage
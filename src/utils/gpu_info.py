@@ -3,40 +3,107 @@
 #                           github.com/MatheusFS-dev                           #
 # ---------------------------------------------------------------------------- #    
 
-import tensorflow as tf
+import glob
+import hashlib
+import importlib.util
+import json
 import os
+import platform
+import shutil
+import sys
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
 
-def get_gpu_info():
+if TYPE_CHECKING:
+    import numpy as np
+
+# Roots of the kernel interfaces read by the inventory probes
+PROC_ROOT = "/proc"
+SYS_ROOT = "/sys"
+
+# Directory of the on-disk inventory cache, one file per boot
+INVENTORY_CACHE_DIR = os.environ.get(
+    "GPU_INFO_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "gpu_info")
+)
+
+# Format of the cached inventory, part of its file name so that older caches are ignored
+INVENTORY_VERSION = 2
+
+# PCI vendor IDs of the GPUs listed from /sys/class/drm; other display devices, such as
+# the onboard VGA of a server's BMC, are not accelerators and are skipped
+PCI_VENDORS = {"0x10de": "nvidia", "0x1002": "amd", "0x8086": "intel"}
+
+# Distributions whose versions are listed in the environment report
+REPORT_PACKAGES = ("tensorflow", "numpy", "matplotlib", "seaborn", "pynvml", "psutil")
+
+
+def _tensorflow():
+    """
+    Imports TensorFlow on first use, so that importing this module stays cheap.
+    """
+    import tensorflow as tf
+
+    return tf
+
+
+def _numpy():
+    """
+    Imports NumPy on first use, as only the resource monitor needs it.
+    """
+    import numpy as np
+
+    return np
+
+
+def get_gpu_info(refresh: bool = False) -> "EnvironmentReport":
     """
     Retrieves and prints detailed GPU information including TensorFlow,
     CUDA, cuDNN versions, number of GPUs, and memory details.
+
+    The information comes from `get_environment_report`, so repeated calls are cached.
+
+    Parameters:
+    - refresh (bool): Collect the report again instead of using the cache. Default is False.
+
+    Returns:
+    - EnvironmentReport: The structured report that was printed.
     """
-    # Display TensorFlow version
-    print(f"TensorFlow Version: {tf.__version__}")
+    report = get_environment_report(refresh=refresh)
+    tf_info = report.tensorflow
 
-    # Check if TensorFlow is built with CUDA support and retrieve build info
-    if tf.test.is_built_with_cuda():
-        build_info = tf.sysconfig.get_build_info()
-        print(f"TensorFlow is built with CUDA support")
-        print(f"CUDA Version: {build_info['cuda_version']}")
-        print(f"cuDNN Version: {build_info['cudnn_version']}")
+    if tf_info is None:
+        print("TensorFlow is not installed")
     else:
-        print("Running on CPU (No CUDA support detected)")
+        # Display TensorFlow version
+        print(f"TensorFlow Version: {tf_info['version']}")
+
+        # Check if TensorFlow is built with CUDA support and retrieve build info
+        if tf_info["built_with_cuda"]:
+            print(f"TensorFlow is built with CUDA support")
+            print(f"CUDA Version: {tf_info['cuda_version']}")
+            print(f"cuDNN Version: {tf_info['cudnn_version']}")
+        else:
+            print("Running on CPU (No CUDA support detected)")
 
     # Detect available GPUs
-    gpus = tf.config.list_physical_devices("GPU")
+    gpus = tf_info["gpus"] if tf_info is not None else [device["name"] for device in report.visible_devices]
     if gpus:
         print(f"\nNumber of GPUs detected: {len(gpus)}")
-        print(f"Available GPU(s): {[gpu.name for gpu in gpus]}\n")
-        tf.test.gpu_device_name()
+        print(f"Available GPU(s): {gpus}\n")
     else:
         print("No GPUs found")
         print("Running on CPU")
+    return report
 
 def enable_memory_growth():
     """
     Enables memory growth for all detected GPUs.
     """
+    tf = _tensorflow()
     gpus = tf.config.list_physical_devices('GPU')
     if gpus:
         for i, gpu in enumerate(gpus):
@@ -46,9 +113,937 @@ def enable_memory_growth():
             except RuntimeError as e:
                 print(f"Error enabling memory growth for GPU {i}: {gpu.name}, {e}")
 
+
+@dataclass(frozen=True)
+class GPUDevice:
+    """
+    One physical accelerator, as reported by the kernel driver or nvidia-smi.
+
+    `index` is the CUDA device index for NVIDIA devices and the DRM card number for others.
+    """
+
+    index: int
+    name: str
+    vendor: str
+    pci_bus_id: Optional[str] = None
+    uuid: Optional[str] = None
+    memory_total_mb: Optional[float] = None
+    driver: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class GPUInventory:
+    """
+    The accelerators of this machine, found without importing TensorFlow.
+
+    `devices` lists every physical device; `visible_devices` applies the
+    CUDA_VISIBLE_DEVICES of the current process to the NVIDIA devices, so one cached
+    inventory serves processes with different device masks.
+    """
+
+    devices: Tuple[GPUDevice, ...] = ()
+    driver_version: Optional[str] = None
+    sources: Tuple[str, ...] = ()
+    boot_id: Optional[str] = None
+
+    @property
+    def count(self) -> int:
+        return len(self.devices)
+
+    @property
+    def visible_devices(self) -> Tuple[GPUDevice, ...]:
+        nvidia = [device for device in self.devices if device.vendor == "nvidia"]
+        mask = os.environ.get("CUDA_VISIBLE_DEVICES")
+        if mask is None:
+            return tuple(nvidia)
+        visible = []
+        for entry in (item.strip() for item in mask.split(",")):
+            # CUDA stops at the first invalid entry, so "-1" or "" hides every device
+            match = [
+                device for device in nvidia
+                if entry == str(device.index) or (entry.startswith("GPU-") and (device.uuid or "").startswith(entry))
+            ]
+            if not match:
+                break
+            visible.append(match[0])
+        return tuple(visible)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GPUInventory":
+        return cls(
+            devices=tuple(GPUDevice(**device) for device in data.get("devices", ())),
+            driver_version=data.get("driver_version"),
+            sources=tuple(data.get("sources", ())),
+            boot_id=data.get("boot_id"),
+        )
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path) as file:
+            return file.read().strip()
+    except OSError:
+        return None
+
+
+def _probe_proc_nvidia() -> Tuple[Optional[str], List[dict]]:
+    """
+    Reads the driver version and the GPUs registered by the NVIDIA kernel module.
+    """
+    version = _read(os.path.join(PROC_ROOT, "driver", "nvidia", "version")) or ""
+    driver_version = None
+    for word in version.split():
+        # "NVRM version: NVIDIA UNIX x86_64 Kernel Module  535.104.05  Sat Aug 19 ..."
+        if word.count(".") >= 1 and word.replace(".", "").isdigit():
+            driver_version = word
+            break
+
+    devices = []
+    for path in sorted(glob.glob(os.path.join(PROC_ROOT, "driver", "nvidia", "gpus", "*", "information"))):
+        fields = {}
+        for line in (_read(path) or "").splitlines():
+            key, _, value = line.partition(":")
+            fields[key.strip()] = value.strip()
+        minor = fields.get("Device Minor", "")
+        devices.append({
+            "index": int(minor) if minor.isdigit() else len(devices),
+            "name": fields.get("Model", "NVIDIA GPU"),
+            "vendor": "nvidia",
+            "pci_bus_id": fields.get("Bus Location") or os.path.basename(os.path.dirname(path)),
+            "uuid": fields.get("GPU UUID") or None,
+            "driver": "nvidia",
+        })
+    return driver_version, devices
+
+
+def _probe_sys_drm() -> List[dict]:
+    """
+    Lists the NVIDIA, AMD and Intel PCI devices in /sys/class/drm.
+    """
+    devices = []
+    for card in sorted(glob.glob(os.path.join(SYS_ROOT, "class", "drm", "card[0-9]*"))):
+        name = os.path.basename(card)
+        if not name[4:].isdigit():
+            continue  # Connectors such as card0-HDMI-A-1
+        device = os.path.join(card, "device")
+        vendor = PCI_VENDORS.get(_read(os.path.join(device, "vendor")) or "")
+        if vendor is None:
+            continue
+        uevent = dict(
+            line.partition("=")[::2] for line in (_read(os.path.join(device, "uevent")) or "").splitlines()
+        )
+        vram = _read(os.path.join(device, "mem_info_vram_total"))
+        devices.append({
+            "index": int(name[4:]),
+            "name": f"{vendor.upper()} {_read(os.path.join(device, 'device')) or name}",
+            "vendor": vendor,
+            "pci_bus_id": uevent.get("PCI_SLOT_NAME"),
+            "memory_total_mb": int(vram) / 1024 ** 2 if vram and vram.isdigit() else None,
+            "driver": uevent.get("DRIVER"),
+        })
+    return devices
+
+
+def _probe_nvidia_smi(timeout: float = 10.0) -> Tuple[Optional[str], List[dict]]:
+    """
+    Queries nvidia-smi when it is installed, for names and memory sizes.
+    """
+    executable = shutil.which("nvidia-smi")
+    if executable is None:
+        return None, []
+    query = "index,name,uuid,pci.bus_id,memory.total,driver_version"
+    try:
+        output = subprocess.run(
+            [executable, f"--query-gpu={query}", "--format=csv,noheader,nounits"],
+            capture_output=True, text=True, timeout=timeout, check=True,
+        ).stdout
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"[ERROR] nvidia-smi failed: {e}")
+        return None, []
+
+    driver_version = None
+    devices = []
+    for line in output.strip().splitlines():
+        values = [value.strip() for value in line.split(",")]
+        if len(values) != 6:
+            continue
+        index, name, uuid, bus_id, memory, driver_version = values
+        devices.append({
+            "index": int(index),
+            "name": name,
+            "vendor": "nvidia",
+            "pci_bus_id": bus_id,
+            "uuid": uuid,
+            "memory_total_mb": float(memory) if memory.replace(".", "").isdigit() else None,
+            "driver": "nvidia",
+        })
+    return driver_version, devices
+
+
+def _probe_inventory(use_nvidia_smi: bool) -> GPUInventory:
+    """
+    Merges every available probe into one inventory, richest source first.
+    """
+    sources = []
+    driver_version, nvidia = _probe_proc_nvidia()
+    if nvidia or driver_version:
+        sources.append("proc")
+    if use_nvidia_smi and (nvidia or driver_version):
+        smi_version, smi_devices = _probe_nvidia_smi()
+        if smi_devices:
+            sources.append("nvidia-smi")
+            driver_version = smi_version or driver_version
+            nvidia = smi_devices
+    devices = list(nvidia)
+
+    drm = _probe_sys_drm()
+    if drm:
+        sources.append("drm")
+    for card in drm:
+        # NVIDIA cards are already listed, with their CUDA indices, by the driver
+        if card["vendor"] == "nvidia" and nvidia:
+            continue
+        devices.append(card)
+
+    return GPUInventory(
+        devices=tuple(GPUDevice(**device) for device in devices),
+        driver_version=driver_version,
+        sources=tuple(sources),
+        boot_id=_read(os.path.join(PROC_ROOT, "sys", "kernel", "random", "boot_id")),
+    )
+
+
+_INVENTORY: Optional[GPUInventory] = None
+
+
+def get_gpu_inventory(refresh: bool = False, use_nvidia_smi: bool = True) -> GPUInventory:
+    """
+    Returns the accelerators of this machine without importing TensorFlow.
+
+    The inventory is read from /proc/driver/nvidia and /sys/class/drm, completed with
+    nvidia-smi when it is installed, and is empty on machines without a GPU. It is
+    computed once per process and stored on disk under INVENTORY_CACHE_DIR, keyed on the
+    kernel boot ID, so later processes on the same boot read it back without probing.
+
+    Parameters:
+    - refresh (bool): Probe again, replacing both caches. Default is False.
+    - use_nvidia_smi (bool): Query nvidia-smi when present. Default is True.
+
+    Returns:
+    - GPUInventory: The devices found; see `visible_devices` for CUDA_VISIBLE_DEVICES.
+    """
+    global _INVENTORY
+    if _INVENTORY is not None and not refresh:
+        return _INVENTORY
+
+    boot_id = _read(os.path.join(PROC_ROOT, "sys", "kernel", "random", "boot_id"))
+    cache_path = os.path.join(INVENTORY_CACHE_DIR, f"inventory-v{INVENTORY_VERSION}-{boot_id}.json") if boot_id else None
+    if cache_path and not refresh:
+        try:
+            with open(cache_path) as file:
+                _INVENTORY = GPUInventory.from_dict(json.load(file))
+            return _INVENTORY
+        except (OSError, ValueError, TypeError):
+            pass
+
+    _INVENTORY = _probe_inventory(use_nvidia_smi)
+    if cache_path:
+        try:
+            os.makedirs(INVENTORY_CACHE_DIR, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=INVENTORY_CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "w") as file:
+                json.dump(_INVENTORY.to_dict(), file)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"[ERROR] Could not write the GPU inventory cache: {e}")
+    return _INVENTORY
+
+
+@dataclass(frozen=True)
+class DeviceLoad:
+    """
+    The load of one GPU at probe time; unknown values are NaN or None.
+    """
+
+    index: int
+    utilization_percent: float
+    memory_used_mb: float
+    memory_total_mb: Optional[float] = None
+
+    @property
+    def memory_free_mb(self) -> Optional[float]:
+        if self.memory_total_mb is None:
+            return None
+        return self.memory_total_mb - self.memory_used_mb
+
+
+@dataclass(frozen=True)
+class DevicePlacement:
+    """
+    The devices and memory budget given to a process by `configure_devices`.
+
+    An empty `devices` tuple means the process runs on the CPU.
+    """
+
+    devices: Tuple[int, ...] = ()
+    memory_limit_mb: Optional[float] = None
+    cuda_visible_devices: Optional[str] = None
+
+    @property
+    def uses_gpu(self) -> bool:
+        return bool(self.devices)
+
+
+class _GPUProbe:
+    """
+    Reads the utilization and memory use of the visible NVIDIA GPUs, through NVML when
+    pynvml is installed and through nvidia-smi otherwise.
+    """
+
+    def __init__(self, devices: Sequence[GPUDevice]):
+        self.devices = list(devices)
+        self.handles = None
+        try:
+            import pynvml
+
+            pynvml.nvmlInit()
+            self.nvml = pynvml
+            self.handles = [pynvml.nvmlDeviceGetHandleByIndex(device.index) for device in self.devices]
+        except Exception:
+            self.nvml = None
+            self.smi = shutil.which("nvidia-smi")
+
+    @property
+    def available(self) -> bool:
+        return bool(self.devices) and (self.handles is not None or self.smi is not None)
+
+    def read_devices(self) -> List["DeviceLoad"]:
+        """
+        Returns the current load of every probed device.
+        """
+        if self.handles is not None:
+            loads = []
+            for device, handle in zip(self.devices, self.handles):
+                memory = self.nvml.nvmlDeviceGetMemoryInfo(handle)
+                loads.append(DeviceLoad(
+                    index=device.index,
+                    utilization_percent=float(self.nvml.nvmlDeviceGetUtilizationRates(handle).gpu),
+                    memory_used_mb=memory.used / 1024 ** 2,
+                    memory_total_mb=memory.total / 1024 ** 2,
+                ))
+            return loads
+        output = subprocess.run(
+            [self.smi, "--query-gpu=index,utilization.gpu,memory.used,memory.total",
+             "--format=csv,noheader,nounits", "--id=" + ",".join(str(device.index) for device in self.devices)],
+            capture_output=True, text=True, timeout=10, check=True,
+        ).stdout
+        rows = [[value.strip() for value in line.split(",")] for line in output.strip().splitlines()]
+        return [
+            DeviceLoad(int(row[0]), float(row[1]), float(row[2]), float(row[3]))
+            for row in rows
+            if len(row) == 4
+        ]
+
+    def read(self) -> Tuple[float, float]:
+        """
+        Returns the mean utilization in percent and the total memory used in MB.
+        """
+        np = _numpy()
+        loads = self.read_devices()
+        if not loads:
+            return np.nan, np.nan
+        return (
+            float(np.mean([load.utilization_percent for load in loads])),
+            float(np.sum([load.memory_used_mb for load in loads])),
+        )
+
+
+class ResourceMonitor:
+    """
+    Samples CPU, memory, I/O and GPU usage on a background thread.
+
+    Samples are stored in a fixed-size ring buffer backed by a NumPy array with one column
+    per entry of FIELDS, so a monitor can stay attached to a long job at constant memory;
+    the oldest samples are overwritten once `capacity` is reached. Process metrics refer
+    to the current process. Values come from /proc on Linux and are NaN where a source is
+    not available, and rates are NaN for the first sample.
+
+    Example:
+        >>> with ResourceMonitor(interval=0.5) as monitor:
+        ...     train()
+        >>> print(monitor.summary()["rss_mb"]["peak"])
+        >>> monitor.plot(["process_cpu_percent", "system_cpu_percent"], save_path="cpu.png")
+    """
+
+    FIELDS = (
+        "time",
+        "process_cpu_percent",
+        "system_cpu_percent",
+        "rss_mb",
+        "system_memory_percent",
+        "read_mb_s",
+        "write_mb_s",
+        "gpu_util_percent",
+        "gpu_memory_mb",
+    )
+
+    def __init__(self, interval: float = 1.0, capacity: int = 3600, gpu: Optional[bool] = None):
+        """
+        Parameters:
+        - interval (float): Seconds between samples. Default is 1.0.
+        - capacity (int): Number of samples kept in the ring buffer. Default is 3600.
+        - gpu (Optional[bool]): Sample the visible NVIDIA GPUs. By default they are sampled
+          when `get_gpu_inventory` finds any.
+        """
+        np = _numpy()
+        self.interval = interval
+        self.capacity = capacity
+        self._buffer = np.full((capacity, len(self.FIELDS)), np.nan)
+        self._count = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._start_time = time.monotonic()
+        self._previous = None
+        self._page_mb = os.sysconf("SC_PAGE_SIZE") / 1024 ** 2 if hasattr(os, "sysconf") else np.nan
+
+        devices = get_gpu_inventory().visible_devices if gpu is not False else ()
+        self._gpu = _GPUProbe(devices) if devices else None
+        if gpu and (self._gpu is None or not self._gpu.available):
+            print("[INFO] No GPU to monitor, GPU columns will stay empty")
+
+    def _counters(self) -> dict:
+        counters = {"wall": time.monotonic()}
+        times = os.times()
+        counters["process_cpu"] = times.user + times.system
+
+        fields = (_read(os.path.join(PROC_ROOT, "stat")) or "").split("\n", 1)[0].split()[1:]
+        if fields:
+            values = [float(value) for value in fields]
+            counters["system_total"] = sum(values[:8])
+            counters["system_idle"] = values[3] + (values[4] if len(values) > 4 else 0)
+
+        io = dict(
+            line.split(": ", 1) for line in (_read(os.path.join(PROC_ROOT, "self", "io")) or "").splitlines()
+        )
+        if "read_bytes" in io:
+            counters["read_bytes"] = float(io["read_bytes"])
+            counters["write_bytes"] = float(io["write_bytes"])
+        return counters
+
+    def sample(self) -> "np.ndarray":
+        """
+        Takes one sample now, stores it and returns it as a row ordered like FIELDS.
+        """
+        np = _numpy()
+        counters = self._counters()
+        row = np.full(len(self.FIELDS), np.nan)
+        row[0] = counters["wall"] - self._start_time
+
+        previous = self._previous
+        if previous is not None:
+            elapsed = counters["wall"] - previous["wall"]
+            if elapsed > 0:
+                row[1] = 100 * (counters["process_cpu"] - previous["process_cpu"]) / elapsed
+                if "read_bytes" in counters:
+                    row[5] = (counters["read_bytes"] - previous["read_bytes"]) / 1024 ** 2 / elapsed
+                    row[6] = (counters["write_bytes"] - previous["write_bytes"]) / 1024 ** 2 / elapsed
+            if "system_total" in counters:
+                total = counters["system_total"] - previous["system_total"]
+                if total > 0:
+                    row[2] = 100 * (1 - (counters["system_idle"] - previous["system_idle"]) / total)
+        self._previous = counters
+
+        statm = (_read(os.path.join(PROC_ROOT, "self", "statm")) or "").split()
+        if len(statm) > 1:
+            row[3] = int(statm[1]) * self._page_mb
+        memory = {}
+        for line in (_read(os.path.join(PROC_ROOT, "meminfo")) or "").splitlines():
+            key, _, value = line.partition(":")
+            memory[key] = float(value.split()[0]) if value.split() else np.nan
+        if memory.get("MemTotal") and "MemAvailable" in memory:
+            row[4] = 100 * (1 - memory["MemAvailable"] / memory["MemTotal"])
+
+        if self._gpu is not None and self._gpu.available:
+            try:
+                row[7], row[8] = self._gpu.read()
+            except Exception as e:
+                print(f"[ERROR] GPU sampling failed, disabling it: {e}")
+                self._gpu = None
+
+        with self._lock:
+            self._buffer[self._count % self.capacity] = row
+            self._count += 1
+        return row
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def start(self) -> "ResourceMonitor":
+        """
+        Starts sampling on a daemon thread.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self.sample()
+            self._thread = threading.Thread(target=self._run, name="ResourceMonitor", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops sampling after taking a final sample.
+        """
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+            self.sample()
+
+    def __enter__(self) -> "ResourceMonitor":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def samples(self) -> "np.ndarray":
+        """
+        Returns a copy of the stored samples, oldest first, as a (samples, FIELDS) array.
+        """
+        np = _numpy()
+        with self._lock:
+            if self._count <= self.capacity:
+                return self._buffer[:self._count].copy()
+            return np.roll(self._buffer, -(self._count % self.capacity), axis=0)
+
+    def timeline(self) -> Dict[str, "np.ndarray"]:
+        """
+        Returns one array per field, oldest first; "time" is in seconds since creation.
+        """
+        samples = self.samples()
+        return {name: samples[:, i] for i, name in enumerate(self.FIELDS)}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the peak, mean and 95th percentile of every field, ignoring missing values.
+        """
+        np = _numpy()
+        samples = self.samples()
+        summary = {}
+        for i, name in enumerate(self.FIELDS[1:], start=1):
+            values = samples[:, i][~np.isnan(samples[:, i])]
+            summary[name] = {
+                "peak": float(values.max()) if values.size else np.nan,
+                "mean": float(values.mean()) if values.size else np.nan,
+                "p95": float(np.percentile(values, 95)) if values.size else np.nan,
+            }
+        return summary
+
+    def plot(self, fields: Sequence[str] = ("process_cpu_percent", "system_cpu_percent"), **kwargs):
+        """
+        Draws the timeline of some fields with `plot_api.plot_scientific`.
+
+        Parameters:
+        - fields (Sequence[str]): Fields to draw, sharing one Y-axis.
+        - **kwargs: Passed on to `plot_scientific`, e.g. save_path or headless.
+
+        Returns:
+        - The return value of `plot_scientific`.
+        """
+        from . import plot_api
+
+        timeline = self.timeline()
+        kwargs.setdefault("labels", list(fields))
+        kwargs.setdefault("x_label", "Time (s)")
+        kwargs.setdefault("title", "Resource Usage")
+        return plot_api.plot_scientific(timeline["time"], [timeline[name] for name in fields], **kwargs)
+
+
+# A probe returns the current load of the candidate devices
+DeviceProbe = Callable[[], Sequence[DeviceLoad]]
+
+
+def probe_device_load() -> List[DeviceLoad]:
+    """
+    Default probe: the load of the visible NVIDIA GPUs, through NVML or nvidia-smi.
+
+    Devices that cannot be queried are reported with an unknown (NaN) load, and the
+    result is empty on machines without a GPU.
+
+    Returns:
+    - List[DeviceLoad]: One entry per visible device, by physical CUDA index.
+    """
+    devices = get_gpu_inventory().visible_devices
+    if not devices:
+        return []
+    probe = _GPUProbe(devices)
+    if probe.available:
+        try:
+            return probe.read_devices()
+        except (OSError, subprocess.SubprocessError, ValueError) as e:
+            print(f"[ERROR] Could not read the GPU load: {e}")
+    return [
+        DeviceLoad(device.index, float("nan"), float("nan"), device.memory_total_mb)
+        for device in devices
+    ]
+
+
+def _load_key(load: DeviceLoad) -> Tuple[float, float, int]:
+    # Unknown loads rank after known ones; without any load, devices keep their index order
+    def known(value: Optional[float]) -> float:
+        return float("inf") if value is None or value != value else value
+
+    memory = known(load.memory_used_mb)
+    if load.memory_total_mb:
+        memory /= load.memory_total_mb
+    return memory, known(load.utilization_percent), load.index
+
+
+def select_devices(
+    count: Optional[int] = 1,
+    probe: Optional[DeviceProbe] = None,
+    min_free_mb: Optional[float] = None,
+) -> List[int]:
+    """
+    Picks the least-loaded GPUs, by memory in use and then by utilization.
+
+    Parameters:
+    - count (Optional[int]): Number of devices to pick, or None for every device ordered
+      from least to most loaded. Default is 1.
+    - probe (Optional[DeviceProbe]): Callable returning the candidate DeviceLoad entries.
+      Defaults to `probe_device_load`.
+    - min_free_mb (Optional[float]): Skip devices with less free memory. Default is None.
+
+    Returns:
+    - List[int]: Physical CUDA indices, least loaded first; empty without a GPU.
+    """
+    loads = list((probe or probe_device_load)())
+    if min_free_mb is not None:
+        loads = [load for load in loads if load.memory_free_mb is None or load.memory_free_mb >= min_free_mb]
+    ordered = [load.index for load in sorted(loads, key=_load_key)]
+    return ordered if count is None else ordered[:count]
+
+
+def assign_devices(
+    num_workers: int,
+    devices_per_worker: int = 1,
+    devices: Optional[Sequence[int]] = None,
+    probe: Optional[DeviceProbe] = None,
+) -> List[Tuple[int, ...]]:
+    """
+    Spreads worker processes over the GPUs round-robin, least-loaded devices first.
+
+    Parameters:
+    - num_workers (int): Number of workers launched on this node.
+    - devices_per_worker (int): Devices given to each worker. Default is 1.
+    - devices (Optional[Sequence[int]]): Candidate devices. Defaults to every device,
+      ordered with `select_devices`.
+    - probe (Optional[DeviceProbe]): Probe used to order the devices.
+
+    Returns:
+    - List[Tuple[int, ...]]: The devices of each worker; empty tuples without a GPU.
+    """
+    devices = list(devices) if devices is not None else select_devices(None, probe)
+    if not devices:
+        return [() for _ in range(num_workers)]
+    per_worker = min(devices_per_worker, len(devices))
+    return [
+        tuple(devices[(worker * per_worker + offset) % len(devices)] for offset in range(per_worker))
+        for worker in range(num_workers)
+    ]
+
+
+def configure_devices(
+    devices: Sequence[int],
+    memory_limit_mb: Optional[float] = None,
+    memory_fraction: Optional[float] = None,
+    probe: Optional[DeviceProbe] = None,
+) -> DevicePlacement:
+    """
+    Restricts this process to some GPUs and optionally caps the memory it may use on each.
+
+    CUDA_VISIBLE_DEVICES (with PCI bus ordering, so indices match nvidia-smi) is set for
+    libraries that are not loaded yet. A memory budget is applied with TensorFlow's logical
+    device configuration, which must happen before TensorFlow initializes its GPUs; it
+    imports TensorFlow, which is otherwise left alone. Without devices this is a no-op
+    and the environment is not touched.
+
+    Parameters:
+    - devices (Sequence[int]): Physical CUDA indices, e.g. from `select_devices`.
+    - memory_limit_mb (Optional[float]): Memory budget per device in MB. Default is None.
+    - memory_fraction (Optional[float]): Memory budget as a fraction of the smallest
+      device's total memory, used when `memory_limit_mb` is not given. Default is None.
+    - probe (Optional[DeviceProbe]): Probe used to read device totals for `memory_fraction`.
+
+    Returns:
+    - DevicePlacement: The devices and budget that were applied.
+    """
+    devices = tuple(devices)
+    if not devices:
+        return DevicePlacement()
+
+    if memory_limit_mb is None and memory_fraction is not None:
+        totals = [
+            load.memory_total_mb for load in (probe or probe_device_load)()
+            if load.index in devices and load.memory_total_mb
+        ]
+        if totals:
+            memory_limit_mb = memory_fraction * min(totals)
+        else:
+            print("[ERROR] Device memory is unknown, memory_fraction is ignored")
+
+    visible = ",".join(str(index) for index in devices)
+    os.environ["CUDA_DEVICE_ORDER"] = "PCI_BUS_ID"
+    os.environ["CUDA_VISIBLE_DEVICES"] = visible
+
+    if memory_limit_mb is not None:
+        tf = _tensorflow()
+        for i, gpu in enumerate(tf.config.list_physical_devices("GPU")):
+            try:
+                tf.config.set_logical_device_configuration(
+                    gpu, [tf.config.LogicalDeviceConfiguration(memory_limit=int(memory_limit_mb))]
+                )
+                print(f"Memory limit of {int(memory_limit_mb)} MB set for GPU {i}: {gpu.name}")
+            except RuntimeError as e:
+                print(f"Error setting the memory limit for GPU {i}: {gpu.name}, {e}")
+    return DevicePlacement(devices, memory_limit_mb, visible)
+
+
+def place_worker(
+    worker_index: int,
+    num_workers: int,
+    devices_per_worker: int = 1,
+    memory_limit_mb: Optional[float] = None,
+    memory_fraction: Optional[float] = None,
+    probe: Optional[DeviceProbe] = None,
+) -> DevicePlacement:
+    """
+    Configures the devices of one of several workers launched on the same node.
+
+    Call it first thing in each worker process, before TensorFlow is imported. When the
+    budget is a fraction and several workers share a device, the fraction is divided
+    among them.
+
+    Parameters:
+    - worker_index (int): Index of this worker, from 0 to num_workers - 1.
+    - num_workers (int): Number of workers on this node.
+    - devices_per_worker (int): Devices given to each worker. Default is 1.
+    - memory_limit_mb (Optional[float]): Memory budget per device in MB. Default is None.
+    - memory_fraction (Optional[float]): Memory budget as a fraction of device memory,
+      shared by the workers placed on the same device. Default is None.
+    - probe (Optional[DeviceProbe]): Probe used to rank the devices.
+
+    Returns:
+    - DevicePlacement: The devices and budget of this worker.
+    """
+    loads = list((probe or probe_device_load)())
+    assignment = assign_devices(num_workers, devices_per_worker, probe=lambda: loads)
+    devices = assignment[worker_index % num_workers]
+    if memory_fraction is not None and devices:
+        sharing = max(sum(1 for other in assignment if set(other) & set(devices)), 1)
+        memory_fraction /= sharing
+    return configure_devices(devices, memory_limit_mb, memory_fraction, probe=lambda: loads)
+
+
+@dataclass
+class EnvironmentReport:
+    """
+    Machine-readable description of the software and hardware a job runs on.
+
+    Attributes:
+    - fingerprint (str): Hash of the interpreter, installed packages, boot and device mask
+      the report was collected for.
+    - python (dict): Version, implementation and executable of the interpreter.
+    - system (dict): Operating system, release, machine and host name.
+    - cpu (dict): Logical CPU count, model name and instruction set flags.
+    - packages (dict): Installed versions of REPORT_PACKAGES, None when missing.
+    - tensorflow (dict): Version, CUDA build info and GPU names seen by TensorFlow, or
+      None if TensorFlow is not installed or was not inspected.
+    - devices (list): Every physical GPU found by `get_gpu_inventory`, as dicts.
+    - visible_devices (list): The devices left visible by CUDA_VISIBLE_DEVICES.
+    - driver_version (str): NVIDIA driver version, if any.
+    """
+
+    fingerprint: str
+    python: dict = field(default_factory=dict)
+    system: dict = field(default_factory=dict)
+    cpu: dict = field(default_factory=dict)
+    packages: dict = field(default_factory=dict)
+    tensorflow: Optional[dict] = None
+    devices: list = field(default_factory=list)
+    visible_devices: list = field(default_factory=list)
+    driver_version: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "EnvironmentReport":
+        return cls(**data)
+
+    def summary(self) -> dict:
+        """
+        Returns the few values worth showing next to a result, as a flat dict.
+        """
+        tf_info = self.tensorflow or {}
+        return {
+            "host": self.system.get("hostname"),
+            "python": self.python.get("version"),
+            "tensorflow": tf_info.get("version"),
+            "cuda": tf_info.get("cuda_version"),
+            "cudnn": tf_info.get("cudnn_version"),
+            "gpus": ", ".join(device["name"] for device in self.visible_devices) or "none",
+            "cpus": self.cpu.get("count"),
+        }
+
+
+def environment_fingerprint(include_tensorflow: bool = True) -> str:
+    """
+    Hashes what an environment report depends on, without collecting it.
+
+    Installing or removing a package changes the modification time of its site-packages
+    directory, so the fingerprint changes with the installed packages at the cost of a
+    few stat calls.
+
+    Returns:
+    - str: A hexadecimal digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    parts = [
+        sys.executable,
+        sys.version,
+        _read(os.path.join(PROC_ROOT, "sys", "kernel", "random", "boot_id")) or platform.node(),
+        os.environ.get("CUDA_VISIBLE_DEVICES", "<unset>"),
+        str(include_tensorflow),
+    ]
+    for path in sys.path:
+        try:
+            if os.path.isdir(path):
+                parts.append(f"{path}:{os.stat(path).st_mtime_ns}")
+        except OSError:
+            continue
+    digest.update("\n".join(parts).encode())
+    return digest.hexdigest()
+
+
+def _cpu_info() -> dict:
+    model = platform.processor() or None
+    flags = []
+    for line in (_read(os.path.join(PROC_ROOT, "cpuinfo")) or "").splitlines():
+        key, _, value = line.partition(":")
+        key = key.strip()
+        if key == "model name" and value.strip():
+            model = value.strip()
+        elif key in ("flags", "Features"):
+            flags = sorted(value.split())
+        if model and flags:
+            break
+    return {"count": os.cpu_count(), "model": model, "flags": flags}
+
+
+def _tensorflow_info() -> Optional[dict]:
+    if importlib.util.find_spec("tensorflow") is None:
+        return None
+    tf = _tensorflow()
+    built_with_cuda = bool(tf.test.is_built_with_cuda())
+    build_info = tf.sysconfig.get_build_info() if built_with_cuda else {}
+    return {
+        "version": tf.__version__,
+        "built_with_cuda": built_with_cuda,
+        "cuda_version": build_info.get("cuda_version"),
+        "cudnn_version": build_info.get("cudnn_version"),
+        "gpus": [gpu.name for gpu in tf.config.list_physical_devices("GPU")],
+    }
+
+
+def _collect_environment_report(fingerprint: str, include_tensorflow: bool) -> EnvironmentReport:
+    # Imported here, as it costs more than the rest of this module
+    import importlib.metadata
+
+    packages = {}
+    for name in REPORT_PACKAGES:
+        try:
+            packages[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            packages[name] = None
+    inventory = get_gpu_inventory()
+    return EnvironmentReport(
+        fingerprint=fingerprint,
+        python={
+            "version": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "executable": sys.executable,
+        },
+        system={
+            "os": platform.system(),
+            "release": platform.release(),
+            "machine": platform.machine(),
+            "hostname": platform.node(),
+        },
+        cpu=_cpu_info(),
+        packages=packages,
+        tensorflow=_tensorflow_info() if include_tensorflow else None,
+        devices=[asdict(device) for device in inventory.devices],
+        visible_devices=[asdict(device) for device in inventory.visible_devices],
+        driver_version=inventory.driver_version,
+    )
+
+
+_REPORTS: Dict[str, EnvironmentReport] = {}
+
+
+def get_environment_report(refresh: bool = False, include_tensorflow: bool = True) -> EnvironmentReport:
+    """
+    Returns a structured report of the Python, package, CPU, GPU and TensorFlow setup.
+
+    Collecting TensorFlow's build info means importing it, which takes seconds, so the
+    report is cached in the process and on disk under INVENTORY_CACHE_DIR, keyed on
+    `environment_fingerprint`. Later calls and later processes in the same environment
+    only pay for computing the fingerprint.
+
+    Parameters:
+    - refresh (bool): Collect the report again, replacing both caches. Default is False.
+    - include_tensorflow (bool): Inspect TensorFlow when it is installed. Default is True.
+
+    Returns:
+    - EnvironmentReport: The report; serialize it with `to_json` or `to_dict`.
+    """
+    fingerprint = environment_fingerprint(include_tensorflow)
+    if not refresh and fingerprint in _REPORTS:
+        return _REPORTS[fingerprint]
+
+    cache_path = os.path.join(INVENTORY_CACHE_DIR, f"environment-{fingerprint}.json")
+    if not refresh:
+        try:
+            with open(cache_path) as file:
+                _REPORTS[fingerprint] = EnvironmentReport.from_dict(json.load(file))
+            return _REPORTS[fingerprint]
+        except (OSError, ValueError, TypeError):
+            pass
+
+    report = _collect_environment_report(fingerprint, include_tensorflow)
+    _REPORTS[fingerprint] = report
+    try:
+        os.makedirs(INVENTORY_CACHE_DIR, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=INVENTORY_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w") as file:
+            file.write(report.to_json())
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"[ERROR] Could not write the environment report cache: {e}")
+    return report
+
+
 if __name__ == "__main__":
-    # Specify GPU to use (e.g., GPU 0)
-    os.environ["CUDA_VISIBLE_DEVICES"] = "0"
+    # Use the least-loaded GPU, if any
+    configure_devices(select_devices(1))
     
     get_gpu_info()
     enable_memory_growth()
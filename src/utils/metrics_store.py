@@ -0,0 +1,267 @@
+# ---------------------------------------------------------------------------- #
+#                      Authored by Matheus Ferreira Silva                      #
+#                           github.com/MatheusFS-dev                           #
+# ---------------------------------------------------------------------------- #
+
+import json
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Default location of the store, data/metrics at the root of the repository
+DEFAULT_ROOT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "metrics"
+)
+
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+
+_NAME_PATTERN = re.compile(r"[A-Za-z0-9_.\-]+")
+
+
+@contextmanager
+def _locked(file_descriptor: int):
+    """
+    Holds an exclusive `flock` on a file descriptor, where available.
+    """
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(file_descriptor, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(file_descriptor, fcntl.LOCK_UN)
+
+
+class Series:
+    """
+    One append-only column of fixed-dtype values, stored raw in its own file.
+
+    The file holds nothing but the values, so its length is its size divided by the item
+    size and reads map it directly with `np.memmap`. Appends go through a single
+    `O_APPEND` write under an `flock`, so several processes can append to the same series
+    and a crash can at most leave an incomplete trailing item, which readers ignore and
+    the next append removes.
+
+    A series can be passed to the `plot_api` functions in place of an array: it is read
+    through `np.memmap` without copying.
+    """
+
+    def __init__(self, path: str, name: str, dtype: Union[str, np.dtype]):
+        self.path = path
+        self.name = name
+        self.dtype = np.dtype(dtype)
+        self._fd: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return f"Series({self.name!r}, dtype={self.dtype.str!r}, length={len(self)})"
+
+    def __len__(self) -> int:
+        try:
+            return os.path.getsize(self.path) // self.dtype.itemsize
+        except FileNotFoundError:
+            return 0
+
+    def append(self, values) -> int:
+        """
+        Appends one value or an array of values.
+
+        Parameters:
+        - values: A scalar or array-like, cast to the dtype of the series.
+
+        Returns:
+        - int: The length of the series after the append.
+        """
+        data = np.ascontiguousarray(values, dtype=self.dtype).reshape(-1).tobytes()
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        with _locked(self._fd):
+            # Drop an incomplete item left by a crashed writer, so values stay aligned
+            size = os.fstat(self._fd).st_size
+            if size % self.dtype.itemsize:
+                os.ftruncate(self._fd, size - size % self.dtype.itemsize)
+            view = memoryview(data)
+            while view:
+                written = os.write(self._fd, view)
+                view = view[written:]
+            return os.fstat(self._fd).st_size // self.dtype.itemsize
+
+    def values(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Maps the stored values read-only, without copying them.
+
+        The mapping covers the values present at call time; call again to see later appends.
+
+        Parameters:
+        - start (int): First item. Default is 0.
+        - stop (Optional[int]): Item to stop before. Defaults to the current length.
+
+        Returns:
+        - np.ndarray: A read-only `np.memmap`, or an empty array if there is nothing to map.
+        """
+        length = len(self)
+        start, stop, _ = slice(start, stop).indices(length)
+        if stop <= start:
+            return np.empty(0, dtype=self.dtype)
+        return np.memmap(
+            self.path, dtype=self.dtype, mode="r", offset=start * self.dtype.itemsize, shape=(stop - start,)
+        )
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.values()
+        if copy:
+            return np.array(values, dtype=dtype)
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def close(self) -> None:
+        """
+        Closes the append handle; it is reopened by the next append.
+        """
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class MetricsStore:
+    """
+    A directory of append-only metric series with a compact JSON index.
+
+    Each series is a raw file named after it, holding values of one fixed dtype. The
+    index only records the name, dtype and file of every series; lengths come from file
+    sizes, so appends never touch the index. Creating a series updates the index under a
+    lock and replaces it atomically, so processes can share a store.
+
+    Example:
+        >>> store = MetricsStore()
+        >>> for epoch in range(epochs):
+        ...     store.log(epoch=epoch, loss=loss, accuracy=accuracy)
+        >>> plot_scientific(store["epoch"], [store["loss"]], labels=["loss"])
+    """
+
+    def __init__(self, root: str = DEFAULT_ROOT):
+        """
+        Parameters:
+        - root (str): Directory of the store, created if needed. Defaults to data/metrics.
+        """
+        self.root = root
+        self._series: Dict[str, Series] = {}
+        os.makedirs(root, exist_ok=True)
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.root, INDEX_FILE)
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.index_path) as file:
+                index = json.load(file)
+        except FileNotFoundError:
+            return {"version": INDEX_VERSION, "series": {}}
+        if index.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported metrics index version: {index.get('version')}")
+        return index
+
+    def names(self) -> List[str]:
+        """
+        Returns the names of every series in the store.
+        """
+        return sorted(self._read_index()["series"])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._read_index()["series"]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names())
+
+    def __getitem__(self, name: str) -> Series:
+        return self.series(name, create=False)
+
+    def series(self, name: str, dtype: Union[str, np.dtype] = "float64", create: bool = True) -> Series:
+        """
+        Returns a series handle, creating the series if needed.
+
+        Parameters:
+        - name (str): Series name: letters, digits, "_", "." and "-".
+        - dtype (str | np.dtype): Dtype of a new series; existing series keep theirs.
+          Default is "float64".
+        - create (bool): Create the series if it does not exist. Default is True.
+
+        Returns:
+        - Series: The handle, shared by later calls with the same name.
+        """
+        if name in self._series:
+            return self._series[name]
+        if not _NAME_PATTERN.fullmatch(name) or name == INDEX_FILE:
+            raise ValueError(f"Invalid series name: {name!r}")
+
+        entry = self._read_index()["series"].get(name)
+        if entry is None:
+            if not create:
+                raise KeyError(name)
+            entry = self._register(name, np.dtype(dtype))
+        series = Series(os.path.join(self.root, entry["file"]), name, entry["dtype"])
+        self._series[name] = series
+        return series
+
+    def _register(self, name: str, dtype: np.dtype) -> dict:
+        # Read-modify-write the index under a lock held on a side file
+        lock_fd = os.open(os.path.join(self.root, ".index.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            with _locked(lock_fd):
+                index = self._read_index()
+                entry = index["series"].get(name)
+                if entry is None:
+                    entry = {"dtype": dtype.str, "file": f"{name}.bin"}
+                    index["series"][name] = entry
+                    fd, temp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+                    with os.fdopen(fd, "w") as file:
+                        json.dump(index, file, separators=(",", ":"))
+                    os.replace(temp_path, self.index_path)
+                return entry
+        finally:
+            os.close(lock_fd)
+
+    def append(self, name: str, values) -> int:
+        """
+        Appends values to a series, creating it as float64 if needed.
+
+        Returns:
+        - int: The length of the series after the append.
+        """
+        return self.series(name).append(values)
+
+    def log(self, **values) -> None:
+        """
+        Appends one value to each named series, e.g. `store.log(epoch=3, loss=0.25)`.
+        """
+        for name, value in values.items():
+            self.append(name, value)
+
+    def close(self) -> None:
+        """
+        Closes the append handles of every series opened through this store.
+        """
+        for series in self._series.values():
+            series.close()
+
+    def __enter__(self) -> "MetricsStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
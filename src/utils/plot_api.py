@@ -3,15 +3,953 @@
 #                           github.com/MatheusFS-dev                           #
 # ---------------------------------------------------------------------------- #    
 
-import matplotlib.pyplot as plt
-from typing import List, Optional, Tuple
-import seaborn as sns
+import hashlib
+import io
+import os
+import shutil
+import time
+import traceback
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Sequence, Tuple, Union
 import numpy as np
 
+from .metrics_store import Series
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+# Headless rendering draws on figures that pyplot does not track, so they are freed as
+# soon as they go out of scope. Enabled by default when PLOT_API_HEADLESS is set.
+_HEADLESS = os.environ.get("PLOT_API_HEADLESS", "").lower() in ("1", "true", "yes")
+
+# Default render cache, enabled for every process when PLOT_API_CACHE_DIR is set
+_RENDER_CACHE = None
+
+
+def _pyplot():
+    """
+    Imports matplotlib.pyplot on first use, so that importing this module stays cheap.
+    """
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _seaborn():
+    """
+    Imports seaborn on first use, so that importing this module stays cheap.
+    """
+    import seaborn as sns
+
+    return sns
+
+
+def set_headless(enabled: bool = True) -> None:
+    """
+    Switches every plot function to headless rendering by default.
+
+    Headless plots are drawn with the Agg renderer on figures that are not registered with
+    pyplot: nothing is shown, no window or GUI backend is needed, and each figure is
+    released as soon as the caller drops it, so memory stays flat across thousands of plots.
+
+    Args:
+        enabled (bool): Whether headless rendering is the default. Default is True.
+    """
+    global _HEADLESS
+    _HEADLESS = enabled
+    if enabled:
+        import matplotlib
+
+        matplotlib.use("Agg")
+
+
+def _new_figure(figsize: Tuple[float, float], headless: bool):
+    """
+    Creates a figure with a single axes, outside of pyplot when rendering headless.
+    """
+    if headless:
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=figsize)
+    else:
+        fig = _pyplot().figure(figsize=figsize)
+    return fig, fig.add_subplot()
+
+
+def _finish_figure(
+    fig,
+    ax,
+    headless: bool,
+    save_path: Optional[str],
+    dpi: int,
+    image_format: Optional[str],
+    return_bytes: bool,
+    cached: Optional["_CachedRender"] = None,
+    **savefig_kwargs,
+):
+    """
+    Saves, encodes and shows a finished figure, then releases it from pyplot when it
+    can no longer be interacted with.
+    """
+    if cached is not None and cached.cache is not None:
+        # Headless and cached: every output is encoded once and stored
+        data = cached.finish(fig, dpi, savefig_kwargs)
+        return data if return_bytes else (fig, ax)
+
+    if save_path:
+        fig.savefig(save_path, dpi=dpi, format=image_format, **savefig_kwargs)
+
+    data = None
+    if return_bytes:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, dpi=dpi, format=image_format or "png", **savefig_kwargs)
+        data = buffer.getvalue()
+
+    if not headless:
+        plt = _pyplot()
+        plt.show()
+        # Blocking GUI backends destroy the figure when its window is closed, but
+        # non-interactive ones return at once and would keep it alive until exit
+        if not plt.isinteractive() and plt.fignum_exists(fig.number):
+            plt.close(fig)
+
+    return data if return_bytes else (fig, ax)
+
+
+# ------------------------------- Render cache ------------------------------- #
+
+class _Unhashable(Exception):
+    """
+    Raised for arguments that cannot be hashed by content without consuming them.
+    """
+
+
+# Scalars whose repr identifies their value exactly
+_HASHABLE_SCALARS = (type(None), bool, int, float, complex, str, bytes, np.generic)
+
+# Bytes fed to the hash at once; non-contiguous arrays are copied one block of this size at a time
+_HASH_CHUNK_BYTES = 1 << 23
+
+# Labels carried by array-likes such as pandas objects, which seaborn draws as tick labels
+_ARRAY_LABELS = ("columns", "index", "name")
+
+
+def _hash_array(digest, array: np.ndarray) -> None:
+    """
+    Feeds an array into a hash chunk by chunk, without copying contiguous data.
+    """
+    if array.dtype.hasobject:
+        raise _Unhashable("object array")
+    digest.update(f"ndarray{array.dtype.str}{array.shape};".encode())
+    if isinstance(array, np.ma.MaskedArray):
+        _hash_array(digest, np.ma.getmaskarray(array))
+        array = array.data
+    if array.size == 0:
+        return
+    if array.flags.c_contiguous:
+        data = array.reshape(-1).view(np.uint8)
+        for start in range(0, data.size, _HASH_CHUNK_BYTES):
+            digest.update(data[start:start + _HASH_CHUNK_BYTES])
+        return
+    # Strided views, such as a transposed memmap, are read in C order through a bounded buffer
+    blocks = np.nditer(
+        array,
+        flags=["external_loop", "buffered", "zerosize_ok"],
+        buffersize=max(_HASH_CHUNK_BYTES // array.itemsize, 1),
+        order="C",
+    )
+    for block in blocks:
+        digest.update(np.ascontiguousarray(block).view(np.uint8))
+
+
+def _hash_value(digest, value) -> None:
+    """
+    Feeds a plot argument into a hash by content: arrays and array-likes by their values,
+    containers recursively and scalars by their repr. Anything else, or an iterator that
+    hashing would consume, raises `_Unhashable` so that the call skips the cache.
+    """
+    if isinstance(value, _HASHABLE_SCALARS):
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, (list, tuple)):
+        if value and all(isinstance(item, (int, float, np.number)) for item in value):
+            # Plain numeric sequences hash like the arrays they are plotted as
+            _hash_array(digest, np.asarray(value))
+            return
+        digest.update(f"{type(value).__name__}[{len(value)}]".encode())
+        for item in value:
+            _hash_value(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f"dict[{len(value)}]".encode())
+        for key in sorted(value, key=repr):
+            _hash_value(digest, key)
+            _hash_value(digest, value[key])
+    elif isinstance(value, (np.ndarray, memoryview)):
+        _hash_array(digest, np.asarray(value))
+    elif hasattr(value, "__array__") and not isinstance(value, Iterator):
+        digest.update(f"{type(value).__module__}.{type(value).__qualname__}".encode())
+        _hash_array(digest, np.asarray(value))
+        for name in _ARRAY_LABELS:
+            if hasattr(value, name):
+                label = getattr(value, name)
+                if hasattr(label, "__array__"):
+                    # Labels are usually strings, held in object arrays
+                    label = np.asarray(label)
+                    label = label.tolist() if label.dtype.hasobject else label
+                _hash_value(digest, label)
+    else:
+        raise _Unhashable(type(value).__name__)
+
+
+_SOURCE_DIGEST = None
+
+
+def _source_digest() -> str:
+    """
+    Hashes this module and the matplotlib version once, so that cached images are
+    invalidated when the plotting code changes.
+    """
+    global _SOURCE_DIGEST
+    if _SOURCE_DIGEST is None:
+        import matplotlib
+
+        digest = hashlib.blake2b(matplotlib.__version__.encode(), digest_size=16)
+        with open(__file__, "rb") as file:
+            digest.update(file.read())
+        _SOURCE_DIGEST = digest.hexdigest()
+    return _SOURCE_DIGEST
+
+
+class RenderCache:
+    """
+    Content-addressed on-disk cache of encoded plot images, with LRU eviction.
+
+    Entries are keyed on a hash of the plot function, every argument (arrays by their
+    bytes), the image format, matplotlib's version and this module's source, so a cached
+    image is only reused for an identical plot. The output path is not part of the key:
+    the same plot saved under another name is a hit. Entries are written atomically and
+    their modification time is refreshed on every hit; when the directory grows beyond
+    `max_bytes` the least recently used entries are removed. Several processes can share
+    one directory.
+
+    Hit/miss counters are kept per instance and per process.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 ** 2):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, function_name: str, arguments: dict) -> Optional[str]:
+        """
+        Returns the cache key of a call, or None if an argument cannot be hashed.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{function_name}:{_source_digest()}".encode())
+        try:
+            _hash_value(digest, arguments)
+        except _Unhashable:
+            return None
+        return digest.hexdigest()
+
+    def _path(self, key: str, image_format: str) -> str:
+        return os.path.join(self.directory, f"{key}.{image_format}")
+
+    def get(self, key: str, image_format: str) -> Optional[str]:
+        """
+        Returns the path of a cached image and marks it as recently used, or None.
+        """
+        path = self._path(key, image_format)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, image_format: str, data: bytes) -> str:
+        """
+        Stores an encoded image and evicts old entries if the cache is over its size.
+        """
+        path = self._path(key, image_format)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+        self._evict()
+        return path
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Removes every cached image.
+        """
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> dict:
+        """
+        Returns the hit/miss counters of this process and the current size on disk.
+        """
+        entries = self._entries()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+
+def set_render_cache(
+    directory: Optional[str] = None, max_bytes: int = 512 * 1024 ** 2
+) -> Optional[RenderCache]:
+    """
+    Selects the render cache used by default by every plot function.
+
+    The cache only applies to headless plots that are saved or returned as bytes. When
+    a plot is found in the cache nothing is drawn: the stored image is copied to
+    `save_path` or returned, and the function returns None instead of the figure.
+
+    Args:
+        directory (Optional[str]): Cache directory, or None to disable the default cache.
+        max_bytes (int): Size bound of the cache on disk. Default is 512 MiB.
+
+    Returns:
+        Optional[RenderCache]: The new default cache.
+    """
+    global _RENDER_CACHE
+    _RENDER_CACHE = RenderCache(directory, max_bytes) if directory else None
+    return _RENDER_CACHE
+
+
+if os.environ.get("PLOT_API_CACHE_DIR"):
+    set_render_cache(os.environ["PLOT_API_CACHE_DIR"])
+
+
+class _CachedRender:
+    """
+    The cache lookup of one plot call, carried from the start of a plot function to
+    `_finish_figure`, which stores what it encodes.
+    """
+
+    def __init__(self, function_name: str, arguments: dict):
+        self.cache = None
+        self.key = None
+        self.hit = False
+        self.result = None
+        self.save_path = arguments["save_path"]
+        self.return_bytes = arguments["return_bytes"]
+        image_format = arguments["image_format"]
+        cache = arguments["cache"]
+        cache = _RENDER_CACHE if cache is None or cache is True else cache or None
+        if cache is None or not arguments["headless"] or not (self.save_path or self.return_bytes):
+            return
+
+        # The file format follows the extension of save_path when no format is given
+        extension = os.path.splitext(self.save_path or "")[1][1:].lower()
+        self.file_format = image_format or extension or "png"
+        self.bytes_format = image_format or "png"
+        ignored = ("save_path", "return_bytes", "cache", "headless")
+        self.key = cache.key(function_name, {k: v for k, v in arguments.items() if k not in ignored})
+        if self.key is None:
+            return
+        self.cache = cache
+
+        paths = {}
+        for image_format in self._formats():
+            paths[image_format] = cache.get(self.key, image_format)
+        if all(paths.values()):
+            cache.hits += 1
+            self.hit = True
+            if self.save_path:
+                shutil.copyfile(paths[self.file_format], self.save_path)
+            if self.return_bytes:
+                with open(paths[self.bytes_format], "rb") as file:
+                    self.result = file.read()
+        else:
+            cache.misses += 1
+
+    def _formats(self) -> List[str]:
+        formats = [self.file_format] if self.save_path else []
+        if self.return_bytes and self.bytes_format not in formats:
+            formats.append(self.bytes_format)
+        return formats
+
+    def finish(self, fig, dpi: int, savefig_kwargs: dict) -> Optional[bytes]:
+        """
+        Encodes each needed format once, stores it and writes `save_path` from it.
+        """
+        encoded = {}
+        for image_format in self._formats():
+            buffer = io.BytesIO()
+            fig.savefig(buffer, dpi=dpi, format=image_format, **savefig_kwargs)
+            encoded[image_format] = buffer.getvalue()
+            self.cache.put(self.key, image_format, encoded[image_format])
+        if self.save_path:
+            with open(self.save_path, "wb") as file:
+                file.write(encoded[self.file_format])
+        return encoded.get(self.bytes_format) if self.return_bytes else None
+
+
+def downsample_minmax(x: np.ndarray, y: np.ndarray, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduces a series to the minimum and maximum of equally sized buckets.
+
+    Keeps every local extreme that would be visible at the rendered resolution, so peaks
+    and spikes survive exactly. Computed with a single reshape and argmin/argmax pass.
+
+    Args:
+        x (np.ndarray): X values, sorted in ascending order.
+        y (np.ndarray): Y values, same length as `x`.
+        max_points (int): Maximum number of points to keep (two per bucket).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The kept X and Y values, in their original order.
+    """
+    n = len(y)
+    # Two points per bucket, plus the endpoints and the leftover tail bucket
+    buckets = max(1, (max_points - 4) // 2)
+    if n <= max_points or buckets >= n:
+        return x, y
+    size = n // buckets
+    body = y[: buckets * size].reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    indices = [offsets + body.argmin(axis=1), offsets + body.argmax(axis=1), [0, n - 1]]
+    if buckets * size < n:
+        # Fold the leftover tail into one more bucket
+        tail = y[buckets * size :]
+        indices.append([buckets * size + tail.argmin(), buckets * size + tail.argmax()])
+    keep = np.unique(np.concatenate(indices))
+    return x[keep], y[keep]
+
+
+def downsample_lttb(x: np.ndarray, y: np.ndarray, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduces a series with the Largest-Triangle-Three-Buckets algorithm.
+
+    Picks, in each bucket, the point forming the largest triangle with the previously
+    kept point and the average of the next bucket, which preserves the visual shape and
+    the peaks of the curve. Each bucket is evaluated in one vectorized NumPy operation.
+
+    Args:
+        x (np.ndarray): X values, sorted in ascending order.
+        y (np.ndarray): Y values, same length as `x`.
+        max_points (int): Number of points to keep, including the first and last ones.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The kept X and Y values, in their original order.
+    """
+    n = len(y)
+    if n <= max_points or max_points < 3:
+        return x, y
+    xf = x.astype(float, copy=False)
+    yf = y.astype(float, copy=False)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    # Averages of every bucket, used as the third vertex of the previous bucket's triangles
+    counts = np.diff(edges)
+    x_means = np.add.reduceat(xf[:-1], edges[:-1]) / counts
+    y_means = np.add.reduceat(yf[:-1], edges[:-1]) / counts
+
+    keep = np.empty(max_points, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    previous = 0
+    for i in range(max_points - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_x, next_y = (x_means[i + 1], y_means[i + 1]) if i + 1 < len(x_means) else (xf[-1], yf[-1])
+        areas = np.abs(
+            (xf[previous] - next_x) * (yf[start:stop] - yf[previous])
+            - (xf[previous] - xf[start:stop]) * (next_y - yf[previous])
+        )
+        previous = start + int(areas.argmax())
+        keep[i + 1] = previous
+    return x[keep], y[keep]
+
+
+_DOWNSAMPLERS = {"minmax": downsample_minmax, "lttb": downsample_lttb}
+
+
+# Accepted forms for a collection of datasets: a list of sequences, or a 2-D array-like
+# (NumPy array, memoryview, ...) with one dataset per row
+Datasets = Union[List[List[float]], np.ndarray, memoryview]
+
+
+def _resolve_series(data, datasets: bool = False):
+    """
+    Maps `metrics_store.Series` handles to their values as an `np.memmap`, so that they
+    are read in chunks where supported.
+
+    With `datasets`, the elements of a list of datasets are resolved too, one level deep.
+    Every other input, including pandas objects whose labels seaborn draws, is returned
+    as is, and a list is only rebuilt when it holds a handle.
+    """
+    if isinstance(data, Series):
+        return data.values()
+    if datasets and isinstance(data, list) and any(isinstance(item, Series) for item in data):
+        return [item.values() if isinstance(item, Series) else item for item in data]
+    return data
+
+
+def _as_datasets(datasets: Datasets) -> List[np.ndarray]:
+    """
+    Converts datasets to a list of 1-D arrays without copying array inputs.
+
+    2-D arrays and memoryviews are split into row views, and lists of arrays keep their
+    arrays as they are.
+    """
+    if isinstance(datasets, (np.ndarray, memoryview)):
+        array = np.asarray(datasets)
+        if array.ndim == 1:
+            return [array]
+        if array.ndim != 2:
+            raise ValueError("Array datasets must be 1-D or 2-D (one dataset per row).")
+        return list(array)
+    return [np.asarray(data) for data in datasets]
+
+
+def _finite_range(data: np.ndarray) -> Optional[Tuple[float, float]]:
+    """
+    Returns the minimum and maximum finite values of an array, or None if it has none.
+
+    Only arrays holding NaN or infinite values are filtered, which copies their finite part.
+    """
+    if not data.size:
+        return None
+    low, high = np.min(data), np.max(data)
+    if np.isfinite(low) and np.isfinite(high):
+        return float(low), float(high)
+    finite = data[np.isfinite(data)]
+    if not finite.size:
+        return None
+    return float(finite.min()), float(finite.max())
+
+
+def _merge_ranges(ranges: Iterable[Optional[Tuple[float, float]]]) -> Tuple[float, float]:
+    """
+    Combines per-dataset finite ranges, defaulting to (0, 1) when no value is finite.
+    """
+    ranges = [value_range for value_range in ranges if value_range is not None]
+    if not ranges:
+        return 0.0, 1.0
+    return min(low for low, _ in ranges), max(high for _, high in ranges)
+
+
+def _shared_bin_edges(datasets: List[np.ndarray], bins, value_range=None) -> np.ndarray:
+    """
+    Computes one set of bin edges covering every dataset, from a single min/max pass.
+
+    NaN and infinite values are left out of the range. Bin strategies such as "auto" are
+    passed to `np.histogram_bin_edges` with the finite values of every dataset pooled.
+    """
+    if isinstance(bins, str):
+        finite = [data[np.isfinite(data)] for data in datasets if data.size]
+        pooled = np.concatenate(finite) if finite else np.empty(0)
+        return np.histogram_bin_edges(pooled, bins=bins, range=value_range)
+    if not np.isscalar(bins):
+        return np.asarray(bins, dtype=float)
+    if value_range is None:
+        value_range = _merge_ranges(_finite_range(data) for data in datasets)
+    low, high = value_range
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, int(bins) + 1)
+
+
+def _histogram_counts(datasets: List[np.ndarray], edges: np.ndarray) -> np.ndarray:
+    """
+    Counts every dataset into the same bins and returns a (datasets, bins) array.
+
+    Each dataset is counted in place by `np.histogram` against the shared edges. It bins
+    in fixed-size blocks, so neither the datasets nor their bin indices are copied whole.
+    """
+    counts = np.zeros((len(datasets), len(edges) - 1), dtype=np.intp)
+    for row, data in zip(counts, datasets):
+        row[:] = np.histogram(data, bins=edges)[0]
+    return counts
+
+
+# --------------------------- Streaming statistics --------------------------- #
+
+class _ChunkSource:
+    """
+    A group of datasets read chunk by chunk along their last axis.
+
+    Arrays (including `np.memmap`) are sliced into views and can be read any number of
+    times; iterators yield their own chunks and can only be read once.
+    """
+
+    def __init__(self, rows: int, chunks: Callable[[], Iterable[np.ndarray]], reiterable: bool):
+        self.rows = rows
+        self.reiterable = reiterable
+        self._chunks = chunks
+
+    def chunks(self) -> Iterable[np.ndarray]:
+        """
+        Yields (rows, n) chunks. A single-pass source raises if it is read twice.
+        """
+        if self._chunks is None:
+            raise ValueError("Chunk iterators can only be read once.")
+        chunks = self._chunks
+        if not self.reiterable:
+            self._chunks = None
+        return chunks()
+
+    @classmethod
+    def from_array(cls, array: np.ndarray, chunk_size: int) -> "_ChunkSource":
+        view = array if array.ndim == 2 else array[np.newaxis]
+        length = view.shape[1]
+        return cls(
+            view.shape[0],
+            lambda: (view[:, i:i + chunk_size] for i in range(0, length, chunk_size)),
+            True,
+        )
+
+    @classmethod
+    def from_iterator(cls, chunks: Iterator) -> "_ChunkSource":
+        # Peek at the first chunk to learn how many datasets the iterator carries
+        chunks = (np.atleast_2d(np.asarray(chunk, dtype=float)) for chunk in chunks)
+        first = next(chunks, None)
+        if first is None:
+            return cls(0, lambda: iter(()), False)
+        return cls(first.shape[0], lambda: chain([first], chunks), False)
+
+
+def _is_streamed(datasets) -> bool:
+    """
+    Returns True for memory-mapped arrays, chunk iterators, or lists containing them.
+    """
+    if isinstance(datasets, (np.memmap, Iterator)):
+        return True
+    if isinstance(datasets, (list, tuple)):
+        return any(isinstance(data, (np.memmap, Iterator)) for data in datasets)
+    return False
+
+
+def _chunk_sources(datasets, chunk_size: int) -> List[_ChunkSource]:
+    """
+    Splits streamed datasets into chunk sources, in dataset order.
+
+    A top-level array or iterator holds one dataset per row (a 1-D array or 1-D chunks hold
+    a single dataset); a list holds one dataset per element.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.")
+    if isinstance(datasets, (np.ndarray, memoryview)):
+        array = np.asarray(datasets)
+        if array.ndim not in (1, 2):
+            raise ValueError("Array datasets must be 1-D or 2-D (one dataset per row).")
+        return [_ChunkSource.from_array(array, chunk_size)]
+    if isinstance(datasets, Iterator):
+        return [_ChunkSource.from_iterator(datasets)]
+    sources = []
+    for data in datasets:
+        if isinstance(data, Iterator):
+            sources.append(_ChunkSource.from_iterator(np.ravel(chunk) for chunk in data))
+        else:
+            sources.append(_ChunkSource.from_array(np.ravel(np.asarray(data)), chunk_size))
+    return sources
+
+
+def histogram_streaming(
+    datasets,
+    bins: Union[int, Sequence[float]] = 10,
+    value_range: Optional[Tuple[float, float]] = None,
+    chunk_size: int = 1 << 20,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes histograms of chunked or memory-mapped datasets with bounded memory.
+
+    Counts are accumulated chunk by chunk, so only `chunk_size` values per dataset are held
+    in memory at once. Without `value_range` or explicit edges, the range is found in an
+    extra min/max pass, which needs re-readable inputs (arrays or `np.memmap`).
+
+    Args:
+        datasets: A `np.memmap`/array with one dataset per row, an iterator of chunks (1-D
+            for one dataset, 2-D with one dataset per row), or a list mixing arrays and
+            iterators of 1-D chunks.
+        bins (int | Sequence[float]): Number of shared bins, or explicit bin edges. Bin
+            strategies such as "auto" need every value at once and are not supported. Default is 10.
+        value_range (Optional[Tuple[float, float]]): Range covered by the bins. Default is None.
+        chunk_size (int): Number of values read per dataset and step. Default is 1 << 20.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The (datasets, bins) counts and the bin edges.
+    """
+    if isinstance(bins, str):
+        raise ValueError(f"Bin strategy {bins!r} needs in-memory datasets; pass a bin count or edges.")
+    sources = _chunk_sources(datasets, chunk_size)
+    if np.isscalar(bins) and value_range is None:
+        if not all(source.reiterable for source in sources):
+            raise ValueError("value_range or explicit bin edges are required for chunk iterators.")
+        value_range = _merge_ranges(
+            _finite_range(chunk) for source in sources for chunk in source.chunks()
+        )
+    edges = _shared_bin_edges([], bins, value_range)
+
+    counts = []
+    for source in sources:
+        total = np.zeros((source.rows, len(edges) - 1), dtype=np.int64)
+        for chunk in source.chunks():
+            total += _histogram_counts(list(chunk), edges)
+        counts.append(total)
+    if not counts:
+        return np.zeros((0, len(edges) - 1), dtype=np.int64), edges
+    return np.concatenate(counts), edges
+
+
+class KLLSketch:
+    """
+    Mergeable quantile sketch (KLL) over a stream of values, in bounded memory.
+
+    Values are kept in levels of sorted compactors where an item at level h stands for
+    2**h input values. When a level overflows it is sorted and every other item (from a
+    random offset) is promoted, so about 3 * k items are retained in total and rank
+    errors stay around 1.7 / k of the count. Sketches built over separate chunks, files or
+    processes can be combined with `merge`. NaNs are ignored; min, max, count and mean
+    are exact.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = k
+        self.count = 0
+        self.total = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind so that pairs are compacted evenly
+                keep = items[:len(items) % 2]
+                promoted = items[len(keep) + self._rng.integers(2)::2]
+                self._levels[level] = keep
+                self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+                # Adding a level shrinks the capacity of the levels below it
+                level = 0
+                continue
+            level += 1
+
+    def update(self, values) -> "KLLSketch":
+        """
+        Adds a chunk of values to the sketch.
+        """
+        values = np.ravel(np.asarray(values, dtype=float))
+        values = values[~np.isnan(values)]
+        if values.size:
+            self.count += values.size
+            self.total += float(values.sum())
+            self.min = min(self.min, float(values.min()))
+            self.max = max(self.max, float(values.max()))
+            self._levels[0] = np.concatenate([self._levels[0], values])
+            self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """
+        Folds another sketch into this one.
+        """
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _sorted(self) -> Tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [np.full(len(level), 2.0 ** h) for h, level in enumerate(self._levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """
+        Returns approximate quantiles for each q in [0, 1]; exact at 0 and 1.
+        """
+        qs = np.asarray(qs, dtype=float)
+        if not self.count:
+            return np.full(qs.shape, np.nan)
+        items, cumulative = self._sorted()
+        ranks = np.clip(qs, 0, 1) * cumulative[-1]
+        result = items[np.minimum(np.searchsorted(cumulative, ranks), len(items) - 1)]
+        result = np.where(qs <= 0, self.min, result)
+        return np.where(qs >= 1, self.max, result)
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns a single approximate quantile.
+        """
+        return float(self.quantiles([q])[0])
+
+    def retained(self) -> np.ndarray:
+        """
+        Returns the sorted input values currently retained by the sketch.
+        """
+        return self._sorted()[0]
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def _box_stats(sketch: KLLSketch, whis: float, label: str) -> dict:
+    """
+    Summarizes a sketch into the statistics dict drawn by `Axes.bxp`.
+    """
+    q1, median, q3 = sketch.quantiles([0.25, 0.5, 0.75])
+    if not sketch.count:
+        return dict(label=label, med=np.nan, q1=np.nan, q3=np.nan, whislo=np.nan,
+                    whishi=np.nan, mean=np.nan, fliers=np.empty(0))
+    low_fence = q1 - whis * (q3 - q1)
+    high_fence = q3 + whis * (q3 - q1)
+    # Whiskers end on the most extreme values inside the fences; exact when no outliers
+    items = sketch.retained()
+    whislo = sketch.min if sketch.min >= low_fence else items[np.searchsorted(items, low_fence)]
+    inside = np.searchsorted(items, high_fence, side="right")
+    whishi = sketch.max if sketch.max <= high_fence else items[max(inside - 1, 0)]
+    return dict(
+        label=label,
+        med=median,
+        q1=q1,
+        q3=q3,
+        whislo=min(whislo, q1),
+        whishi=max(whishi, q3),
+        mean=sketch.total / sketch.count,
+        fliers=np.empty(0),
+    )
+
+
+def boxplot_stats_streaming(
+    dataset,
+    whis: float = 1.5,
+    chunk_size: int = 1 << 16,
+    sketch_k: int = 200,
+    max_fliers: int = 1000,
+    labels: Optional[Sequence[str]] = None,
+) -> List[dict]:
+    """
+    Computes boxplot statistics per column of chunked or memory-mapped data.
+
+    Quartiles come from one `KLLSketch` per column and whiskers follow the usual rule of
+    `whis` times the interquartile range. Re-readable inputs get a second pass that places
+    the whiskers exactly and keeps up to `max_fliers` outliers per column; for chunk
+    iterators the whiskers are estimated from the sketch and only the exact minimum and
+    maximum are reported as outliers.
+
+    Args:
+        dataset: A 2-D `np.memmap`/array with samples in rows and one box per column, or an
+            iterator of such row chunks.
+        whis (float): Whisker reach as a multiple of the interquartile range. Default is 1.5.
+        chunk_size (int): Number of rows read per step. Default is 1 << 16.
+        sketch_k (int): Accuracy parameter of the quantile sketches. Default is 200.
+        max_fliers (int): Maximum number of outliers kept per column. Default is 1000.
+        labels (Optional[Sequence[str]]): Box labels. Defaults to the column indices.
+
+    Returns:
+        List[dict]: One statistics dict per column, as accepted by `Axes.bxp`.
+    """
+    if isinstance(dataset, Iterator):
+        columns = (np.asarray(chunk, dtype=float) for chunk in dataset)
+        source = _ChunkSource.from_iterator(chunk.reshape(len(chunk), -1).T for chunk in columns)
+    else:
+        array = np.asarray(dataset)
+        source = _chunk_sources(array.reshape(len(array), -1).T, chunk_size)[0]
+
+    sketches = [KLLSketch(sketch_k) for _ in range(source.rows)]
+    for chunk in source.chunks():
+        for sketch, column in zip(sketches, chunk):
+            sketch.update(column)
+
+    stats = [
+        _box_stats(sketch, whis, labels[i] if labels and i < len(labels) else str(i))
+        for i, sketch in enumerate(sketches)
+    ]
+    if source.reiterable:
+        fences = [
+            (stat["q1"] - whis * (stat["q3"] - stat["q1"]), stat["q3"] + whis * (stat["q3"] - stat["q1"]))
+            for stat in stats
+        ]
+        whiskers = [[np.inf, -np.inf] for _ in stats]
+        fliers = [[] for _ in stats]
+        for chunk in source.chunks():
+            for (low, high), whisker, kept, column in zip(fences, whiskers, fliers, chunk):
+                inside = (column >= low) & (column <= high)
+                if inside.any():
+                    whisker[0] = min(whisker[0], float(column[inside].min()))
+                    whisker[1] = max(whisker[1], float(column[inside].max()))
+                if len(kept) < max_fliers:
+                    outside = column[~inside & ~np.isnan(column)]
+                    kept.extend(outside[:max_fliers - len(kept)].tolist())
+        for stat, (whislo, whishi), kept in zip(stats, whiskers, fliers):
+            if whislo <= whishi:
+                stat["whislo"], stat["whishi"] = min(whislo, stat["q1"]), max(whishi, stat["q3"])
+    # The exact extremes are always drawn, even when the outliers were capped: they take
+    # the place of the last kept outliers unless they are already among them
+    for stat, sketch, kept in zip(stats, sketches, fliers if source.reiterable else [[]] * len(stats)):
+        kept_values = set(kept)
+        extremes = [
+            v for v in dict.fromkeys((sketch.min, sketch.max))
+            if (v < stat["whislo"] or v > stat["whishi"]) and v not in kept_values
+        ]
+        stat["fliers"] = np.asarray(kept[:max(max_fliers - len(extremes), 0)] + extremes)
+    return stats
+
 
 def plot_scientific(
-    x: List[float],
-    y_datasets: List[List[float]],
+    x: Union[List[float], np.ndarray],
+    y_datasets: Datasets,
     labels: Optional[List[str]] = None,
     x_label: str = "X-axis",
     y_label: str = "Y-axis",
@@ -26,13 +964,22 @@ def plot_scientific(
     ylim: Optional[Tuple[float, float]] = None,
     save_path: Optional[str] = None,
     dpi: int = 300,
-) -> None:
+    headless: Optional[bool] = None,
+    image_format: str = "png",
+    return_bytes: bool = False,
+    downsample: Optional[str] = None,
+    max_points: int = 4000,
+    max_markers: int = 50,
+    cache: Union["RenderCache", bool, None] = None,
+) -> Union[Tuple["Figure", "Axes"], bytes, None]:
     """
     Plots multiple Y datasets against a shared X-axis with scientific paper styling.
 
     Args:
-        x (List[float]): List of X-axis values.
-        y_datasets (List[List[float]]): List of lists containing Y-axis datasets.
+        x (List[float] | np.ndarray): List of X-axis values.
+        y_datasets (List[List[float]] | np.ndarray): List of lists containing Y-axis datasets,
+            or a 2-D array (or memoryview) with one dataset per row, used without copying.
+            Arrays may also be `metrics_store.Series` handles, read through `np.memmap`.
         labels (Optional[List[str]]): Labels for each dataset for the legend.
         x_label (str): Label for the X-axis. Default is "X-axis".
         y_label (str): Label for the Y-axis. Default is "Y-axis".
@@ -47,62 +994,88 @@ def plot_scientific(
         ylim (Optional[Tuple[float, float]]): Limits for the Y-axis as (min, max). Default is None.
         save_path (Optional[str]): Path to save the plot as a file. Default is None.
         dpi (int): Resolution of the saved plot in dots per inch. Default is 300.
+        headless (Optional[bool]): Render without pyplot and without showing the plot. Defaults
+            to the mode selected with `set_headless`.
+        image_format (str): Format of the saved file and of the returned bytes. Default is "png".
+        return_bytes (bool): Return the encoded image instead of the figure. Default is False.
+        downsample (Optional[str]): Decimate long series before drawing, with "lttb" or
+            "minmax" (see `downsample_lttb` and `downsample_minmax`). X must be sorted. Default
+            is None, which draws every point.
+        max_points (int): Maximum number of points drawn per dataset when downsampling.
+            Default is 4000.
+        max_markers (int): Maximum number of markers drawn per dataset. Longer series get
+            evenly spaced markers. Default is 50.
+        cache (RenderCache | bool | None): Render cache for headless plots that are saved or
+            returned as bytes. On a hit nothing is drawn and None is returned instead of the
+            figure. Defaults to the cache selected with `set_render_cache`; False disables it.
 
     Returns:
-        None: Displays the plot and optionally saves it as an image.
+        Tuple[Figure, Axes] | bytes | None: The figure and its axes, or the encoded image if
+        `return_bytes` is True, or None on a render cache hit. Displays the plot unless rendering headless.
     """
+    headless = _HEADLESS if headless is None else headless
+    # Map series handles to their data first, so that the cache key covers their contents
+    x, y_datasets = _resolve_series(x), _resolve_series(y_datasets, datasets=True)
+    cached = _CachedRender("plot_scientific", locals())
+    if cached.hit:
+        return cached.result
+    if downsample is not None and downsample not in _DOWNSAMPLERS:
+        raise ValueError(f"Unknown downsampling method: {downsample}")
+
     # Validate input dimensions
-    if any(len(y) != len(x) for y in y_datasets):
+    x_values = np.asarray(x)
+    y_datasets = _as_datasets(y_datasets)
+    if any(y.shape[0] != x_values.shape[0] for y in y_datasets):
         raise ValueError("All Y datasets must have the same length as the X dataset.")
 
     # Initialize the plot
-    plt.figure(figsize=(8, 6))
+    fig, ax = _new_figure((8, 6), headless)
 
     # Plot each dataset
     for i, y in enumerate(y_datasets):
         label = labels[i] if labels and i < len(labels) else f"Dataset {i + 1}"
         marker = markers[i] if markers and i < len(markers) else "o"
         line_style = line_styles[i] if line_styles and i < len(line_styles) else "-"
-        plt.plot(x, y, label=label, marker=marker, linestyle=line_style)
+        x_plot, y_plot = x_values, y
+        if downsample is not None:
+            x_plot, y_plot = _DOWNSAMPLERS[downsample](x_plot, y_plot, max_points)
+        mark_every = max(1, len(y_plot) // max_markers) if max_markers > 0 else None
+        ax.plot(x_plot, y_plot, label=label, marker=marker, linestyle=line_style, markevery=mark_every)
 
     # Configure axes and title
-    plt.xlabel(x_label, fontsize=12)
-    plt.ylabel(y_label, fontsize=12)
-    plt.title(title, fontsize=14, weight="bold")
-    plt.legend(loc=legend_loc, fontsize=10)
+    ax.set_xlabel(x_label, fontsize=12)
+    ax.set_ylabel(y_label, fontsize=12)
+    ax.set_title(title, fontsize=14, weight="bold")
+    ax.legend(loc=legend_loc, fontsize=10)
 
     # Configure axis limits
     if xlim:
-        plt.xlim(xlim)
+        ax.set_xlim(xlim)
     if ylim:
-        plt.ylim(ylim)
+        ax.set_ylim(ylim)
 
     # Configure X-axis for integers only
     if x_integer:
-        plt.xticks(ticks=range(int(min(x)), int(max(x)) + 1))
+        ax.set_xticks(range(int(x_values.min()), int(x_values.max()) + 1))
 
     # Enable logarithmic scale for Y-axis if requested
     if y_log:
-        plt.yscale("log")
+        ax.set_yscale("log")
 
     # Add grid if requested
     if grid:
-        plt.grid(visible=True, linestyle="--", linewidth=0.5, alpha=0.7)
+        ax.grid(visible=True, linestyle="--", linewidth=0.5, alpha=0.7)
 
     # Final styling
-    plt.tight_layout()
+    fig.tight_layout()
 
-    # Save plot if path is provided
-    if save_path:
-        plt.savefig(save_path, dpi=dpi, format="png")
-
-    # Show plot
-    plt.show()
+    # Save, encode and show the plot
+    return _finish_figure(fig, ax, headless, save_path, dpi, image_format, return_bytes, cached)
 
 
 def plot_histogram(
-    datasets: List[List[float]],
-    bins: int = 10,
+    datasets: Datasets,
+    bins: Union[int, List[float]] = 10,
     density: bool = False,
     labels: Optional[List[str]] = None,
     colors: Optional[List[str]] = None,
@@ -117,13 +1090,24 @@ def plot_histogram(
     ylim: Optional[Tuple[float, float]] = None,
     save_path: Optional[str] = None,
     dpi: int = 300,
-) -> None:
+    headless: Optional[bool] = None,
+    image_format: str = "png",
+    return_bytes: bool = False,
+    value_range: Optional[Tuple[float, float]] = None,
+    chunk_size: int = 1 << 20,
+    cache: Union["RenderCache", bool, None] = None,
+) -> Union[Tuple["Figure", "Axes"], bytes, None]:
     """
     Plots a histogram for one or more datasets with scientific styling.
 
     Args:
-        datasets (List[List[float]]): List of datasets to plot histograms for.
-        bins (int): Number of bins in the histogram. Default is 10.
+        datasets (List[List[float]] | np.ndarray): List of datasets to plot histograms for, or a
+            2-D array (or memoryview) with one dataset per row, used without copying.
+            `np.memmap` arrays, `metrics_store.Series` handles and chunk iterators are binned
+            in chunks with bounded memory (see `histogram_streaming`).
+        bins (int | str | List[float]): Number of bins in the histogram, shared by every
+            dataset, a NumPy bin strategy such as "auto" (in-memory datasets only), or explicit
+            bin edges. Default is 10.
         density (bool): If True, normalizes the histogram so the area equals 1. Default is False.
         labels (Optional[List[str]]): Labels for each dataset for the legend. Default is None.
         colors (Optional[List[str]]): Colors for each dataset. Default is None.
@@ -138,56 +1122,87 @@ def plot_histogram(
         ylim (Optional[Tuple[float, float]]): Limits for the Y-axis as (min, max). Default is None.
         save_path (Optional[str]): Path to save the histogram as a file. Default is None.
         dpi (int): Resolution of the saved histogram in dots per inch. Default is 300.
+        headless (Optional[bool]): Render without pyplot and without showing the histogram.
+            Defaults to the mode selected with `set_headless`.
+        image_format (str): Format of the saved file and of the returned bytes. Default is "png".
+        return_bytes (bool): Return the encoded image instead of the figure. Default is False.
+        value_range (Optional[Tuple[float, float]]): Range covered by the bins. Defaults to
+            the range of the data; required when binning chunk iterators into `bins` bins.
+        chunk_size (int): Values read per dataset and step for streamed datasets.
+            Default is 1 << 20.
+        cache (RenderCache | bool | None): Render cache for headless plots that are saved or
+            returned as bytes. On a hit nothing is drawn and None is returned instead of the
+            figure. Defaults to the cache selected with `set_render_cache`; False disables it.
 
     Returns:
-        None: Displays the histogram and optionally saves it as an image.
+        Tuple[Figure, Axes] | bytes | None: The figure and its axes, or the encoded image if
+        `return_bytes` is True, or None on a render cache hit. Displays the histogram unless rendering headless.
     """
+    headless = _HEADLESS if headless is None else headless
+    # Map series handles to their data first, so that the cache key covers their contents
+    datasets = _resolve_series(datasets, datasets=True)
+    cached = _CachedRender("plot_histogram", locals())
+    if cached.hit:
+        return cached.result
+
     # Initialize the plot
-    plt.figure(figsize=(8, 6))
+    fig, ax = _new_figure((8, 6), headless)
 
-    # Plot each dataset as a histogram
-    for i, data in enumerate(datasets):
+    # Bin every dataset at once, then draw the precomputed counts
+    if _is_streamed(datasets):
+        counts, edges = histogram_streaming(datasets, bins, value_range, chunk_size)
+    else:
+        datasets = _as_datasets(datasets)
+        edges = _shared_bin_edges(datasets, bins, value_range)
+        counts = _histogram_counts(datasets, edges)
+    counts = counts.astype(float)
+    if density:
+        totals = counts.sum(axis=1, keepdims=True)
+        counts /= np.where(totals > 0, totals, 1) * np.diff(edges)
+
+    for i in range(len(counts)):
         label = labels[i] if labels and i < len(labels) else f"Dataset {i + 1}"
         color = colors[i] if colors and i < len(colors) else None
         edgecolor = edgecolors[i] if edgecolors and i < len(edgecolors) else None
-        plt.hist(
-            data,
-            bins=bins,
-            density=density,
-            alpha=alpha,
-            label=label,
-            color=color,
-            edgecolor=edgecolor,
-        )
+        if edgecolor is None:
+            # A single filled step artist instead of one rectangle per bin
+            ax.stairs(counts[i], edges, fill=True, alpha=alpha, label=label, color=color)
+        else:
+            ax.bar(
+                edges[:-1],
+                counts[i],
+                width=np.diff(edges),
+                align="edge",
+                alpha=alpha,
+                label=label,
+                color=color,
+                edgecolor=edgecolor,
+            )
 
     # Configure axes and title
-    plt.xlabel(x_label, fontsize=12)
-    plt.ylabel(y_label if not density else "Density", fontsize=12)
-    plt.title(title, fontsize=14, weight="bold")
+    ax.set_xlabel(x_label, fontsize=12)
+    ax.set_ylabel(y_label if not density else "Density", fontsize=12)
+    ax.set_title(title, fontsize=14, weight="bold")
 
     # Configure axis limits
     if xlim:
-        plt.xlim(xlim)
+        ax.set_xlim(xlim)
     if ylim:
-        plt.ylim(ylim)
+        ax.set_ylim(ylim)
 
     # Add grid if requested
     if grid:
-        plt.grid(visible=True, linestyle="--", linewidth=0.5, alpha=0.7)
+        ax.grid(visible=True, linestyle="--", linewidth=0.5, alpha=0.7)
 
     # Add legend if labels are provided
     if labels:
-        plt.legend(loc=legend_loc, fontsize=10)
+        ax.legend(loc=legend_loc, fontsize=10)
 
     # Final styling
-    plt.tight_layout()
+    fig.tight_layout()
 
-    # Save histogram if path is provided
-    if save_path:
-        plt.savefig(save_path, dpi=dpi, format="png")
-
-    # Show histogram
-    plt.show()
+    # Save, encode and show the histogram
+    return _finish_figure(fig, ax, headless, save_path, dpi, image_format, return_bytes, cached)
 
 
 def plot_boxplot_scientific(
@@ -208,12 +1223,21 @@ def plot_boxplot_scientific(
     dpi: int = 300,
     save_path: Optional[str] = None,
     hide_xlabels: bool = False,
-) -> Optional[str]:
+    headless: Optional[bool] = None,
+    image_format: Optional[str] = None,
+    return_bytes: bool = False,
+    chunk_size: int = 1 << 16,
+    sketch_k: int = 200,
+    cache: Union["RenderCache", bool, None] = None,
+) -> Union[Tuple["Figure", "Axes"], bytes, None]:
     """
     Generates a highly configurable scientific-style boxplot.
 
     Args:
-        dataset (np.ndarray): The dataset as a 2D NumPy array.
+        dataset (np.ndarray): The dataset as a 2D NumPy array. A `np.memmap`, a
+            `metrics_store.Series` handle or an iterator of row chunks is summarized in bounded
+            memory with quantile sketches (see `boxplot_stats_streaming`) and drawn from the
+            summary.
         x_label (str): Label for the X-axis. Default is "Columns".
         y_label (str): Label for the Y-axis. Default is "Values".
         title (str): Title of the plot. Default is "Boxplot of Dataset Columns".
@@ -230,50 +1254,482 @@ def plot_boxplot_scientific(
         dpi (int): DPI for the saved plot image. Default is 300.
         save_path (Optional[str]): File path to save the plot. If None, the plot is displayed.
         hide_xlabels (bool): Whether to hide X-axis labels. Default is False.
+        headless (Optional[bool]): Render without pyplot and without showing the plot. Defaults
+            to the mode selected with `set_headless`.
+        image_format (Optional[str]): Format of the saved file and of the returned bytes. By
+            default the file format follows the extension of `save_path`, and bytes are PNG.
+        return_bytes (bool): Return the encoded image instead of the figure. Default is False.
+        chunk_size (int): Rows read per step for streamed datasets. Default is 1 << 16.
+        sketch_k (int): Accuracy parameter of the quantile sketches. Default is 200.
+        cache (RenderCache | bool | None): Render cache for headless plots that are saved or
+            returned as bytes. On a hit nothing is drawn and None is returned instead of the
+            figure. Defaults to the cache selected with `set_render_cache`; False disables it.
     
     Returns:
-        Optional[str]: The file path of the saved plot, or None if not saved.
+        Tuple[Figure, Axes] | bytes | None: The figure and its axes, or the encoded image if
+        `return_bytes` is True, or None on a render cache hit. Displays the plot unless rendering headless.
     """
+    headless = _HEADLESS if headless is None else headless
+    # Map series handles to their data first, so that the cache key covers their contents
+    dataset = _resolve_series(dataset)
+    cached = _CachedRender("plot_boxplot_scientific", locals())
+    if cached.hit:
+        return cached.result
+
     # Create the plot
-    plt.figure(figsize=figsize)
-    sns.boxplot(
-        data=dataset,
-        orient="v",
-        color=box_color,
-        fliersize=flier_size,
-        linewidth=1.5,
-        flierprops=dict(marker='o', color=flier_color, markerfacecolor=flier_color),
-    )
+    fig, ax = _new_figure(figsize, headless)
+    if _is_streamed(dataset):
+        # Draw from summarized statistics instead of the raw samples
+        stats = boxplot_stats_streaming(dataset, chunk_size=chunk_size, sketch_k=sketch_k)
+        ax.bxp(
+            stats,
+            positions=range(len(stats)),
+            widths=0.8,
+            patch_artist=True,
+            boxprops=dict(facecolor=box_color, edgecolor="0.25", linewidth=1.5),
+            whiskerprops=dict(color="0.25", linewidth=1.5),
+            capprops=dict(color="0.25", linewidth=1.5),
+            medianprops=dict(color="0.25", linewidth=1.5),
+            flierprops=dict(
+                marker='o', markersize=flier_size,
+                markerfacecolor=flier_color, markeredgecolor=flier_color,
+            ),
+        )
+    else:
+        _seaborn().boxplot(
+            data=dataset,
+            orient="v",
+            color=box_color,
+            fliersize=flier_size,
+            linewidth=1.5,
+            flierprops=dict(marker='o', color=flier_color, markerfacecolor=flier_color),
+            ax=ax,
+        )
 
     # Configure titles and labels
-    plt.title(title, fontsize=18, weight="bold")
-    plt.xlabel(x_label, fontsize=16)
-    plt.ylabel(y_label, fontsize=16)
+    ax.set_title(title, fontsize=18, weight="bold")
+    ax.set_xlabel(x_label, fontsize=16)
+    ax.set_ylabel(y_label, fontsize=16)
 
     # Configure axis limits
     if xlim:
-        plt.xlim(xlim)
+        ax.set_xlim(xlim)
     if ylim:
-        plt.ylim(ylim)
+        ax.set_ylim(ylim)
 
     # Configure ticks
-    plt.xticks(fontsize=12, rotation=tick_rotation)
-    plt.yticks(fontsize=12)
+    ax.tick_params(axis="x", labelsize=12, labelrotation=tick_rotation)
+    ax.tick_params(axis="y", labelsize=12)
 
     # Hide X-axis labels if requested
     if hide_xlabels:
-        plt.xticks([])
+        ax.set_xticks([])
 
     # Configure grid
     if grid:
-        plt.grid(visible=True, linestyle=grid_style, linewidth=0.5, alpha=grid_alpha)
+        ax.grid(visible=True, linestyle=grid_style, linewidth=0.5, alpha=grid_alpha)
 
-    # Save or show the plot
-    if save_path:
-        plt.savefig(save_path, dpi=dpi, bbox_inches="tight")   
-    plt.show()
+    # Save, encode and show the plot
+    return _finish_figure(
+        fig, ax, headless, save_path, dpi, image_format, return_bytes, cached, bbox_inches="tight"
+    )
+
+
+class LivePlot:
+    """
+    A line plot that grows in place, for training curves and other running metrics.
+
+    Each series keeps one persistent `Line2D` whose history lives in a growable NumPy
+    buffer. Updates are blitted: only the segment added since the last refresh is drawn
+    on top of the cached canvas, so the cost of an update is proportional to the new
+    points rather than to the history. The whole figure is redrawn only when points fall
+    outside the current axis limits, which grow with headroom so that this stays rare.
+
+    Refreshes are throttled to `max_fps`; points appended in between are drawn together
+    by the next refresh. With `snapshot_path`, the canvas pixels are written to a PNG
+    after refreshes without re-rendering the figure.
+
+    Example:
+        >>> live = LivePlot(["train", "validation"], x_label="Epoch", y_label="Loss")
+        >>> for epoch in range(epochs):
+        ...     live.append(epoch, train_loss, val_loss)
+        >>> live.close()
+    """
+
+    def __init__(
+        self,
+        labels: Sequence[str],
+        x_label: str = "X-axis",
+        y_label: str = "Y-axis",
+        title: str = "Live Plot",
+        colors: Optional[Sequence[str]] = None,
+        linestyles: Optional[Sequence[str]] = None,
+        figsize: Tuple[float, float] = (10, 6),
+        grid: bool = True,
+        legend_loc: str = "best",
+        max_fps: float = 10.0,
+        headroom: float = 0.5,
+        snapshot_path: Optional[str] = None,
+        snapshot_interval: float = 0.0,
+        dpi: int = 100,
+        headless: Optional[bool] = None,
+    ):
+        """
+        Args:
+            labels (Sequence[str]): Legend label of each series.
+            x_label (str): Label for the X-axis. Default is "X-axis".
+            y_label (str): Label for the Y-axis. Default is "Y-axis".
+            title (str): Title of the plot. Default is "Live Plot".
+            colors (Optional[Sequence[str]]): Colors for each series. Default is None.
+            linestyles (Optional[Sequence[str]]): Line styles for each series. Default is None.
+            figsize (Tuple[float, float]): Size of the figure in inches. Default is (10, 6).
+            grid (bool): Whether to display a grid. Default is True.
+            legend_loc (str): Location of the legend. Default is "best".
+            max_fps (float): Maximum number of refreshes per second. Default is 10.0.
+            headroom (float): Fraction of the data span added when the axes must grow.
+                Default is 0.5.
+            snapshot_path (Optional[str]): PNG file rewritten after refreshes. Default is None.
+            snapshot_interval (float): Minimum seconds between snapshots. Default is 0.0.
+            dpi (int): Resolution of the canvas and of the snapshots. Default is 100.
+            headless (Optional[bool]): Draw off-screen instead of in a window. Defaults to
+                the mode selected with `set_headless`.
+        """
+        self.headless = _HEADLESS if headless is None else headless
+        self.min_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self.headroom = headroom
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval = snapshot_interval
+        self.redraws = 0
+        self.refreshes = 0
+
+        self.fig, self.ax = _new_figure(figsize, self.headless)
+        self.fig.set_dpi(dpi)
+        if self.headless:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+            FigureCanvasAgg(self.fig)
+        self.canvas = self.fig.canvas
+
+        self.lines = []
+        self._segments = []
+        for i, label in enumerate(labels):
+            style = dict(
+                color=colors[i] if colors and i < len(colors) else f"C{i}",
+                linestyle=linestyles[i] if linestyles and i < len(linestyles) else "-",
+                linewidth=2,
+            )
+            (line,) = self.ax.plot([], [], label=label, **style)
+            # Animated artists are skipped by full draws and only ever blitted
+            (segment,) = self.ax.plot([], [], label="_nolegend_", animated=True, **style)
+            self.lines.append(line)
+            self._segments.append(segment)
+
+        self._x = [np.empty(64) for _ in self.lines]
+        self._y = [np.empty(64) for _ in self.lines]
+        self._size = [0] * len(self.lines)
+        self._drawn = [0] * len(self.lines)
+        self._limits = None
+        self._data_bounds = None
+        self._background = None
+        self._last_refresh = 0.0
+        self._last_snapshot = 0.0
+
+        self.ax.set_xlabel(x_label, fontsize=12)
+        self.ax.set_ylabel(y_label, fontsize=12)
+        self.ax.set_title(title, fontsize=14, weight="bold")
+        if grid:
+            self.ax.grid(visible=True, linestyle="--", linewidth=0.5, alpha=0.7)
+        self.ax.legend(loc=legend_loc, fontsize=10)
+
+        if not self.headless:
+            _pyplot().show(block=False)
+
+    def append(self, x: float, *values: Optional[float]) -> bool:
+        """
+        Appends one point per series at `x`; a None value skips that series.
+
+        Returns:
+            bool: True if the plot was refreshed by this call.
+        """
+        if len(values) != len(self.lines):
+            raise ValueError(f"Expected {len(self.lines)} values, got {len(values)}.")
+        for i, value in enumerate(values):
+            if value is None:
+                continue
+            size = self._size[i]
+            if size == len(self._x[i]):
+                # Double the buffers so that appends stay amortized O(1)
+                self._x[i] = np.concatenate([self._x[i], np.empty(size)])
+                self._y[i] = np.concatenate([self._y[i], np.empty(size)])
+            self._x[i][size] = x
+            self._y[i][size] = value
+            self._size[i] = size + 1
+        return self.refresh(force=False)
+
+    def data(self, series: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns read-only views of the x and y history of a series.
+        """
+        x = self._x[series][:self._size[series]]
+        y = self._y[series][:self._size[series]]
+        x.flags.writeable = y.flags.writeable = False
+        return x, y
+
+    def _bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        pending = [
+            (self._x[i][self._drawn[i]:size], self._y[i][self._drawn[i]:size])
+            for i, size in enumerate(self._size)
+            if size > self._drawn[i]
+        ]
+        xs = np.concatenate([x for x, _ in pending]) if pending else np.empty(0)
+        ys = np.concatenate([y for _, y in pending]) if pending else np.empty(0)
+        finite = np.isfinite(xs) & np.isfinite(ys)
+        if not finite.any():
+            return None
+        xs, ys = xs[finite], ys[finite]
+        return float(xs.min()), float(xs.max()), float(ys.min()), float(ys.max())
+
+    def _fits(self, bounds) -> bool:
+        if self._limits is None:
+            return False
+        x0, x1, y0, y1 = self._limits
+        fits = x0 <= bounds[0] and bounds[1] <= x1 and y0 <= bounds[2] and bounds[3] <= y1
+        if fits:
+            d0, d1, e0, e1 = self._data_bounds
+            self._data_bounds = (min(d0, bounds[0]), max(d1, bounds[1]), min(e0, bounds[2]), max(e1, bounds[3]))
+        return fits
+
+    def _grow_limits(self, bounds) -> None:
+        if self._data_bounds is not None:
+            x0, x1, y0, y1 = self._data_bounds
+            bounds = (min(x0, bounds[0]), max(x1, bounds[1]), min(y0, bounds[2]), max(y1, bounds[3]))
+        self._data_bounds = x0, x1, y0, y1 = bounds
+        x_pad = (x1 - x0) * self.headroom or 1.0
+        y_pad = (y1 - y0) * self.headroom / 2 or 1.0
+        # The x-axis only grows forward, as histories are appended in order
+        self._limits = (x0, x1 + x_pad, y0 - y_pad, y1 + y_pad)
+        self.ax.set_xlim(self._limits[0], self._limits[1])
+        self.ax.set_ylim(self._limits[2], self._limits[3])
+
+    def _sync_lines(self) -> None:
+        # Persistent lines are only updated before full draws, so that blits do not mark
+        # the figure as stale and trigger a redraw in interactive mode
+        for i, line in enumerate(self.lines):
+            line.set_data(*self.data(i))
+
+    def _redraw(self) -> None:
+        # Full draw: every line with its whole history, then cache the pixels
+        self._sync_lines()
+        self._drawn = list(self._size)
+        self.canvas.draw()
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.redraws += 1
+
+    def _blit(self) -> None:
+        # Incremental draw: only the points added since the last refresh
+        self.canvas.restore_region(self._background)
+        for i, segment in enumerate(self._segments):
+            # Start from the last drawn point so that the new segment joins the line
+            start, size = max(self._drawn[i] - 1, 0), self._size[i]
+            if size > self._drawn[i]:
+                x, y = self.data(i)
+                segment.set_data(x[start:], y[start:])
+                self.ax.draw_artist(segment)
+                self._drawn[i] = size
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.canvas.blit(self.fig.bbox)
+
+    def refresh(self, force: bool = True) -> bool:
+        """
+        Draws the points appended since the last refresh.
+
+        Args:
+            force (bool): Ignore the `max_fps` throttle. Default is True.
+
+        Returns:
+            bool: True if anything was drawn.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_refresh < self.min_interval:
+            return False
+        if all(size == drawn for size, drawn in zip(self._size, self._drawn)):
+            return False
+
+        bounds = self._bounds()
+        if self._background is None or (bounds is not None and not self._fits(bounds)):
+            if bounds is not None:
+                self._grow_limits(bounds)
+            self._redraw()
+        else:
+            self._blit()
+        if not self.headless:
+            self.canvas.flush_events()
+
+        self._last_refresh = now
+        self.refreshes += 1
+        if self.snapshot_path and now - self._last_snapshot >= self.snapshot_interval:
+            self.snapshot()
+            self._last_snapshot = now
+        return True
+
+    def snapshot(self, path: Optional[str] = None) -> str:
+        """
+        Writes the current canvas pixels to a PNG file without re-rendering the figure.
+
+        The file is replaced atomically, so readers never see a partial image.
+
+        Args:
+            path (Optional[str]): Destination file. Defaults to `snapshot_path`.
+
+        Returns:
+            str: The path of the written file.
+        """
+        from matplotlib.image import imsave
+
+        path = path or self.snapshot_path
+        if not path:
+            raise ValueError("No snapshot path given.")
+        if self._background is None:
+            self._redraw()
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        imsave(temp_path, np.asarray(self.canvas.buffer_rgba()), format="png", dpi=self.fig.dpi)
+        os.replace(temp_path, path)
+        return path
+
+    def save(self, save_path: str, dpi: int = 300, image_format: Optional[str] = None) -> None:
+        """
+        Renders the full history to a file at publication quality.
+        """
+        self.refresh()
+        self._sync_lines()
+        self.fig.savefig(save_path, dpi=dpi, format=image_format)
+
+    def close(self) -> None:
+        """
+        Draws any pending points, writes a final snapshot and releases the figure.
+        """
+        self.refresh()
+        if self.snapshot_path and self._background is not None:
+            self.snapshot()
+        if not self.headless:
+            _pyplot().close(self.fig)
+
+    def __enter__(self) -> "LivePlot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
 
+# Functions that can be called by name from `render_batch`
+_BATCH_FUNCTIONS = ("plot_scientific", "plot_histogram", "plot_boxplot_scientific")
+
+
+def _init_batch_worker() -> None:
+    """
+    Prepares a rendering process once: selects Agg, imports the plotting libraries and
+    draws a throwaway figure so that fonts and caches are loaded before the first spec.
+    """
+    set_headless(True)
+    _pyplot()
+    _seaborn()
+    fig, ax = _new_figure((1, 1), True)
+    ax.plot([0, 1], [0, 1], label="warm-up")
+    ax.legend()
+    fig.savefig(io.BytesIO(), format="png")
+
+
+def _render_spec(index: int, function_name: str, kwargs: dict) -> dict:
+    """
+    Renders one batch spec in a worker process and reports its timing or failure.
+    """
+    start_time = time.perf_counter()
+    cached = False
+    try:
+        # Plot functions return None only when the image came from the render cache
+        cached = globals()[function_name](**kwargs, headless=True) is None
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+    return {
+        "index": index,
+        "function": function_name,
+        "save_path": kwargs.get("save_path"),
+        "seconds": time.perf_counter() - start_time,
+        "cached": cached,
+        "error": error,
+    }
+
+
+def render_batch(
+    specs: List[Tuple[str, dict]],
+    output_dir: Optional[str] = None,
+    image_format: str = "png",
+    max_workers: Optional[int] = None,
+    cache: Optional[RenderCache] = None,
+) -> List[dict]:
+    """
+    Renders many plots in parallel on a pool of headless worker processes.
+
+    Each worker selects the Agg backend and warms up matplotlib once, then renders the
+    specs it receives straight to disk. Failures are reported per plot and do not stop
+    the batch.
+
+    Args:
+        specs (List[Tuple[str, dict]]): Pairs of plot function name ("plot_scientific",
+            "plot_histogram" or "plot_boxplot_scientific") and keyword arguments. Arguments
+            must be picklable.
+        output_dir (Optional[str]): Directory for specs without a `save_path`. Files are
+            named "<index>_<function>.<image_format>". Default is None.
+        image_format (str): Image format of specs without a `save_path`, and of specs whose
+            `save_path` has no extension, unless they set their own. Default is "png".
+        max_workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+        cache (Optional[RenderCache]): Render cache shared by the workers, for specs that do
+            not set their own. Defaults to the cache selected with `set_render_cache`.
+
+    Returns:
+        List[dict]: One report per spec, in input order, with the keys "index", "function",
+        "save_path", "seconds" (render time in the worker), "cached" (whether the image
+        came from the render cache) and "error" (traceback or None).
+    """
+    jobs = []
+    for index, (function_name, kwargs) in enumerate(specs):
+        if function_name not in _BATCH_FUNCTIONS:
+            raise ValueError(f"Unknown plot function: {function_name}")
+        kwargs = dict(kwargs)
+        kwargs.pop("headless", None)
+        kwargs.setdefault("cache", cache if cache is not None else _RENDER_CACHE)
+        if not kwargs.get("save_path"):
+            if output_dir is None:
+                raise ValueError(f"Spec {index} has no save_path and no output_dir was given.")
+            kwargs["save_path"] = os.path.join(output_dir, f"{index:05d}_{function_name}.{image_format}")
+        # The plot functions default to PNG, whatever the extension of the file
+        extension = os.path.splitext(kwargs["save_path"])[1][1:].lower()
+        kwargs.setdefault("image_format", extension or image_format)
+        jobs.append((index, function_name, kwargs))
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    reports: List[Optional[dict]] = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker) as executor:
+        futures = {executor.submit(_render_spec, *job): job for job in jobs}
+        for future in as_completed(futures):
+            index, function_name, kwargs = futures[future]
+            try:
+                reports[index] = future.result()
+            except Exception:
+                # The spec could not reach the worker, e.g. unpicklable arguments
+                reports[index] = {
+                    "index": index,
+                    "function": function_name,
+                    "save_path": kwargs["save_path"],
+                    "seconds": 0.0,
+                    "cached": False,
+                    "error": traceback.format_exc(),
+                }
+    return reports
+
+
 # Example code
 if __name__ == "__main__":
     # Example: Plotting three datasets with markers, line styles, and log scale
@@ -0,0 +1,145 @@
+
+# ---------------------------------------------------------------------------- #
+#                                   Test Unit                                  #
+# ---------------------------------------------------------------------------- #
+
+"""
+SMTP connection pool check for src.utils.email_api, against a local aiosmtpd server.
+
+Starts an in-process SMTP server without TLS and checks that consecutive send_email
+calls reuse one pooled connection, that idle connections are probed with NOOP before
+reuse, and that the pool reconnects after the server drops its connections, both when
+the NOOP probe catches it and when the drop is only noticed by the send itself.
+
+Requires aiosmtpd (pip install aiosmtpd).
+
+Usage (from the repository root):
+    python tests/check_email_api.py
+"""
+
+import argparse
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiosmtpd.controller import Controller  # noqa: E402
+from aiosmtpd.smtp import AuthResult  # noqa: E402
+
+from src.utils.email_api import SMTPConnectionPool, close_smtp_pools, send_email  # noqa: E402
+
+CREDENTIALS = ("sender@example.com", "secret")
+RECIPIENTS = ["first@example.com", "second@example.com"]
+
+
+class RecordingHandler:
+    """
+    aiosmtpd handler that counts sessions, NOOPs and messages, and can drop every session.
+    """
+
+    def __init__(self):
+        self.sessions = []
+        self.noops = 0
+        self.messages = []
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        session.host_name = hostname
+        self.sessions.append(server)
+        return responses
+
+    async def handle_NOOP(self, server, session, envelope, arg):
+        self.noops += 1
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        return "250 Message accepted for delivery"
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def drop_connections(controller: Controller, handler: RecordingHandler) -> None:
+    """
+    Closes every open session on the server side, as an idle timeout would.
+    """
+    for server in handler.sessions:
+        if server.transport is not None:
+            controller.loop.call_soon_threadsafe(server.transport.close)
+    time.sleep(0.2)
+
+
+def check(name: str, condition: bool, detail: str = "") -> bool:
+    print(f"[{'OK  ' if condition else 'FAIL'}] {name:<55} {detail}")
+    return condition
+
+
+def check_email_api() -> bool:
+    """
+    Runs every pool check against a fresh local server and prints a report.
+
+    Returns:
+    - bool: True if every check passed.
+    """
+    handler = RecordingHandler()
+    port = free_port()
+    controller = Controller(
+        handler,
+        hostname="127.0.0.1",
+        port=port,
+        auth_require_tls=False,
+        authenticator=lambda server, session, envelope, mechanism, data: AuthResult(success=True),
+    )
+    controller.start()
+    passed = True
+    try:
+        # Consecutive sends through the shared pool reuse one session
+        for index in range(3):
+            send_email(f"Message {index}", "Body", RECIPIENTS, CREDENTIALS,
+                       smtp_server="127.0.0.1", smtp_port=port, use_tls=False)
+        passed &= check("send_email delivers every message", len(handler.messages) == 3,
+                        f"{len(handler.messages)} delivered")
+        passed &= check("send_email reuses the pooled connection", len(handler.sessions) == 1,
+                        f"{len(handler.sessions)} sessions")
+
+        # A drop the pool does not probe for is caught by the send, which reconnects once
+        drop_connections(controller, handler)
+        send_email("After drop", "Body", RECIPIENTS, CREDENTIALS,
+                   smtp_server="127.0.0.1", smtp_port=port, use_tls=False)
+        passed &= check("send_email reconnects after a server drop", len(handler.messages) == 4,
+                        f"{len(handler.messages)} delivered, {len(handler.sessions)} sessions")
+        close_smtp_pools()
+
+        # With a zero interval every reuse is probed with NOOP first
+        sessions = len(handler.sessions)
+        with SMTPConnectionPool("127.0.0.1", port, *CREDENTIALS, use_tls=False, health_check_interval=0) as pool:
+            pool.sendmail(CREDENTIALS[0], RECIPIENTS, "Subject: Probe\n\nBody")
+            noops = handler.noops
+            pool.sendmail(CREDENTIALS[0], RECIPIENTS, "Subject: Probe\n\nBody")
+            passed &= check("idle connections are health-checked with NOOP", handler.noops == noops + 1,
+                            f"{handler.noops - noops} NOOP")
+            passed &= check("a healthy connection is reused", len(handler.sessions) == sessions + 1,
+                            f"{len(handler.sessions) - sessions} sessions")
+
+            # The probe notices the drop, so the send goes out on a new session
+            drop_connections(controller, handler)
+            delivered = len(handler.messages)
+            pool.sendmail(CREDENTIALS[0], RECIPIENTS, "Subject: Probe\n\nBody")
+            passed &= check("a failed NOOP opens a new connection",
+                            len(handler.messages) == delivered + 1 and len(handler.sessions) == sessions + 2,
+                            f"{len(handler.sessions) - sessions} sessions")
+    finally:
+        close_smtp_pools()
+        controller.stop()
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.parse_args()
+    sys.exit(0 if check_email_api() else 1)
@@ -0,0 +1,93 @@
+
+# ---------------------------------------------------------------------------- #
+#                                   Test Unit                                  #
+# ---------------------------------------------------------------------------- #
+
+"""
+GPU inventory check for src.utils.gpu_info, against fake /proc and /sys trees.
+
+Builds kernel interface trees for a CPU-only server whose only display device is the
+onboard VGA of its BMC, and for the same server with an AMD GPU added, then checks
+that get_gpu_inventory lists exactly the GPUs.
+
+Usage (from the repository root):
+    python tests/check_gpu_info.py
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import gpu_info  # noqa: E402
+
+
+def write(path: str, content: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        file.write(content + "\n")
+
+
+def add_drm_card(sys_root: str, index: int, vendor: str, driver: str, slot: str, vram: Optional[int] = None) -> None:
+    """
+    Adds a DRM card, with one display connector, backed by a PCI device.
+    """
+    device = os.path.join(sys_root, "class", "drm", f"card{index}", "device")
+    write(os.path.join(device, "vendor"), vendor)
+    write(os.path.join(device, "device"), "0x2000")
+    write(os.path.join(device, "uevent"), f"DRIVER={driver}\nPCI_SLOT_NAME={slot}")
+    if vram is not None:
+        write(os.path.join(device, "mem_info_vram_total"), str(vram))
+    os.makedirs(os.path.join(sys_root, "class", "drm", f"card{index}-VGA-1"), exist_ok=True)
+
+
+def check(name: str, condition: bool, detail: str = "") -> bool:
+    print(f"[{'OK  ' if condition else 'FAIL'}] {name:<55} {detail}")
+    return condition
+
+
+def check_gpu_info() -> bool:
+    """
+    Probes the fake trees and prints a report.
+
+    Returns:
+    - bool: True if every check passed.
+    """
+    passed = True
+    roots = (gpu_info.PROC_ROOT, gpu_info.SYS_ROOT, gpu_info.INVENTORY_CACHE_DIR)
+    with tempfile.TemporaryDirectory() as directory:
+        proc_root, sys_root = os.path.join(directory, "proc"), os.path.join(directory, "sys")
+        gpu_info.PROC_ROOT, gpu_info.SYS_ROOT = proc_root, sys_root
+        gpu_info.INVENTORY_CACHE_DIR = os.path.join(directory, "cache")
+        try:
+            write(os.path.join(proc_root, "sys", "kernel", "random", "boot_id"), "check-gpu-info")
+
+            # ASPEED BMC graphics, the usual onboard VGA of servers
+            add_drm_card(sys_root, 0, "0x1a03", "ast", "0000:02:00.0")
+            inventory = gpu_info.get_gpu_inventory(refresh=True, use_nvidia_smi=False)
+            passed &= check("VGA-only host has no GPUs", not inventory.devices, f"{len(inventory.devices)} devices")
+
+            add_drm_card(sys_root, 1, "0x1002", "amdgpu", "0000:41:00.0", vram=16 * 1024 ** 3)
+            inventory = gpu_info.get_gpu_inventory(refresh=True, use_nvidia_smi=False)
+            vendors = [device.vendor for device in inventory.devices]
+            passed &= check("GPUs are listed next to a VGA device", vendors == ["amd"], str(vendors))
+            passed &= check(
+                "GPU memory is read from sysfs",
+                bool(inventory.devices) and inventory.devices[0].memory_total_mb == 16 * 1024,
+            )
+            # A new process starts without the in-process inventory and reads the disk cache
+            gpu_info._INVENTORY = None
+            passed &= check("the inventory cache is read back", gpu_info.get_gpu_inventory() == inventory)
+        finally:
+            gpu_info.PROC_ROOT, gpu_info.SYS_ROOT, gpu_info.INVENTORY_CACHE_DIR = roots
+            gpu_info._INVENTORY = None
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.parse_args()
+    sys.exit(0 if check_gpu_info() else 1)
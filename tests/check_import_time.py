@@ -0,0 +1,88 @@
+
+# ---------------------------------------------------------------------------- #
+#                                   Test Unit                                  #
+# ---------------------------------------------------------------------------- #
+
+"""
+Import-time regression check for src.utils.
+
+Each statement is timed in a fresh interpreter, and the check fails if it is slower
+than its budget or if it pulls in one of the heavy libraries that must only be
+imported when a function actually needs them.
+
+Usage (from the repository root):
+    python tests/check_import_time.py [--repeat N] [--scale FACTOR]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["tensorflow", "matplotlib", "seaborn"]
+
+# Statement -> time budget in seconds on a typical workstation
+BUDGETS = {
+    "import src.utils": 0.05,
+    "from src.utils import send_email": 0.5,
+    "from src.utils import plot_scientific": 0.5,
+    "from src.utils import get_gpu_info": 0.1,
+}
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def time_import(statement: str, repeat: int) -> tuple[float, list[str]]:
+    """
+    Runs an import statement in fresh interpreters and returns the median time in
+    seconds together with the heavy modules it loaded.
+    """
+    timings = []
+    heavy = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        timings.append(float(output[0]))
+        heavy = output[1].split(",") if len(output) > 1 else []
+    return statistics.median(timings), heavy
+
+
+def check_import_time(repeat: int = 5, scale: float = 1.0) -> bool:
+    """
+    Times every statement in BUDGETS and prints a report.
+
+    Returns:
+    - bool: True if every statement is within budget and imports no heavy module.
+    """
+    passed = True
+    for statement, budget in BUDGETS.items():
+        elapsed, heavy = time_import(statement, repeat)
+        ok = elapsed <= budget * scale and not heavy
+        passed &= ok
+        status = "OK  " if ok else "FAIL"
+        extra = f"  (loaded {', '.join(heavy)})" if heavy else ""
+        print(f"[{status}] {statement:<45} {elapsed * 1000:8.1f} ms / {budget * scale * 1000:.0f} ms{extra}")
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Interpreter launches per statement.")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier applied to every budget.")
+    args = parser.parse_args()
+    sys.exit(0 if check_import_time(args.repeat, args.scale) else 1)
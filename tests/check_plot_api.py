@@ -0,0 +1,169 @@
+
+# ---------------------------------------------------------------------------- #
+#                                   Test Unit                                  #
+# ---------------------------------------------------------------------------- #
+
+"""
+Correctness check for src.utils.plot_api.
+
+Computes plot statistics and renders small plots headless, and checks properties that the
+benchmark does not cover: streamed boxplot outliers, render cache keys, DataFrame labels
+and the encoding of the files written by render_batch.
+
+Usage (from the repository root):
+    python tests/check_plot_api.py
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from src.utils import plot_api  # noqa: E402
+from src.utils.metrics_store import MetricsStore  # noqa: E402
+
+# Leading bytes of every format written by the checks
+MAGIC_BYTES = {"png": b"\x89PNG", "pdf": b"%PDF", "svg": b"<?xml"}
+
+
+def check(name: str, condition: bool, detail: str = "") -> bool:
+    print(f"[{'OK  ' if condition else 'FAIL'}] {name:<55} {detail}")
+    return condition
+
+
+def check_render_batch_formats(directory: str) -> bool:
+    """
+    Checks that every file written by render_batch is encoded as its extension says.
+    """
+    passed = True
+    specs = [
+        ("plot_scientific", {"x": [0, 1, 2], "y_datasets": [[0, 1, 4]]}),
+        ("plot_histogram", {"datasets": [[0, 1, 1, 2]]}),
+        ("plot_boxplot_scientific", {"dataset": [[0, 1, 2, 3]]}),
+    ]
+    for image_format in MAGIC_BYTES:
+        output_dir = os.path.join(directory, image_format)
+        explicit = [("plot_scientific", dict(specs[0][1], save_path=os.path.join(output_dir, f"own.{image_format}")))]
+        reports = plot_api.render_batch(specs + explicit, output_dir, image_format, max_workers=1, cache=False)
+        for report in reports:
+            with open(report["save_path"], "rb") as file:
+                head = file.read(5)
+            extension = os.path.splitext(report["save_path"])[1][1:]
+            passed &= check(
+                f"render_batch {os.path.basename(report['save_path'])}",
+                report["error"] is None and head.startswith(MAGIC_BYTES[extension]),
+                repr(head),
+            )
+    return passed
+
+
+def check_boxplot_fliers() -> bool:
+    """
+    Checks that streamed boxplot outliers are capped and never drawn twice.
+    """
+    passed = True
+    dataset = np.random.default_rng(0).standard_cauchy((100_000, 2))
+    for max_fliers in (10, 100_000):
+        for column, stat in enumerate(plot_api.boxplot_stats_streaming(dataset, max_fliers=max_fliers)):
+            fliers = stat["fliers"]
+            passed &= check(
+                f"boxplot_stats_streaming fliers column={column} cap={max_fliers}",
+                len(fliers) <= max_fliers
+                and len(np.unique(fliers)) == len(fliers)
+                and dataset[:, column].min() in fliers
+                and dataset[:, column].max() in fliers,
+                f"{len(fliers)} fliers",
+            )
+    return passed
+
+
+def check_render_cache_keys(directory: str) -> bool:
+    """
+    Checks that render cache keys follow the content of arrays, including strided
+    memory-mapped views, and that arguments without a content hash skip the cache.
+    """
+    passed = True
+    cache = plot_api.RenderCache(os.path.join(directory, "cache"))
+    path = os.path.join(directory, "values.bin")
+    values = np.memmap(path, dtype=float, mode="w+", shape=(1000, 3))
+    values[:] = np.random.default_rng(0).normal(size=values.shape)
+    values.flush()
+
+    key = cache.key("plot_boxplot_scientific", {"dataset": values.T})
+    passed &= check("render cache key is stable", key == cache.key("plot_boxplot_scientific", {"dataset": values.T}))
+    values[500, 1] += 1.0
+    values.flush()
+    passed &= check("render cache key follows memmap contents",
+                    key != cache.key("plot_boxplot_scientific", {"dataset": values.T}))
+    passed &= check("render cache key follows lists of columns",
+                    cache.key("plot_histogram", {"datasets": [values[:, 0], values[:, 1]]})
+                    != cache.key("plot_histogram", {"datasets": [values[:, 0], values[:, 2]]}))
+    passed &= check("unhashable arguments skip the render cache",
+                    cache.key("plot_histogram", {"datasets": [values[:, 0]], "bins": object()}) is None)
+    del values
+    return passed
+
+
+def check_series_cache(directory: str) -> bool:
+    """
+    Checks that metrics store series are cached by their values, not by their handle.
+    """
+    cache = plot_api.RenderCache(os.path.join(directory, "series-cache"))
+    images = []
+    for seed in (0, 1):
+        # A store recreated with a series of the same name and length but other values
+        with MetricsStore(os.path.join(directory, f"metrics-{seed}")) as store:
+            store.append("loss", np.random.default_rng(seed).normal(size=1000))
+            images.append(plot_api.plot_histogram([store["loss"]], return_bytes=True, headless=True, cache=cache))
+    return check("render cache misses on changed series values",
+                 cache.hits == 0 and images[0] != images[1], f"{cache.hits} hits")
+
+
+def check_dataframe_boxplot(directory: str) -> bool:
+    """
+    Checks that DataFrames reach seaborn as they are, so that boxes keep their column
+    labels, and that the render cache tells DataFrames apart by those labels.
+    """
+    import pandas as pd
+
+    passed = True
+    frame = pd.DataFrame(np.random.default_rng(0).normal(size=(100, 3)), columns=["alpha", "beta", "gamma"])
+    _, ax = plot_api.plot_boxplot_scientific(frame, headless=True, cache=False)
+    labels = [label.get_text() for label in ax.get_xticklabels()]
+    passed &= check("DataFrame boxplot keeps its column labels", labels == list(frame.columns), str(labels))
+
+    cache = plot_api.RenderCache(os.path.join(directory, "frame-cache"))
+    for columns in (["alpha", "beta", "gamma"], ["a", "b", "c"]):
+        plot_api.plot_boxplot_scientific(frame.set_axis(columns, axis=1), return_bytes=True, headless=True, cache=cache)
+    passed &= check("render cache misses on renamed columns", cache.hits == 0, f"{cache.hits} hits")
+
+    values = [float(value) for value in range(1000)]
+    passed &= check("plain lists are passed through", plot_api._resolve_series(values, datasets=True) is values)
+    return passed
+
+
+def check_plot_api() -> bool:
+    """
+    Runs every check in a temporary directory and prints a report.
+
+    Returns:
+    - bool: True if every check passed.
+    """
+    plot_api.set_headless(True)
+    passed = check_boxplot_fliers()
+    with tempfile.TemporaryDirectory() as directory:
+        passed &= check_render_cache_keys(directory)
+        passed &= check_series_cache(directory)
+        passed &= check_dataframe_boxplot(directory)
+        passed &= check_render_batch_formats(directory)
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.parse_args()
+    sys.exit(0 if check_plot_api() else 1)
@@ -0,0 +1,212 @@
+
+# ---------------------------------------------------------------------------- #
+#                                   Test Unit                                  #
+# ---------------------------------------------------------------------------- #
+
+"""
+Rendering benchmark for src.utils.plot_api.
+
+Times plot_scientific, plot_histogram and plot_boxplot_scientific across input sizes,
+dataset counts, DPI values and output formats. Every case is rendered headless to a
+file; the report gives the median wall time, the peak memory traced during one extra
+render and the size of the written file. Results are written as JSON and compared
+against a stored baseline; the check fails if a case got slower, used more memory or
+wrote a larger file than the baseline allows.
+
+Usage (from the repository root):
+    python tests/check_plot_performance.py [--quick] [--output results.json]
+        [--baseline baseline.json] [--update-baseline]
+        [--functions ...] [--sizes ...] [--datasets ...] [--dpi ...] [--formats ...]
+"""
+
+import argparse
+import datetime
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import numpy as np  # noqa: E402
+
+from src.utils import plot_api  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "tests", "plot_performance_baseline.json")
+
+FUNCTIONS = ["plot_scientific", "plot_histogram", "plot_boxplot_scientific"]
+SIZES = [1_000, 100_000, 1_000_000]
+QUICK_SIZES = [1_000, 20_000]
+DATASETS = [1, 4]
+DPIS = [100, 300]
+FORMATS = ["png", "svg", "pdf"]
+
+# Allowed growth over the baseline before a case counts as a regression
+TOLERANCES = {"seconds": 0.25, "peak_mb": 0.25, "file_bytes": 0.10}
+
+
+def make_kwargs(function: str, points: int, datasets: int, seed: int = 0) -> dict:
+    """
+    Builds reproducible plot arguments with `datasets` series of `points` values each.
+    """
+    rng = np.random.default_rng(seed)
+    if function == "plot_scientific":
+        walks = np.cumsum(rng.normal(size=(datasets, points)), axis=1)
+        return {"x": np.arange(points, dtype=float), "y_datasets": walks, "title": "Benchmark"}
+    if function == "plot_histogram":
+        return {"datasets": rng.normal(size=(datasets, points)), "bins": 50, "title": "Benchmark"}
+    if function == "plot_boxplot_scientific":
+        return {"dataset": rng.normal(size=(points, datasets)), "title": "Benchmark"}
+    raise ValueError(f"Unknown plot function: {function}")
+
+
+def case_name(function: str, points: int, datasets: int, dpi: int, image_format: str) -> str:
+    return f"{function}/points={points}/datasets={datasets}/dpi={dpi}/{image_format}"
+
+
+def run_case(function: str, kwargs: dict, dpi: int, image_format: str, repeat: int, directory: str) -> dict:
+    """
+    Renders one case `repeat` times for timing, then once more under tracemalloc.
+    """
+    render = getattr(plot_api, function)
+    save_path = os.path.join(directory, f"{function}.{image_format}")
+    options = dict(save_path=save_path, dpi=dpi, image_format=image_format, headless=True, cache=False)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render(**kwargs, **options)
+        timings.append(time.perf_counter() - start)
+
+    # Memory is measured separately, as tracing slows allocation-heavy code down
+    tracemalloc.start()
+    render(**kwargs, **options)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "seconds": statistics.median(timings),
+        "seconds_min": min(timings),
+        "peak_mb": peak / 1024 ** 2,
+        "file_bytes": os.path.getsize(save_path),
+    }
+
+
+def environment() -> dict:
+    """
+    Describes the machine and library versions the results were measured with.
+    """
+    import matplotlib
+    import seaborn
+
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "seaborn": seaborn.__version__,
+    }
+
+
+def run_benchmark(functions, sizes, datasets, dpis, formats, repeat: int = 3) -> dict:
+    """
+    Runs every combination of the given parameters and prints one line per case.
+
+    Returns:
+    - dict: {"environment": {...}, "results": {case name: measurements}}.
+    """
+    plot_api.set_headless(True)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        # Warm-up renders, so that imports and font loading are not timed
+        for image_format in formats:
+            plot_api.plot_scientific([0, 1], [[0, 1]], save_path=os.path.join(directory, "warmup"),
+                                     image_format=image_format, headless=True, cache=False)
+        for function, points, count in itertools.product(functions, sizes, datasets):
+            kwargs = make_kwargs(function, points, count)
+            for dpi, image_format in itertools.product(dpis, formats):
+                name = case_name(function, points, count, dpi, image_format)
+                result = run_case(function, kwargs, dpi, image_format, repeat, directory)
+                results[name] = dict(
+                    function=function, points=points, datasets=count, dpi=dpi, format=image_format, **result
+                )
+                print(f"[RUN ] {name:<62} {result['seconds'] * 1000:9.1f} ms "
+                      f"{result['peak_mb']:8.1f} MB {result['file_bytes'] / 1024:9.1f} KB")
+    return {"environment": environment(), "results": results}
+
+
+def compare(results: dict, baseline: dict, scale: float = 1.0) -> bool:
+    """
+    Compares results with a baseline and prints every regression and improvement.
+
+    Cases missing from either side are counted but do not fail the check.
+
+    Returns:
+    - bool: True if no case exceeds its baseline by more than the tolerances.
+    """
+    passed = True
+    current, reference = results["results"], baseline["results"]
+    for name in sorted(set(current) - set(reference)):
+        print(f"[NEW ] {name}")
+    for name in sorted(set(current) & set(reference)):
+        changes = []
+        ok = True
+        for metric, tolerance in TOLERANCES.items():
+            before, after = reference[name][metric], current[name][metric]
+            ratio = after / before if before else 1.0
+            if ratio > 1 + tolerance * scale:
+                ok = False
+            if abs(ratio - 1) > tolerance * scale:
+                changes.append(f"{metric} x{ratio:.2f}")
+        passed &= ok
+        status = "OK  " if ok else "FAIL"
+        print(f"[{status}] {name:<62} {', '.join(changes) or 'unchanged'}")
+    unmeasured = len(set(reference) - set(current))
+    if unmeasured:
+        print(f"[INFO] {unmeasured} baseline cases were not measured in this run.")
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help=f"Only use the sizes {QUICK_SIZES}.")
+    parser.add_argument("--functions", nargs="+", default=FUNCTIONS, choices=FUNCTIONS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=None, help="Points per dataset.")
+    parser.add_argument("--datasets", nargs="+", type=int, default=DATASETS, help="Datasets per plot.")
+    parser.add_argument("--dpi", nargs="+", type=int, default=DPIS)
+    parser.add_argument("--formats", nargs="+", default=FORMATS, choices=FORMATS)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed renders per case.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file to compare with.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier applied to every tolerance.")
+    args = parser.parse_args()
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else SIZES)
+    results = run_benchmark(args.functions, sizes, args.datasets, args.dpi, args.formats, args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"[INFO] Results written to {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"[INFO] Baseline written to {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"[INFO] No baseline at {args.baseline}; run with --update-baseline to create one.")
+        sys.exit(0)
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    sys.exit(0 if compare(results, baseline, args.scale) else 1)
@@ -2,36 +2,32 @@
 #                                   Test Unit                                  #
 # ---------------------------------------------------------------------------- #
 
-import tensorflow as tf
-
-
-def get_gpu_info():
-    """
-    Retrieves and prints detailed GPU information including TensorFlow,
-    CUDA, cuDNN versions, number of GPUs, and memory details.
-    """
-    # Display TensorFlow version
-    print(f"TensorFlow Version: {tf.__version__}")
-
-    # Check if TensorFlow is built with CUDA support and retrieve build info
-    if tf.test.is_built_with_cuda():
-        build_info = tf.sysconfig.get_build_info()
-        print(f"TensorFlow is built with CUDA support")
-        print(f"CUDA Version: {build_info['cuda_version']}")
-        print(f"cuDNN Version: {build_info['cudnn_version']}")
-    else:
-        print("Running on CPU (No CUDA support detected)")
-
-    # Detect available GPUs
-    gpus = tf.config.list_physical_devices("GPU")
-    if gpus:
-        print(f"\nNumber of GPUs detected: {len(gpus)}")
-        print(f"Available GPU(s): {[gpu.name for gpu in gpus]}\n")
-        tf.test.gpu_device_name()
-    else:
-        print("No GPUs found")
-        print("Running on CPU")
+"""
+Prints the TensorFlow, CUDA and cuDNN versions and the GPUs of this machine.
+
+The report comes from src.utils.gpu_info.get_environment_report and is cached per
+environment, so only the first run in an environment imports TensorFlow.
+
+Usage (from the repository root):
+    python tests/check_tf_cuda_cudnn_versions.py [--json] [--refresh]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.gpu_info import get_environment_report, get_gpu_info  # noqa: E402
 
 
 if __name__ == "__main__":
-    get_gpu_info()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON.")
+    parser.add_argument("--refresh", action="store_true", help="Ignore the cached report.")
+    args = parser.parse_args()
+
+    if args.json:
+        print(get_environment_report(refresh=args.refresh).to_json())
+    else:
+        get_gpu_info(refresh=args.refresh)